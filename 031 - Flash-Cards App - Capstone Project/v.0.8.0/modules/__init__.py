@@ -4,11 +4,13 @@
 # Importing key classes and functions from each module
 from .gui import FlashcardApp
 from .statistics import save_statistics
-from .card_logic import weighted_choice
+from .card_logic import weighted_choice, WeightedSampler, CompositePool
 
 # Define the public interface of the package for cleaner imports
 __all__ = [
     "FlashcardApp",
     "save_statistics",
     "weighted_choice",
+    "WeightedSampler",
+    "CompositePool",
 ]
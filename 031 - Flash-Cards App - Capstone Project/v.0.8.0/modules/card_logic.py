@@ -1,5 +1,7 @@
 # modules/tests_logic.py
 import random as rd
+import threading
+from itertools import accumulate
 
 
 def weighted_choice(data):
@@ -7,7 +9,266 @@ def weighted_choice(data):
     if not data:
         print("Keine Daten verfügbar - bitte mindestens ein Wörterbuch auswählen")
         return None
-    
+
     # Weights are now pre-processed and validated during the loading stage.
     weights = [entry["Weight"] for entry in data]
     return rd.choices(data, weights=weights, k=1)[0]
+
+
+class WeightedSampler:
+    """
+    Gewichtete Auswahl in O(log n) über einen Fenwick-Baum (Binary Indexed Tree).
+
+    Jeder Eintrag belegt einen festen Platz im Baum, eine Positionstabelle
+    id(Eintrag) -> Platz findet ihn in O(1). Gewicht ändern, Batch anhängen
+    und Batch entfernen kosten O(log n) pro betroffenem Eintrag - die übrigen
+    Gewichte werden nie neu gelesen. Plätze entfernter Einträge werden
+    wiederverwendet. Nur ein neuer Pool baut den Baum komplett neu auf.
+
+    Der Hintergrund-Loader und die GUI teilen sich einen Sampler, daher sind
+    alle Zugriffe über ein Lock geschützt.
+    """
+
+    def __init__(self, data=None, weight_key="Weight"):
+        self.weight_key = weight_key
+        self._data = []       # Einträge in Ladereihenfolge (Index, Iteration)
+        self._slots = []      # Platz -> Eintrag, None für freie Plätze
+        self._weights = []    # Platz -> Gewicht im Baum
+        self._tree = [0]      # Fenwick-Baum über _weights, 1-basiert
+        self._positions = {}  # id(Eintrag) -> Platz; der Platz hält den Eintrag am Leben
+        self._free = []       # Freie Plätze
+        self._indexed = 0     # Wie viele Einträge von _data im Baum stehen
+        self._dirty = True
+        self._lock = threading.RLock()
+        if data is not None:
+            self.set_pool(data)
+
+    def set_pool(self, data):
+        """Setzt einen neuen Pool; der Baum wird beim nächsten Ziehen aufgebaut."""
+        with self._lock:
+            self._data = data
+            self._dirty = True
+
+    def invalidate(self):
+        """Erzwingt einen Neuaufbau, z.B. nach Änderungen an bestehenden Gewichten."""
+        with self._lock:
+            self._dirty = True
+
+    def extend(self, entries):
+        """Hängt einen Batch an den Pool an, O(log n) pro neuem Eintrag."""
+        with self._lock:
+            self._data.extend(entries)
+            self._sync()
+
+    def remove_range(self, start, stop):
+        """Entfernt data[start:stop]; nur deren Plätze werden im Baum freigegeben, O(log n) pro Eintrag."""
+        with self._lock:
+            self._sync()
+            if start >= stop:
+                return
+            for entry in self._data[start:stop]:
+                self._release(entry)
+            del self._data[start:stop]
+            self._indexed = len(self._data)
+            if not self._data:
+                self._dirty = True  # Leerer Pool: Baum samt Rundungsresten verwerfen
+
+    def update_weight(self, entry, weight):
+        """
+        Setzt das Gewicht eines Eintrags in O(log n).
+        Gibt False zurück, wenn der Eintrag nicht im Pool ist.
+        """
+        with self._lock:
+            self._sync()
+            slot = self._positions.get(id(entry))
+            if slot is None:
+                return False
+            entry[self.weight_key] = weight
+            self._add(slot, weight - self._weights[slot])
+            self._weights[slot] = weight
+            return True
+
+    def total_weight(self):
+        """Summe aller Gewichte im Pool."""
+        with self._lock:
+            self._sync()
+            return self._prefix_sum(len(self._slots))
+
+    def draw(self, rng=rd):
+        """Zieht ein Element gemäß Gewichtung, oder None bei leerem Pool."""
+        with self._lock:
+            if not self._data:
+                print("Keine Daten verfügbar - bitte mindestens ein Wörterbuch auswählen")
+                return None
+
+            self._sync()
+            total = self._prefix_sum(len(self._slots))
+            if total <= 0:
+                return rng.choice(self._data)
+
+            entry = self._slots[self._find(rng.random() * total)]
+            return entry if entry is not None else rng.choice(self._data)
+
+    def __contains__(self, entry):
+        with self._lock:
+            self._sync()
+            return id(entry) in self._positions
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        return self._data[index]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def _sync(self):
+        """Bringt den Baum auf den Stand des Pools."""
+        size = len(self._data)
+        if self._dirty or size < self._indexed:
+            self._rebuild()
+        elif size > self._indexed:
+            # Pool was appended to - only place the new tail
+            for entry in self._data[self._indexed:]:
+                self._place(entry)
+            self._indexed = size
+
+    def _rebuild(self):
+        """Baut den Baum in O(n) aus den Gewichten auf: tree[i] = prefix[i] - prefix[i - lowbit(i)]."""
+        data = self._data
+        self._slots = list(data)
+        self._weights = [entry[self.weight_key] for entry in data]
+        prefix = [0, *accumulate(self._weights)]
+        self._tree = [0] + [prefix[i] - prefix[i & (i - 1)] for i in range(1, len(prefix))]
+        self._positions = dict(zip(map(id, data), range(len(data))))
+        self._free = []
+        self._indexed = len(data)
+        self._dirty = False
+
+    def _place(self, entry):
+        """Legt einen Eintrag auf einen freien oder neuen Platz."""
+        weight = entry[self.weight_key]
+        if self._free:
+            slot = self._free.pop()
+            self._slots[slot] = entry
+            self._weights[slot] = weight
+            self._add(slot, weight)
+        else:
+            slot = len(self._slots)
+            self._slots.append(entry)
+            self._weights.append(weight)
+            i = slot + 1  # Neuer Knoten deckt (i - lowbit(i), i] ab
+            self._tree.append(weight + self._prefix_sum(i - 1) - self._prefix_sum(i & (i - 1)))
+        self._positions[id(entry)] = slot
+
+    def _release(self, entry):
+        """Gibt den Platz eines Eintrags frei."""
+        slot = self._positions.pop(id(entry), None)
+        if slot is None:
+            return
+        self._add(slot, -self._weights[slot])
+        self._weights[slot] = 0
+        self._slots[slot] = None
+        self._free.append(slot)
+
+    def _add(self, slot, delta):
+        tree = self._tree
+        i = slot + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix_sum(self, count):
+        """Summe der Gewichte der ersten `count` Plätze."""
+        tree = self._tree
+        total = 0
+        while count > 0:
+            total += tree[count]
+            count &= count - 1
+        return total
+
+    def _find(self, target):
+        """Kleinster Platz, dessen Präfixsumme `target` übersteigt (Abstieg im Baum, O(log n))."""
+        tree = self._tree
+        size = len(tree) - 1
+        position = 0
+        step = 1 << size.bit_length()
+        while step:
+            candidate = position + step
+            if candidate <= size and tree[candidate] <= target:
+                position = candidate
+                target -= tree[candidate]
+            step >>= 1
+        return min(position, size - 1)
+
+
+class CompositePool:
+    """
+    Lesesicht über mehrere Sampler (ein Sampler pro Wörterbuch), ohne die
+    Einträge in eine gemeinsame Liste zu kopieren.
+
+    Unterstützt len(), Indexzugriff, Iteration und gewichtetes Ziehen. Gezogen
+    wird in zwei Stufen: erst ein Wörterbuch nach seinem Gesamtgewicht, dann
+    ein Eintrag über dessen Sampler - das entspricht der gewichteten Auswahl
+    über alle Einträge. Der Aufbau kostet O(Anzahl Wörterbücher).
+    """
+
+    def __init__(self, samplers=(), weight_key="Weight"):
+        self._samplers = list(samplers)
+        self._extra = WeightedSampler([], weight_key)  # z.B. API-Daten
+
+    @classmethod
+    def from_entries(cls, entries, weight_key="Weight"):
+        """Verpackt eine einfache Liste (Legacy-Lader, Startdaten) als Pool."""
+        if isinstance(entries, cls):
+            return entries
+        return cls([WeightedSampler(list(entries), weight_key)], weight_key)
+
+    def _parts(self):
+        return self._samplers + [self._extra]
+
+    def extend(self, entries):
+        """Fügt zusätzliche Einträge hinzu, ohne die Wörterbuch-Speicher zu verändern."""
+        self._extra.extend(entries)
+
+    def update_weight(self, entry, weight):
+        """
+        Ändert das Gewicht eines Eintrags in dem Sampler, der ihn enthält. Der
+        Sampler wird über seine Positionstabelle gefunden (O(1) je Wörterbuch),
+        die Änderung selbst kostet O(log n).
+        """
+        for part in self._parts():
+            if entry in part:
+                return part.update_weight(entry, weight)
+        return False
+
+    def sample(self, rng=rd):
+        """Zieht einen Eintrag gemäß Gewichtung, oder None bei leerem Pool."""
+        parts = [part for part in self._parts() if len(part)]
+        if not parts:
+            print("Keine Daten verfügbar - bitte mindestens ein Wörterbuch auswählen")
+            return None
+
+        weights = [part.total_weight() for part in parts]
+        if sum(weights) <= 0:
+            weights = [len(part) for part in parts]
+        return rng.choices(parts, weights=weights, k=1)[0].draw(rng)
+
+    def __len__(self):
+        return sum(len(part) for part in self._parts())
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if index >= 0:
+            for part in self._parts():
+                size = len(part)
+                if index < size:
+                    return part[index]
+                index -= size
+        raise IndexError("CompositePool index out of range")
+
+    def __iter__(self):
+        for part in self._parts():
+            yield from part
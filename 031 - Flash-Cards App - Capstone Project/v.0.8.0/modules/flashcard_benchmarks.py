@@ -0,0 +1,792 @@
+"""
+Performance benchmarks for the Flashcard Application.
+Each benchmark works on synthetic data in a temporary directory, so the
+results do not depend on which dictionaries are present in data/.
+
+Usage:
+    python -m modules.flashcard_benchmarks --list
+    python -m modules.flashcard_benchmarks batch_latency --rows 150000
+"""
+
+import argparse
+import io
+import os
+import random
+import statistics
+import tempfile
+import time
+from .flashcard_config import DictionaryConfig, ProgressiveLoadingConfig
+
+BENCHMARKS = {}
+
+
+def benchmark(func):
+    """Register a benchmark under its function name without the 'bench_' prefix."""
+    BENCHMARKS[func.__name__.replace("bench_", "", 1)] = func
+    return func
+
+
+def _write_synthetic_dictionary(path, rows, seed=42):
+    """Write a tab-separated dictionary file with the standard column layout."""
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyzäöüß"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Weight\tWord_1\tPart_1\tWord_2\tPart_2\n")
+        for i in range(rows):
+            word = "".join(rng.choice(alphabet) for _ in range(rng.randint(3, 14)))
+            meaning = " ".join(
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(2, 9)))
+                for _ in range(rng.randint(1, 12))
+            )
+            f.write(f"100\t{word}{i}\tnoun\t{meaning}\tсущ.\n")
+
+
+def _synthetic_config(path):
+    """Build a DictionaryConfig whose only dictionary is the synthetic file."""
+    class SyntheticDictionaryConfig(DictionaryConfig):
+        HYPHENATION_CACHE_FILE = None  # In memory - never touch data/hyphenation_cache.json
+        DICTIONARIES = {
+            "synthetic": {
+                "file": path,
+                "source": "english",
+                "delimiter": "\t",
+                "front_title": "English",
+                "back_title": DictionaryConfig.TRANSLATION,
+            }
+        }
+    return SyntheticDictionaryConfig()
+
+
+def _time_call(func, repeats):
+    """Return the median wall time of `repeats` calls in milliseconds."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+@benchmark
+def bench_batch_latency(rows=150000, repeats=5):
+    """Batch load latency by start position: legacy skiprows vs. byte-offset row index."""
+    import pandas as pd
+    from .flashcard_dictionary_io import CSV_KWARGS
+    from .flashcard_progressive_loader import ProgressiveDictionaryManager
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.csv")
+        _write_synthetic_dictionary(path, rows)
+        manager = ProgressiveDictionaryManager(dict_config=_synthetic_config(path))
+        batch = ProgressiveLoadingConfig.BATCH_SIZE
+
+        build_ms = _time_call(lambda: manager._get_row_index("synthetic", path), 1)
+        print(f"Row index build: {build_ms:.1f} ms for {rows} rows")
+        print(f"{'start':>10} {'skiprows ms':>12} {'indexed ms':>12}")
+
+        for fraction in (0.0, 0.25, 0.5, 0.75, 1.0):
+            start = int((rows - batch) * fraction)
+
+            def legacy():
+                pd.read_csv(path, skiprows=range(1, start + 1), nrows=batch, sep="\t", **CSV_KWARGS)
+
+            def indexed():
+                raw = manager._get_row_index("synthetic", path).read_rows(start, batch)
+                pd.read_csv(io.BytesIO(raw), sep="\t", **CSV_KWARGS)
+
+            print(f"{start:>10} {_time_call(legacy, repeats):>12.1f} {_time_call(indexed, repeats):>12.1f}")
+
+
+@benchmark
+def bench_first_batch(rows=150000, repeats=5):
+    """Initial batch load: CSV parsing vs. memory-mapped compiled cache."""
+    from .flashcard_binary_cache import cache_path_for, write_binary_dictionary
+    from .flashcard_progressive_loader import ProgressiveDictionaryManager
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.csv")
+        _write_synthetic_dictionary(path, rows)
+        dict_config = _synthetic_config(path)
+        dict_config.BINARY_CACHE_DIR = os.path.join(tmp, "cache")
+        batch = ProgressiveLoadingConfig.BATCH_SIZE
+
+        class CsvOnly(ProgressiveLoadingConfig):
+            USE_BINARY_CACHE = False
+
+        csv_manager = ProgressiveDictionaryManager(dict_config=dict_config, loading_config=CsvOnly())
+        df = csv_manager._prepare_dataframe(csv_manager._read_dataframe("synthetic", path),
+                                            dict_config.DICTIONARIES["synthetic"])
+        write_binary_dictionary(df, cache_path_for("synthetic", dict_config), path,
+                                dict_config.WEIGHT_COLUMN, skip_columns=(dict_config.SOURCE_COLUMN,))
+
+        def first_batch(loading_config):
+            manager = ProgressiveDictionaryManager(dict_config=dict_config, loading_config=loading_config)
+            start = rows // 2
+            manager._load_batch_range("synthetic", path, start, start + batch)
+            manager.cleanup()
+
+        csv_ms = _time_call(lambda: first_batch(CsvOnly()), repeats)
+        binary_ms = _time_call(lambda: first_batch(ProgressiveLoadingConfig()), repeats)
+        print(f"First batch of {batch} from {rows} rows: CSV {csv_ms:.1f} ms, compiled cache {binary_ms:.1f} ms")
+
+
+def _legacy_dynamic_weight(row):
+    """Per-row reference implementation the vectorized engine must reproduce."""
+    definition = str(row.get('Word_2', ''))
+    char_count = len(definition)
+    word_count = len(definition.split())
+    has_paragraphs = any(i in definition for i in [';', '1)', '2)', '3)', '4)', '5)', '§', 'GG§', 'StGB'])
+    has_legal_terms = any(t in definition for t in ['StGB', 'GG§', 'Recht', 'Gesetz', 'Verfassung', 'Staat', 'Demokratie'])
+
+    weight = 100
+    if char_count > 200: weight += 50
+    if char_count > 400: weight += 100
+    if char_count > 600: weight += 150
+    if has_paragraphs: weight += 100
+    if has_legal_terms: weight += 50
+    if word_count > 20: weight += 25
+    if word_count > 40: weight += 50
+    return int(weight)
+
+
+def _synthetic_definitions(rows, seed=42):
+    """Mix of short translations and long legal-style definitions."""
+    rng = random.Random(seed)
+    fragments = ["Recht", "StGB", "GG§ 20", "1) Staat", "2) Volk;", "der", "die", "Verfassung",
+                 "Gesetz", "und", "oder", "Demokratie", "Schuld", "Vorsatz", "слово", "перевод"]
+    return [" ".join(rng.choice(fragments) for _ in range(rng.choice((1, 2, 3, 8, 30, 60, 120))))
+            for _ in range(rows)]
+
+
+@benchmark
+def bench_dynamic_weights(rows=None, repeats=3):
+    """Dynamic weight computation: per-row apply(axis=1) vs. vectorized engine."""
+    import pandas as pd
+    from .flashcard_weighting import compute_dynamic_weights
+
+    sizes = [rows] if rows else [10_000, 150_000, 1_000_000]
+    print(f"{'rows':>10} {'apply ms':>12} {'vectorized ms':>14} {'speedup':>8}")
+    for size in sizes:
+        df = pd.DataFrame({"Word_1": "x", "Word_2": _synthetic_definitions(size)})
+
+        legacy = df.apply(_legacy_dynamic_weight, axis=1)
+        vectorized = compute_dynamic_weights(df["Word_2"])
+        assert legacy.tolist() == vectorized.tolist(), "vectorized weights differ from reference"
+
+        legacy_ms = _time_call(lambda: df.apply(_legacy_dynamic_weight, axis=1), 1 if size > 200_000 else repeats)
+        vectorized_ms = _time_call(lambda: compute_dynamic_weights(df["Word_2"]), repeats)
+        print(f"{size:>10} {legacy_ms:>12.1f} {vectorized_ms:>14.1f} {legacy_ms / vectorized_ms:>7.1f}x")
+
+
+@benchmark
+def bench_sampler(rows=None, draws=20000):
+    """Draws per second: weighted_choice (O(n) per draw) vs. WeightedSampler (O(log n))."""
+    from .card_logic import WeightedSampler, weighted_choice
+
+    sizes = [rows] if rows else [1_000, 10_000, 150_000]
+    print(f"{'entries':>10} {'weighted_choice/s':>18} {'WeightedSampler/s':>18}")
+    for size in sizes:
+        rng = random.Random(7)
+        pool = [{"Weight": rng.choice((100, 150, 250, 625))} for _ in range(size)]
+        sampler = WeightedSampler(pool)
+        sampler.draw()  # Build the tree outside the timed loop
+
+        legacy_draws = max(50, draws * 1_000 // size)
+        start = time.perf_counter()
+        for _ in range(legacy_draws):
+            weighted_choice(pool)
+        legacy_rate = legacy_draws / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(draws):
+            sampler.draw()
+        sampler_rate = draws / (time.perf_counter() - start)
+        print(f"{size:>10} {legacy_rate:>18,.0f} {sampler_rate:>18,.0f}")
+
+
+@benchmark
+def bench_pool_toggle(rows=150000, repeats=20):
+    """Cost of a dictionary toggle: concatenating the loaded lists vs. building a CompositePool view."""
+    from .card_logic import CompositePool, WeightedSampler
+
+    rng = random.Random(7)
+    per_dict = rows // 4
+    stores = [[{"Weight": rng.choice((100, 150, 250, 625))} for _ in range(per_dict)] for _ in range(4)]
+    samplers = [WeightedSampler(store) for store in stores]
+    for sampler in samplers:
+        sampler.draw()  # Trees are maintained by the loader, not per toggle
+
+    def concatenate():
+        combined = []
+        for store in stores:
+            combined.extend(store)
+        return WeightedSampler(combined).draw()
+
+    def view():
+        return CompositePool(samplers).sample()
+
+    print(f"{'entries':>10} {'concatenate (ms)':>18} {'view (ms)':>12}")
+    print(f"{per_dict * 4:>10} {_time_call(concatenate, repeats):>18.2f} "
+          f"{_time_call(view, repeats):>12.3f}")
+
+
+@benchmark
+def bench_card_memory(rows=150000):
+    """Memory per card: to_dict records (+ display keys) vs. __slots__ CardRecord (tracemalloc)."""
+    import gc
+    import tracemalloc
+    import pandas as pd
+    from .flashcard_card_store import records_from_dataframe
+    from .flashcard_dictionary_io import CSV_KWARGS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.csv")
+        _write_synthetic_dictionary(path, rows)
+        df = pd.read_csv(path, sep="\t", **CSV_KWARGS)
+        df["source"] = "english"
+        # Share the cell strings between both variants so only container overhead is measured
+        columns = {column: df[column].tolist() for column in df.columns}
+
+        def as_dicts():
+            entries = [dict(zip(columns, values)) for values in zip(*columns.values())]
+            for card in entries:  # What _standardize_card_keys added per displayed card
+                card["Front_Word"], card["Front_Part"] = card["Word_1"], card["Part_1"]
+                card["Back_Word"], card["Back_Part"] = card["Word_2"], card["Part_2"]
+            return entries
+
+        def as_records():
+            return records_from_dataframe(df)
+
+        print(f"{'storage':<12} {'bytes/card':>12} {'total MiB':>10}")
+        for label, build in (("dict", as_dicts), ("CardRecord", as_records)):
+            gc.collect()
+            tracemalloc.start()
+            cards = build()
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{label:<12} {current / len(cards):>12.0f} {current / 2 ** 20:>10.1f}")
+            del cards
+
+
+
+def _longest_stall(work_on_main_thread, work_in_background, tick=0.001):
+    """
+    Emulate the Tk event loop with a 1 ms ticker and return the longest gap between
+    ticks in milliseconds while the activation runs inline or on a worker thread.
+    """
+    import threading
+
+    worker = None
+    if work_in_background is not None:
+        worker = threading.Thread(target=work_in_background, daemon=True)
+
+    longest = 0.0
+    last = time.perf_counter()
+    if worker is not None:
+        worker.start()
+    else:
+        work_on_main_thread()
+    while True:
+        now = time.perf_counter()
+        longest = max(longest, now - last)
+        last = now
+        if worker is None or not worker.is_alive():
+            break
+        time.sleep(tick)
+    return longest * 1000
+
+
+@benchmark
+def bench_activation_stall(rows=150000, repeats=3):
+    """Longest main-thread stall on a cold dictionary toggle: inline activation vs. background worker."""
+    from .flashcard_progressive_loader import ProgressiveDictionaryManager
+
+    class ColdStart(ProgressiveLoadingConfig):
+        USE_BINARY_CACHE = False
+        BACKGROUND_LOADING = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.csv")
+        _write_synthetic_dictionary(path, rows)
+
+        def fresh_manager():
+            # No metadata cache and no row index yet - the worst case for a first activation
+            for leftover in (path + ColdStart.ROW_INDEX_SUFFIX, os.path.join(tmp, "metadata.json")):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+            dict_config = _synthetic_config(path)
+            dict_config.METADATA_CACHE_FILE = os.path.join(tmp, "metadata.json")
+            return ProgressiveDictionaryManager(dict_config=dict_config, loading_config=ColdStart())
+
+        def show_first_card(manager):
+            pool = manager.get_available_entries(["synthetic"])
+            return pool.sample() if pool else None
+
+        def inline():
+            manager = fresh_manager()
+
+            def toggle():  # What the checkbox callback used to do
+                manager.update_active_dictionaries(["synthetic"])
+                show_first_card(manager)
+            stall = _longest_stall(toggle, None)
+            manager.cleanup()
+            return stall
+
+        def background():
+            manager = fresh_manager()
+            show_first_card(manager)  # Whatever is already in memory, shown immediately
+            stall = _longest_stall(None, lambda: manager.activate_async(["synthetic"]).wait())
+            manager.cleanup()
+            return stall
+
+        inline_ms = statistics.median(inline() for _ in range(repeats))
+        background_ms = statistics.median(background() for _ in range(repeats))
+        print(f"Longest main-thread stall activating {rows} rows: "
+              f"inline {inline_ms:.1f} ms, background {background_ms:.1f} ms")
+
+
+def _percentile(samples, q):
+    """Nearest-rank percentile of a list of numbers."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _tk_root(required=True):
+    """Create a hidden Tk root, or return None when there is no display (printing why if `required`)."""
+    import tkinter as tk
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        if required:
+            print(f"Needs a display (try: xvfb-run python -m modules.flashcard_benchmarks ...): {e}")
+        return None
+    root.withdraw()
+    return root
+
+
+@benchmark
+def bench_card_paint(rows=200):
+    """Click-to-paint latency p50/p99: layout on click vs. prefetched layout (needs a display)."""
+    import tkinter as tk
+    from .flashcard_card_display import CardDisplay
+    from .flashcard_card_store import CardRecord
+    from .flashcard_config import UIConfig
+    from .flashcard_text_renderer import TextRenderer
+
+    root = _tk_root()
+    if root is None:
+        return
+    try:
+        canvas = tk.Canvas(root, width=UIConfig.CANVAS_WIDTH, height=UIConfig.CANVAS_HEIGHT)
+        canvas.pack()
+        display = CardDisplay(canvas, TextRenderer())
+        cards = [CardRecord(word_1=word, part_1="noun", word_2=meaning, part_2="n.", weight=100, source="custom")
+                 for word, meaning in zip(_synthetic_definitions(rows, seed=1), _synthetic_definitions(rows, seed=2))]
+
+        def click_to_paint(prefetched):
+            samples = []
+            layouts = [display.prepare(card) for card in cards] if prefetched else [None] * len(cards)
+            for card, layout in zip(cards, layouts):
+                start = time.perf_counter()
+                display.show_front(card, layout or display.prepare(card))
+                root.update_idletasks()
+                samples.append((time.perf_counter() - start) * 1000)
+            return samples
+
+        print(f"{'mode':<12} {'p50 ms':>8} {'p99 ms':>8}")
+        for label, prefetched in (("on click", False), ("prefetched", True)):
+            samples = click_to_paint(prefetched)
+            print(f"{label:<12} {_percentile(samples, 0.5):>8.2f} {_percentile(samples, 0.99):>8.2f}")
+    finally:
+        root.destroy()
+
+
+class _CountingFont:
+    """Wraps a font and counts measure() calls."""
+
+    def __init__(self, font_obj):
+        self.font = font_obj
+        self.calls = 0
+
+    def measure(self, text):
+        self.calls += 1
+        return self.font.measure(text)
+
+
+class _StandInFont:
+    """Deterministic font metrics for machines without a display: 6-16 px per glyph, -1 px per 'AV'-like pair."""
+
+    def measure(self, text):
+        width = sum(6 + (ord(char) * 7) % 11 for char in text)
+        return width - sum(1 for a, b in zip(text, text[1:]) if a.isupper() and b.islower())
+
+
+@benchmark
+def bench_wrap_measure(rows=300):
+    """measure() calls and time per wrapped card: font.measure per test line vs. glyph-width table."""
+    from .flashcard_config import TextRenderConfig, UIConfig
+    from .flashcard_text_renderer import TextRenderer
+
+    root = _tk_root(required=False)
+    if root is not None:
+        from tkinter import font
+        base_font = font.Font(root, family=UIConfig.FONT_FAMILY, size=24, weight=UIConfig.FONT_WEIGHT_BOLD)
+        backend = "Tk"
+    else:
+        base_font = _StandInFont()
+        backend = "stand-in metrics"
+
+    try:
+        texts = _synthetic_definitions(rows)
+        width = UIConfig.TEXT_FRAME_BACK[2]
+        font_key = (UIConfig.FONT_FAMILY, 24, UIConfig.FONT_WEIGHT_BOLD)
+        results = {}
+        for label, use_table in (("font.measure", False), ("glyph table", True)):
+            class Config(TextRenderConfig):
+                USE_GLYPH_WIDTH_TABLE = use_table
+                WRAP_CACHE_SIZE = 0  # Measure the wrapping itself, not the layout cache
+
+            renderer = TextRenderer()
+            renderer.text_config = Config
+            counting = _CountingFont(base_font)
+            start = time.perf_counter()
+            results[label] = [renderer.wrap_text_cached(text, width, counting, font_key) for text in texts]
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"{label:<13} {counting.calls / rows:>8.1f} measure calls/card {elapsed_ms / rows:>8.3f} ms/card")
+
+        mismatches = sum(a != b for a, b in zip(results["font.measure"], results["glyph table"]))
+        print(f"Backend: {backend}; cards wrapped differently: {mismatches} of {rows}")
+    finally:
+        if root is not None:
+            root.destroy()
+
+
+@benchmark
+def bench_font_leak(rows=100000):
+    """Tcl named-font count while laying out `rows` cards with a shared FontPool (needs a display)."""
+    from tkinter import font
+    from .flashcard_text_renderer import TextRenderer
+    from .flashcard_config import UIConfig
+
+    root = _tk_root()
+    if root is None:
+        return
+    try:
+        renderer = TextRenderer()
+        texts = _synthetic_definitions(200)
+        frame = UIConfig.TEXT_FRAME_BACK
+        before = len(font.names(root))
+        print(f"{'cards':>10} {'Tcl fonts':>10} {'pool size':>10}")
+        for i in range(rows):
+            renderer.layout_text(texts[i % len(texts)], frame, (10 + i % 31, 0, 0))
+            if (i + 1) % (rows // 5 or 1) == 0:
+                print(f"{i + 1:>10} {len(font.names(root)) - before:>10} {renderer.font_pool.size:>10}")
+    finally:
+        root.destroy()
+
+
+@benchmark
+def bench_flip_latency(rows=500):
+    """Flip latency p50/p99: delete("all") + re-create vs. persistent canvas items (run under xvfb-run)."""
+    import tkinter as tk
+    from .flashcard_card_display import CardDisplay
+    from .flashcard_card_store import CardRecord
+    from .flashcard_config import UIConfig
+    from .flashcard_text_renderer import TextRenderer
+
+    root = _tk_root()
+    if root is None:
+        return
+    try:
+        renderer = TextRenderer()
+        cards = [CardRecord(word_1=word, part_1="noun", word_2=meaning, part_2="n.", weight=100, source="custom")
+                 for word, meaning in zip(_synthetic_definitions(rows, seed=1), _synthetic_definitions(rows, seed=2))]
+
+        def recreate(display, card, layout, side):
+            # What show_front/show_back did before: wipe the canvas and create every item again
+            side_layout = layout.front if side == "front" else layout.back
+            image = display.card_front_img if side == "front" else display.card_back_img
+            canvas = display.canvas
+            canvas.delete("all")
+            canvas.create_image(UIConfig.CARD_CENTER_X, UIConfig.CARD_CENTER_Y, image=image)
+            canvas.create_text(UIConfig.CARD_CENTER_X, UIConfig.TITLE_Y, text=side_layout.title,
+                               font=(UIConfig.FONT_FAMILY, UIConfig.TITLE_FONT_SIZE))
+            canvas.create_text(UIConfig.CARD_CENTER_X, UIConfig.SUBTITLE_Y, text=side_layout.subtitle,
+                               font=(UIConfig.FONT_FAMILY, UIConfig.PROPERTY_FONT_SIZE))
+            renderer.draw_layout(canvas, side_layout.text, side_layout.frame)
+
+        def persistent(display, card, layout, side):
+            (display.show_front if side == "front" else display.show_back)(card, layout)
+
+        print(f"{'mode':<12} {'p50 ms':>8} {'p99 ms':>8}")
+        for label, flip in (("re-create", recreate), ("persistent", persistent)):
+            canvas = tk.Canvas(root, width=UIConfig.CANVAS_WIDTH, height=UIConfig.CANVAS_HEIGHT)
+            canvas.pack()
+            display = CardDisplay(canvas, renderer)
+            layouts = [display.prepare(card) for card in cards]  # Layout is not part of the flip
+            samples = []
+            for card, layout in zip(cards, layouts):
+                for side in ("front", "back"):
+                    start = time.perf_counter()
+                    flip(display, card, layout, side)
+                    root.update_idletasks()
+                    samples.append((time.perf_counter() - start) * 1000)
+            canvas.destroy()
+            print(f"{label:<12} {_percentile(samples, 0.5):>8.2f} {_percentile(samples, 0.99):>8.2f}")
+    finally:
+        root.destroy()
+
+
+@benchmark
+def bench_stats_append(rows=5000, repeats=20):
+    """save_statistics with `rows` sessions of history: pandas read-concat-rewrite vs. append-only writer."""
+    import pandas as pd
+    from .statistics import FIELDNAMES, append_row
+
+    row = ["18.10.2026", "10:08:45", "N/A", 5, 7, "0.5823"]
+
+    def rewrite(path):
+        existing_df = pd.read_csv(path)
+        combined_df = pd.concat([existing_df, pd.DataFrame([row], columns=FIELDNAMES)], ignore_index=True)
+        combined_df.to_csv(path, index=False)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'writer':<12} {'ms/save':>8}")
+        for label, save in (("rewrite", rewrite), ("append", lambda path: append_row(row, path))):
+            path = os.path.join(tmp, f"{label}.csv")
+            pd.DataFrame([row] * rows, columns=FIELDNAMES).to_csv(path, index=False)
+            print(f"{label:<12} {_time_call(lambda: save(path), repeats):>8.2f}")
+
+
+
+@benchmark
+def bench_review_log(rows=2000):
+    """UI-thread cost per click: one SQLite commit per review vs. buffered ReviewLog."""
+    import sqlite3
+    from .flashcard_card_store import CardRecord, card_id
+    from .flashcard_review_log import INSERT, SCHEMA, ReviewLog
+
+    cards = [CardRecord(word_1=f"word{i}", word_2=f"meaning {i}", source="english", dict_type="oxford") for i in range(rows)]
+    with tempfile.TemporaryDirectory() as tmp:
+        connection = sqlite3.connect(os.path.join(tmp, "per_click.db"))
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+
+        def per_click(card):
+            with connection:
+                connection.execute(INSERT, (card_id(card), card.dict_type, 1, 850, int(time.time() * 1000)))
+
+        review_log = ReviewLog(os.path.join(tmp, "buffered.db"))
+        print(f"{'writer':<12} {'p50 us':>8} {'p99 us':>8}")
+        for label, record in (("per-click", per_click), ("buffered", lambda card: review_log.record(card, True, 0.85))):
+            samples = []
+            for card in cards:
+                start = time.perf_counter()
+                record(card)
+                samples.append((time.perf_counter() - start) * 1e6)
+            print(f"{label:<12} {_percentile(samples, 0.5):>8.1f} {_percentile(samples, 0.99):>8.1f}")
+        review_log.close()
+        connection.close()
+        print(f"buffered: {review_log.flushed_events} events in {review_log.flushes} transactions")
+
+
+
+@benchmark
+def bench_weight_update(rows=None, repeats=200):
+    """Sampler cost of one rescheduled card: full rebuild vs. Fenwick update via the position map."""
+    from .card_logic import CompositePool, WeightedSampler
+    from .flashcard_card_store import CardRecord
+
+    def rebuild(sampler, entry, weight):
+        entry["Weight"] = weight
+        sampler.invalidate()
+        sampler.total_weight()
+
+    def incremental(sampler, entry, weight):
+        CompositePool([sampler]).update_weight(entry, weight)  # As the GUI does it
+
+    sizes = [rows] if rows else [1_000, 10_000, 150_000]
+    print(f"{'entries':>10} {'rebuild (ms)':>14} {'incremental (ms)':>18}")
+    for size in sizes:
+        rng = random.Random(42)
+        pool = [CardRecord(word_1=f"word{i}", weight=rng.randint(50, 400)) for i in range(size)]
+        results = []
+        for update in (rebuild, incremental):
+            sampler = WeightedSampler(list(pool))
+            sampler.total_weight()
+            results.append(_time_call(lambda: update(sampler, rng.choice(pool), rng.randint(5, 1200)), repeats))
+        print(f"{size:>10} {results[0]:>14.3f} {results[1]:>18.4f}")
+
+
+@benchmark
+def bench_sampler_updates(rows=2000, steps=5000):
+    """Randomized extend/remove_range/update_weight on the Fenwick sampler, checked against a plain list."""
+    from .card_logic import CompositePool, WeightedSampler
+    from .flashcard_card_store import CardRecord
+
+    rng = random.Random(23)
+    created = 0
+
+    def new_entries(count):
+        nonlocal created
+        created += count
+        return [CardRecord(word_1=f"word{created - i}", weight=rng.randint(0, 400)) for i in range(count)]
+
+    reference = new_entries(rows)
+    sampler = WeightedSampler(list(reference))
+    pool = CompositePool([sampler])
+    removed = []
+
+    def check():
+        slots = sampler._slots
+        assert list(sampler) == reference, "pool order differs from reference"
+        assert sampler.total_weight() == sum(entry["Weight"] for entry in reference), "total weight drifted"
+        assert all(entry in sampler for entry in reference), "loaded entry missing from position map"
+        assert not any(entry in sampler for entry in removed[-50:]), "removed entry still in position map"
+        for slot, entry in enumerate(slots):
+            weight = sampler._prefix_sum(slot + 1) - sampler._prefix_sum(slot)
+            assert weight == (entry["Weight"] if entry is not None else 0), f"tree node of slot {slot} is stale"
+        total = sampler.total_weight()
+        for _ in range(20):
+            target = rng.random() * total
+            slot = sampler._find(target)
+            assert sampler._prefix_sum(slot) <= target < sampler._prefix_sum(slot + 1), "descent found wrong slot"
+
+    start = time.perf_counter()
+    counts = {"extend": 0, "remove_range": 0, "update_weight": 0}
+    for step in range(steps):
+        action = rng.random()
+        if action < 0.1:
+            batch = new_entries(rng.randint(1, 50))
+            sampler.extend(batch)
+            reference.extend(batch)
+            counts["extend"] += 1
+        elif action < 0.2 and reference:
+            begin = rng.randrange(len(reference))
+            end = min(len(reference), begin + rng.randint(1, 50))
+            removed.extend(reference[begin:end])
+            sampler.remove_range(begin, end)
+            del reference[begin:end]
+            counts["remove_range"] += 1
+        else:
+            entry = rng.choice(reference + removed[-10:]) if reference else None
+            if entry is not None:
+                expected = entry in reference
+                assert pool.update_weight(entry, rng.randint(0, 400)) == expected, "update of a removed entry"
+            counts["update_weight"] += 1
+        if step % 50 == 0:
+            check()
+    check()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(", ".join(f"{name}: {count}" for name, count in counts.items()))
+    print(f"OK: {len(reference)} entries, {len(sampler._slots)} slots, {steps} steps in {elapsed_ms:.0f} ms")
+
+
+
+@benchmark
+def bench_due_queue(rows=100000, repeats=200):
+    """Pick the next due card and reschedule it: scan all card states vs. DueQueue min-heap."""
+    from .flashcard_card_store import CardRecord, card_id
+    from .flashcard_review_queue import DueQueue
+
+    rng = random.Random(42)
+    now = 1_000_000_000
+    cards = [CardRecord(word_1=f"word{i}", word_2=f"meaning {i}", source="english") for i in range(rows)]
+    due = {card_id(card): (now + rng.randint(-86400, 30 * 86400), card) for card in cards}
+
+    def scan():
+        key, (_, card) = min(due.items(), key=lambda item: item[1][0])
+        due[key] = (now + rng.randint(600, 30 * 86400), card)
+
+    queue = DueQueue()
+    queue.load((card, when, key) for key, (when, card) in due.items())
+
+    def heap():
+        card = queue.pop_due(now + 30 * 86400)
+        queue.reschedule(card, now + rng.randint(600, 30 * 86400))
+
+    print(f"{'queue':<12} {'ms/card':>8}")
+    for label, step in (("scan", scan), ("heap", heap)):
+        print(f"{label:<12} {_time_call(step, repeats):>8.3f}")
+
+
+
+@benchmark
+def bench_sqlite_store(rows=150000, repeats=5):
+    """Import time, random batch latency (CSV row index vs. SQLite rowid range) and in-place weight updates."""
+    from .flashcard_progressive_loader import ProgressiveDictionaryManager
+    from .flashcard_sqlite_store import SQLiteDictionaryStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.csv")
+        _write_synthetic_dictionary(path, rows)
+        dict_config = _synthetic_config(path)
+        dict_config.SQLITE_DB_FILE = os.path.join(tmp, "dictionaries.db")
+        batch = ProgressiveLoadingConfig.BATCH_SIZE
+
+        store = SQLiteDictionaryStore(dict_config=dict_config)
+        import_ms = _time_call(lambda: store.import_dictionary("synthetic"), 1)
+        print(f"Import: {import_ms:.0f} ms for {rows} rows "
+              f"({ProgressiveLoadingConfig.SQLITE_IMPORT_CHUNK_SIZE} rows per executemany)")
+
+        class CsvOnly(ProgressiveLoadingConfig):
+            USE_BINARY_CACHE = False
+
+        class SQLiteBackend(ProgressiveLoadingConfig):
+            STORAGE_BACKEND = "sqlite"
+
+        rng = random.Random(42)
+        print(f"{'backend':<10} {'batch ms':>9}")
+        for label, loading_config in (("csv", CsvOnly()), ("sqlite", SQLiteBackend())):
+            manager = ProgressiveDictionaryManager(dict_config=dict_config, loading_config=loading_config)
+            manager._load_batch_range("synthetic", path, 0, batch)  # Build the row index / open the store
+
+            def random_batch():
+                start = rng.randrange(rows - batch)
+                manager._load_batch_range("synthetic", path, start, start + batch)
+
+            print(f"{label:<10} {_time_call(random_batch, repeats):>9.1f}")
+            manager.cleanup()
+
+        updates = [(rng.randrange(rows), rng.randint(50, 400)) for _ in range(batch)]
+        update_ms = _time_call(lambda: store.update_weights("synthetic", updates), repeats)
+        print(f"In-place update of {batch} weights: {update_ms:.1f} ms (CSV would need a full rewrite)")
+        store.close()
+
+        # Round trip: a weight handed to the loader comes back when its batch is loaded again
+        manager = ProgressiveDictionaryManager(dict_config=dict_config, loading_config=SQLiteBackend())
+        start = rng.randrange(rows - batch)
+        entries = manager._load_batch_range("synthetic", path, start, start + batch)
+        manager._store_batch("synthetic", start, start + batch, entries)
+        changed = {offset: float(rng.randint(1000, 5000)) for offset in rng.sample(range(len(entries)), 5)}
+        for offset, weight in changed.items():
+            assert manager.store_weight(entries[offset], weight), "weight was not queued"
+        manager.flush_stored_weights()
+        reloaded = manager._load_batch_range("synthetic", path, start, start + batch)
+        for offset, weight in changed.items():
+            assert reloaded[offset]["Weight"] == weight, f"row {start + offset}: stored weight did not round-trip"
+            assert reloaded[offset]["Word_1"] == entries[offset]["Word_1"], "weight written to the wrong row"
+        manager.cleanup()
+        print(f"Weight write-back round trip: {len(changed)} weights OK")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flashcard performance benchmarks")
+    parser.add_argument("name", nargs="?", help="Benchmark to run")
+    parser.add_argument("--list", action="store_true", help="List available benchmarks")
+    parser.add_argument("--rows", type=int, help="Synthetic dictionary size")
+    args = parser.parse_args()
+
+    if args.list or not args.name:
+        for name, func in BENCHMARKS.items():
+            print(f"{name:<20} {func.__doc__}")
+        return
+
+    kwargs = {"rows": args.rows} if args.rows else {}
+    BENCHMARKS[args.name](**kwargs)
+
+
+if __name__ == "__main__":
+    main()
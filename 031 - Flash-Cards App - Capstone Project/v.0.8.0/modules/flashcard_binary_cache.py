@@ -0,0 +1,243 @@
+"""
+Compiled binary dictionary cache for the Flashcard Application.
+Turns each tab-separated dictionary into a compact columnar file (offsets plus
+a UTF-8 string heap per text column, weights and render constants as typed
+arrays) that is memory-mapped at startup instead of re-parsed with pandas.
+
+Usage:
+    python -m modules.flashcard_binary_cache            # compile stale dictionaries
+    python -m modules.flashcard_binary_cache --force    # recompile everything
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import numpy as np
+import pandas as pd
+from .flashcard_config import DictionaryConfig, external_path
+from .flashcard_dictionary_io import prepare_dictionary_dataframe, read_dictionary_csv
+from .tracing import tracer
+
+MAGIC = b"FCBIN001"
+# magic, source size, source mtime (ns), row count, schema offset, schema length
+HEADER_FORMAT = "<8sQQQQQ"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+RENDER_CONSTANT_COLUMNS = ("Text_constants_front", "Text_constants_back")
+MISSING_CONSTANT = -1
+
+
+def cache_path_for(dict_type, dict_config=None):
+    """Location of the compiled cache file for a dictionary type."""
+    dict_config = dict_config or DictionaryConfig()
+    return external_path(os.path.join(dict_config.BINARY_CACHE_DIR, f"{dict_type}.fcb"))
+
+
+def _parse_render_constants(value):
+    """Parse '40,13,1' into three ints, or MISSING_CONSTANT if not parseable."""
+    try:
+        parts = [int(p) for p in str(value).split(',')]
+        if len(parts) == 3:
+            return parts
+    except (ValueError, TypeError):
+        pass
+    return [MISSING_CONSTANT] * 3
+
+
+class _SectionWriter:
+    """Writes 8-byte aligned sections and remembers where they start."""
+
+    def __init__(self, f):
+        self.f = f
+
+    def write(self, data):
+        padding = (-self.f.tell()) % 8
+        self.f.write(b"\0" * padding)
+        position = self.f.tell()
+        self.f.write(data)
+        return position
+
+
+def write_binary_dictionary(df, cache_path, source_path, weight_column, skip_columns=()):
+    """
+    Write a processed DataFrame to `cache_path` in the compiled format.
+    `source_path` is stat()ed so the cache can detect when it goes stale.
+    """
+    stat = os.stat(source_path)
+    row_count = len(df)
+    schema = {"columns": [], "weights": None, "constants": {}}
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"\0" * HEADER_SIZE)
+        writer = _SectionWriter(f)
+
+        for column in df.columns:
+            if column in skip_columns:
+                continue
+
+            if column == weight_column:
+                weights = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype="float64")
+                schema["weights"] = writer.write(weights.tobytes())
+                continue
+
+            if column in RENDER_CONSTANT_COLUMNS:
+                constants = np.array([_parse_render_constants(v) for v in df[column]], dtype="int16")
+                schema["constants"][column] = writer.write(constants.reshape(row_count, 3).tobytes())
+                continue
+
+            values = df[column].tolist()
+            nulls = np.array([pd.isna(v) for v in values], dtype="uint8")
+            encoded = [b"" if null else str(v).encode("utf-8") for v, null in zip(values, nulls)]
+            offsets = np.zeros(row_count + 1, dtype="uint64")
+            np.cumsum([len(e) for e in encoded], out=offsets[1:])
+            offsets_dtype = "uint32" if offsets[-1] < 2 ** 32 else "uint64"
+
+            schema["columns"].append({
+                "name": column,
+                "offsets_dtype": offsets_dtype,
+                "offsets": writer.write(offsets.astype(offsets_dtype).tobytes()),
+                "nulls": writer.write(nulls.tobytes()),
+                "heap": writer.write(b"".join(encoded)),
+                "heap_size": int(offsets[-1]),
+            })
+
+        schema_bytes = json.dumps(schema).encode("utf-8")
+        schema_offset = writer.write(schema_bytes)
+        f.seek(0)
+        f.write(struct.pack(HEADER_FORMAT, MAGIC, stat.st_size, stat.st_mtime_ns,
+                            row_count, schema_offset, len(schema_bytes)))
+
+    os.replace(tmp_path, cache_path)
+    tracer.ic({"binary_cache_written": {"file": cache_path, "rows": row_count}})
+
+
+class BinaryDictionary:
+    """Read-only, memory-mapped view over a compiled dictionary file."""
+
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self._file = open(cache_path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            (magic, self.source_size, self.source_mtime_ns, self.row_count,
+             schema_offset, schema_len) = struct.unpack_from(HEADER_FORMAT, self._mm)
+            if magic != MAGIC:
+                raise ValueError(f"Not a compiled dictionary: {cache_path}")
+            schema = json.loads(self._mm[schema_offset:schema_offset + schema_len])
+        except Exception:
+            self.close()
+            raise
+
+        n = self.row_count
+        self.columns = []
+        for column in schema["columns"]:
+            self.columns.append((
+                column["name"],
+                np.frombuffer(self._mm, dtype=column["offsets_dtype"], count=n + 1, offset=column["offsets"]),
+                np.frombuffer(self._mm, dtype="uint8", count=n, offset=column["nulls"]),
+                column["heap"],
+            ))
+        self.weights = None
+        if schema["weights"] is not None:
+            self.weights = np.frombuffer(self._mm, dtype="float64", count=n, offset=schema["weights"])
+        self.constants = {
+            name: np.frombuffer(self._mm, dtype="int16", count=n * 3, offset=position).reshape(n, 3)
+            for name, position in schema["constants"].items()
+        }
+
+    @classmethod
+    def open_if_fresh(cls, cache_path, source_path):
+        """Open the cache only if it exists and matches the source file's size and mtime."""
+        try:
+            stat = os.stat(source_path)
+            cache = cls(cache_path)
+        except (OSError, ValueError, struct.error):
+            return None
+        if not cache.is_fresh(stat):
+            tracer.ic({"binary_cache_stale": cache_path})
+            cache.close()
+            return None
+        return cache
+
+    def is_fresh(self, stat):
+        """Check the recorded source size and mtime against a stat() of the source file."""
+        return (stat.st_size, stat.st_mtime_ns) == (self.source_size, self.source_mtime_ns)
+
+    def read_columns(self, start, end, weight_column):
+        """
+        Decode rows [start, end) column by column.
+        Returns (column name -> list of values, row count) with the same values the CSV path produces.
+        """
+        start = max(0, min(start, self.row_count))
+        end = max(start, min(end, self.row_count))
+        mm = self._mm
+        nan = float("nan")
+        columns = {}
+
+        for name, offsets, nulls, heap in self.columns:
+            bounds = offsets[start:end + 1].tolist()
+            missing = nulls[start:end].tolist()
+            columns[name] = [
+                nan if missing[i] else mm[heap + bounds[i]:heap + bounds[i + 1]].decode("utf-8")
+                for i in range(end - start)
+            ]
+
+        if self.weights is not None:
+            columns[weight_column] = self.weights[start:end].tolist()
+
+        for name, constants in self.constants.items():
+            columns[name] = [f"{a},{b},{c}" if a != MISSING_CONSTANT else nan
+                             for a, b, c in constants[start:end].tolist()]
+
+        return columns, end - start
+
+    def close(self):
+        """Release the mapping; views handed out earlier must not be used afterwards."""
+        self.columns = []
+        self.weights = None
+        self.constants = {}
+        mm, self._mm = getattr(self, "_mm", None), None
+        if mm is not None:
+            try:
+                mm.close()
+            except BufferError:
+                pass  # numpy views still alive - the mapping is freed with them
+        self._file.close()
+
+
+def compile_dictionaries(dict_config=None, force=False):
+    """Compile every configured dictionary whose cache is missing or stale."""
+    dict_config = dict_config or DictionaryConfig()
+
+    for dict_type, dict_info in dict_config.DICTIONARIES.items():
+        source_path = external_path(dict_info["file"])
+        cache_path = cache_path_for(dict_type, dict_config)
+        if not os.path.isfile(source_path):
+            print(f"Skipping {dict_type}: {source_path} not found")
+            continue
+
+        if not force:
+            cache = BinaryDictionary.open_if_fresh(cache_path, source_path)
+            if cache is not None:
+                cache.close()
+                print(f"{dict_type}: cache is up to date")
+                continue
+
+        df = prepare_dictionary_dataframe(read_dictionary_csv(dict_info["file"], dict_info), dict_info, dict_config)
+        write_binary_dictionary(df, cache_path, source_path, dict_config.WEIGHT_COLUMN,
+                                skip_columns=(dict_config.SOURCE_COLUMN,))
+        print(f"{dict_type}: compiled {len(df)} rows -> {cache_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile dictionaries into memory-mappable caches")
+    parser.add_argument("--force", action="store_true", help="Recompile even if the cache is fresh")
+    args = parser.parse_args()
+    compile_dictionaries(force=args.force)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,8 +18,34 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+class SideLayout:
+    """Everything needed to draw one side of a card."""
+
+    __slots__ = ("title", "subtitle", "frame", "text")
+
+    def __init__(self, title, subtitle, frame, text):
+        self.title = title
+        self.subtitle = subtitle
+        self.frame = frame
+        self.text = text
+
+
+class CardLayout:
+    """Prepared front and back layouts of a card."""
+
+    __slots__ = ("front", "back")
+
+    def __init__(self, front, back):
+        self.front = front
+        self.back = back
+
+
 class CardDisplay:
-    """Handles flashcard rendering for front and back sides."""
+    """
+    Handles flashcard rendering for front and back sides.
+    Canvas items are created once and updated with itemconfig/coords on every
+    flip; text lines come from a pool of items that grows as needed.
+    """
 
     def __init__(self, canvas, text_renderer, ui_config=None, dict_config=None):
         self.canvas = canvas
@@ -30,6 +56,15 @@ class CardDisplay:
         self.card_front_img = tk.PhotoImage(file=resource_path(os.path.join("images", "card_front.png")))
         self.card_back_img = tk.PhotoImage(file=resource_path(os.path.join("images", "card_back.png")))
 
+        # Persistent canvas items, created on first draw
+        self._image_item = None
+        self._title_item = None
+        self._subtitle_item = None
+        self._message_item = None
+        self._line_items = []
+        self._visible_lines = 0
+        self._current_image = None
+
     def _parse_render_constants(self, constants_str):
         """Parses the render constants string into a tuple of integers."""
         try:
@@ -41,68 +76,117 @@ class CardDisplay:
         # Return a safe fallback tuple if parsing fails
         return (12, 60, 5) # font_size, chars_per_line, num_lines
 
-    def show_front(self, card_data):
+    def prepare(self, card_data):
         """
-        Display the front side of the flashcard.
+        Compute the layout of both sides of a card without drawing anything.
+        The result can be passed to show_front/show_back to skip all text layout work.
         """
-        self.canvas.delete("all")
-        self.canvas.create_image(self.ui_config.CARD_CENTER_X, self.ui_config.CARD_CENTER_Y, image=self.card_front_img)
+        return CardLayout(self._layout_side(card_data, "front"), self._layout_side(card_data, "back"))
 
+    def _layout_side(self, card_data, side):
+        """Title, subtitle and main text layout of one card side."""
         dict_type = card_data.get(self.dict_config.SOURCE_COLUMN, "custom")
         dict_info = self.dict_config.DICTIONARIES.get(dict_type, self.dict_config.DICTIONARIES["custom"])
-        title = dict_info.get("front_title", "Question")
 
-        self.canvas.create_text(
-            self.ui_config.CARD_CENTER_X, self.ui_config.TITLE_Y, text=title,
-            font=(self.ui_config.FONT_FAMILY, self.ui_config.TITLE_FONT_SIZE)
-        )
-
-        part_1 = card_data.get("Front_Part", "")
-        self.canvas.create_text(
-            self.ui_config.CARD_CENTER_X, self.ui_config.SUBTITLE_Y, text=part_1,
-            font=(self.ui_config.FONT_FAMILY, self.ui_config.PROPERTY_FONT_SIZE)
-        )
+        language = getattr(card_data, "language", None) or (None, None)  # API dicts carry no tag
+
+        if side == "front":
+            title = dict_info.get("front_title", "Question")
+            subtitle = card_data.get("Front_Part", "")
+            main_text = card_data.get("Front_Word", "")
+            render_constants_str = card_data.get('Text_constants_front', '12,60,5')
+            frame = self.ui_config.TEXT_FRAME_FRONT
+            language = language[0]
+        else:
+            title = dict_info.get("back_title", "Answer")
+            subtitle = card_data.get("Back_Part", "")
+            main_text = card_data.get("Back_Word", "")
+            render_constants_str = card_data.get('Text_constants_back', '12,60,5')
+            frame = self.ui_config.TEXT_FRAME_BACK
+            language = language[1]
 
         # Use pre-calculated render constants
-        main_text = card_data.get("Front_Word", "")
-        render_constants_str = card_data.get('Text_constants_front', '12,60,5')
         render_constants = self._parse_render_constants(render_constants_str)
-
-        self.text_renderer.render_precalculated_text(
-            self.canvas, main_text, self.ui_config.TEXT_FRAME_FRONT, render_constants
+        return SideLayout(title, subtitle, frame, self.text_renderer.layout_text(main_text, frame, render_constants, language))
+
+    def _ensure_items(self):
+        """Create the persistent image, title, subtitle and message items once."""
+        if self._image_item is not None:
+            return
+        self._image_item = self.canvas.create_image(
+            self.ui_config.CARD_CENTER_X, self.ui_config.CARD_CENTER_Y, image=self.card_front_img
         )
-
-    def show_back(self, card_data):
-        """
-        Display the back side of the flashcard.
-        """
-        self.canvas.delete("all")
-        self.canvas.create_image(self.ui_config.CARD_CENTER_X, self.ui_config.CARD_CENTER_Y, image=self.card_back_img)
-
-        dict_type = card_data.get(self.dict_config.SOURCE_COLUMN, "custom")
-        dict_info = self.dict_config.DICTIONARIES.get(dict_type, self.dict_config.DICTIONARIES["custom"])
-        title = dict_info.get("back_title", "Answer")
-
-        self.canvas.create_text(
-            self.ui_config.CARD_CENTER_X, self.ui_config.TITLE_Y, text=title,
+        self._current_image = self.card_front_img
+        self._title_item = self.canvas.create_text(
+            self.ui_config.CARD_CENTER_X, self.ui_config.TITLE_Y, text="",
             font=(self.ui_config.FONT_FAMILY, self.ui_config.TITLE_FONT_SIZE)
         )
-
-        part_2 = card_data.get("Back_Part", "")
-        self.canvas.create_text(
-            self.ui_config.CARD_CENTER_X, self.ui_config.SUBTITLE_Y, text=part_2,
+        self._subtitle_item = self.canvas.create_text(
+            self.ui_config.CARD_CENTER_X, self.ui_config.SUBTITLE_Y, text="",
             font=(self.ui_config.FONT_FAMILY, self.ui_config.PROPERTY_FONT_SIZE)
         )
+        self._message_item = self.canvas.create_text(
+            self.ui_config.CARD_CENTER_X, self.ui_config.CARD_CENTER_Y, text="", state="hidden"
+        )
 
-        # Use pre-calculated render constants
-        main_text = card_data.get("Back_Word", "")
-        render_constants_str = card_data.get('Text_constants_back', '12,60,5')
-        render_constants = self._parse_render_constants(render_constants_str)
+    def _line_item(self, index):
+        """Text line item `index` from the pool, growing the pool if needed."""
+        while len(self._line_items) <= index:
+            self._line_items.append(self.canvas.create_text(0, 0, text="", anchor="center", state="hidden"))
+        return self._line_items[index]
+
+    def _show_lines(self, lines, x, ys, font, fill="black"):
+        """Show `lines` in the first pooled line items and hide the rest."""
+        for i, (line, line_y) in enumerate(zip(lines, ys)):
+            item = self._line_item(i)
+            self.canvas.coords(item, x, line_y)
+            self.canvas.itemconfig(item, text=line, font=font, fill=fill, state="normal")
+        for item in self._line_items[len(lines):self._visible_lines]:
+            self.canvas.itemconfig(item, state="hidden")
+        self._visible_lines = len(lines)
+
+    def _draw_side(self, image, side_layout):
+        """Draw a prepared card side by updating the persistent items."""
+        self._ensure_items()
+        self.canvas.itemconfig(self._message_item, state="hidden")
+        if image is not self._current_image:
+            self.canvas.itemconfig(self._image_item, image=image)
+            self._current_image = image
+        self.canvas.itemconfig(self._image_item, state="normal")
+        self.canvas.itemconfig(self._title_item, text=side_layout.title, state="normal")
+        self.canvas.itemconfig(self._subtitle_item, text=side_layout.subtitle, state="normal")
+
+        layout = side_layout.text
+        if layout is None:
+            self._show_lines((), 0, (), None)
+        elif layout.error:
+            frame = side_layout.frame
+            self._show_lines((layout.error,), frame[0], (frame[1],), ("Arial", 12), fill="red")
+        else:
+            self._show_lines(layout.lines, layout.x, layout.ys, layout.font)
+
+    def show_front(self, card_data, layout=None):
+        """
+        Display the front side of the flashcard.
+        """
+        side_layout = layout.front if layout is not None else self._layout_side(card_data, "front")
+        self._draw_side(self.card_front_img, side_layout)
 
-        self.text_renderer.render_precalculated_text(
-            self.canvas, main_text, self.ui_config.TEXT_FRAME_BACK, render_constants
-        )
+    def show_back(self, card_data, layout=None):
+        """
+        Display the back side of the flashcard.
+        """
+        side_layout = layout.back if layout is not None else self._layout_side(card_data, "back")
+        self._draw_side(self.card_back_img, side_layout)
+
+    def show_message(self, text, font, fill):
+        """Hide the card and show a centered message instead."""
+        self.clear()
+        self.canvas.itemconfig(self._message_item, text=text, font=font, fill=fill, state="normal")
 
     def clear(self):
-        """Clear the canvas."""
-        self.canvas.delete("all")
\ No newline at end of file
+        """Hide all card items; they are kept for the next card."""
+        self._ensure_items()
+        for item in (self._image_item, self._title_item, self._subtitle_item, self._message_item):
+            self.canvas.itemconfig(item, state="hidden")
+        self._show_lines((), 0, (), None)
\ No newline at end of file
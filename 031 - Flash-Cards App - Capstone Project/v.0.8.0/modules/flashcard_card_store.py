@@ -0,0 +1,177 @@
+"""
+Compact card storage for the Flashcard Application.
+Replaces one dict per loaded row with a __slots__ record that still answers
+the dict-style lookups used across the application (card.get("Word_1"),
+entry["Weight"], card.get("Front_Word")), including the generic display keys
+without storing them a second time.
+"""
+
+from hashlib import blake2b
+from typing import Callable, Dict, Iterable, List, Optional
+from .flashcard_config import DictionaryConfig
+
+# CSV column name -> slot name
+COLUMN_SLOTS = {
+    DictionaryConfig.WORD_1_COLUMN: "word_1",
+    DictionaryConfig.PART_1_COLUMN: "part_1",
+    DictionaryConfig.WORD_2_COLUMN: "word_2",
+    DictionaryConfig.PART_2_COLUMN: "part_2",
+    DictionaryConfig.WEIGHT_COLUMN: "weight",
+    DictionaryConfig.SOURCE_COLUMN: "source",
+    "Text_constants_front": "text_constants_front",
+    "Text_constants_back": "text_constants_back",
+}
+
+# Generic display keys -> (primary column, legacy fallback column)
+DISPLAY_ALIASES = {
+    "Front_Word": (DictionaryConfig.WORD_1_COLUMN, "Word"),
+    "Front_Part": (DictionaryConfig.PART_1_COLUMN, "Part_of_Speech"),
+    "Back_Word": (DictionaryConfig.WORD_2_COLUMN, "Meaning"),
+    "Back_Part": (DictionaryConfig.PART_2_COLUMN, "Category"),
+}
+
+_MISSING = object()
+
+
+class CardRecord:
+    """
+    One flashcard. Known columns live in slots, anything else in `extra`.
+    A slot holding None counts as a missing key, like an absent dict key.
+    `language` is a (front, back) tuple of language codes and `dict_type` the
+    configured dictionary the card was loaded from, both set once at load time.
+    """
+
+    __slots__ = tuple(COLUMN_SLOTS.values()) + ("extra", "language", "dict_type")
+
+    def __init__(self, word_1=None, part_1=None, word_2=None, part_2=None, weight=None, source=None,
+                 text_constants_front=None, text_constants_back=None, extra=None, language=None, dict_type=None):
+        self.word_1 = word_1
+        self.part_1 = part_1
+        self.word_2 = word_2
+        self.part_2 = part_2
+        self.weight = weight
+        self.source = source
+        self.text_constants_front = text_constants_front
+        self.text_constants_back = text_constants_back
+        self.extra = extra
+        self.language = language
+        self.dict_type = dict_type
+
+    @classmethod
+    def from_mapping(cls, mapping: Dict) -> "CardRecord":
+        """Build a record from a dict-like entry (e.g. API data)."""
+        if isinstance(mapping, cls):
+            return mapping
+        record = cls()
+        for key, value in mapping.items():
+            if key not in DISPLAY_ALIASES:
+                record[key] = value
+        return record
+
+    def _lookup(self, key):
+        slot = COLUMN_SLOTS.get(key)
+        if slot is not None:
+            value = getattr(self, slot)
+            return _MISSING if value is None else value
+
+        aliases = DISPLAY_ALIASES.get(key)
+        if aliases is not None:
+            for column in aliases:
+                value = self._lookup(column)
+                if value is not _MISSING:
+                    return value
+            return ""
+
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        return _MISSING
+
+    def get(self, key, default=None):
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key):
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        slot = COLUMN_SLOTS.get(key)
+        if slot is not None:
+            setattr(self, slot, value)
+        elif key not in DISPLAY_ALIASES:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key):
+        return self._lookup(key) is not _MISSING
+
+    def to_dict(self) -> Dict:
+        """Plain dict with the stored columns (no display aliases)."""
+        result = {column: getattr(self, slot) for column, slot in COLUMN_SLOTS.items()
+                  if getattr(self, slot) is not None}
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+    def __repr__(self):
+        return f"CardRecord({self.to_dict()!r})"
+
+
+def records_from_columns(columns: Dict[str, List], count: int) -> List[CardRecord]:
+    """Build records from column name -> list of values, all `count` long."""
+    slot_columns = [(COLUMN_SLOTS[name], values) for name, values in columns.items() if name in COLUMN_SLOTS]
+    extra_columns = [(name, values) for name, values in columns.items() if name not in COLUMN_SLOTS]
+
+    records = [CardRecord() for _ in range(count)]
+    for slot, values in slot_columns:
+        for record, value in zip(records, values):
+            setattr(record, slot, value)
+    for name, values in extra_columns:
+        for record, value in zip(records, values):
+            if record.extra is None:
+                record.extra = {}
+            record.extra[name] = value
+    return records
+
+
+def records_from_dataframe(df) -> List[CardRecord]:
+    """Build records from a processed dictionary DataFrame."""
+    return records_from_columns({column: df[column].tolist() for column in df.columns}, len(df))
+
+
+def records_from_mappings(entries: Iterable[Dict]) -> List[CardRecord]:
+    """Convert dict entries (legacy or API data) to records."""
+    return [CardRecord.from_mapping(entry) for entry in entries]
+
+
+def card_id(card) -> int:
+    """
+    Stable 64-bit id of a card: blake2b over source, Word_1 and Word_2, so it
+    survives reloads, batch order and eviction. Signed, to fit an SQLite INTEGER.
+    """
+    key = "\x1f".join(str(card.get(column, "")) for column in
+                      (DictionaryConfig.SOURCE_COLUMN, DictionaryConfig.WORD_1_COLUMN, DictionaryConfig.WORD_2_COLUMN))
+    return int.from_bytes(blake2b(key.encode("utf-8"), digest_size=8).digest(), "little", signed=True)
+
+
+def tag_languages(records: List[CardRecord], front_language: Optional[str], back_language: Optional[str],
+                  detect: Callable[[str], str]) -> None:
+    """
+    Set each record's (front, back) language tag. A side whose language is None
+    (mixed custom decks) is classified once with `detect(text)`. Records share
+    the interned tag tuples, so tagging costs one pointer per record.
+    """
+    if front_language is not None and back_language is not None:
+        tag = (front_language, back_language)
+        for record in records:
+            record.language = tag
+        return
+
+    tags = {}
+    for record in records:
+        front = front_language or detect(record.word_1)
+        back = back_language or detect(record.word_2)
+        record.language = tags.setdefault((front, back), (front, back))
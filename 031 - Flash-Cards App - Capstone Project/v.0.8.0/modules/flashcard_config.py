@@ -60,6 +60,12 @@ class UIConfig:
     # Used by both preprocessing and rendering to ensure consistency
     TEXT_FRAME_BACK = TEXT_FRAME_FRONT = (400, 270, 700, 400)
 
+    # Prefetching: cards sampled and laid out during idle time, ready for the next click
+    PREFETCH_CARDS = 3
+
+    # How often the main thread checks for dictionaries loaded in the background
+    LOAD_POLL_INTERVAL = 50  # milliseconds
+
     # Colors
     BACKGROUND_COLOR = "#B1DDC6"
     FRONTSIDE_COLOR = "#FFFFFF"
@@ -85,6 +91,7 @@ class UIConfig:
     TIMER_DEFAULT_DISPLAY = "00.0"
     WINDOW_TITLE = "Flashcards"
     NO_DATA_MESSAGE = "Bitte mindestens ein Wörterbuch auswählen!"
+    LOADING_MESSAGE = "Wörterbuch wird geladen..."
 
 
 # Dictionary Configuration
@@ -103,6 +110,8 @@ class DictionaryConfig:
             "icon": "GER-RUS_icon.png",
             "text": "5k Wörter",
             "source": "deutsch",
+            "front_language": "de",
+            "back_language": "ru",
             "default_checked": True,
             "delimiter": "\t",
             "front_title": "Deutsch",
@@ -113,6 +122,8 @@ class DictionaryConfig:
             "icon": "ENG-RUS_icon.png",
             "text": "5k words",
             "source": "english",
+            "front_language": "en",
+            "back_language": "ru",
             "default_checked": True,
             "delimiter": "\t",
             "front_title": "English",
@@ -123,6 +134,8 @@ class DictionaryConfig:
             "icon": "USA-RUS_icon.png",
             "text": "150k words",
             "source": "english",
+            "front_language": "en",
+            "back_language": "ru",
             "default_checked": True,
             "delimiter": "\t",
             "front_title": "English (Am.)",
@@ -133,6 +146,8 @@ class DictionaryConfig:
             "icon": "LAW_icon.png",
             "text": "custom dict",
             "source": "custom",
+            "front_language": None,  # Mixed content - detected once per entry at load time
+            "back_language": None,
             "default_checked": True,
             "delimiter": "\t",
             "front_title": "Frage",
@@ -145,6 +160,10 @@ class DictionaryConfig:
     HELP_DIR = "help/"
     HELP_FILE = "FlashcardsHilfe.html"
     PROGRAM_ICON = "Program_icon.png"
+    METADATA_CACHE_FILE = os.path.join(DATA_DIR, "dictionary_metadata.json")
+    BINARY_CACHE_DIR = os.path.join(DATA_DIR, "cache")  # Compiled .fcb dictionaries
+    HYPHENATION_CACHE_FILE = os.path.join(DATA_DIR, "hyphenation_cache.json")  # Cached pyphen break points
+    SQLITE_DB_FILE = os.path.join(DATA_DIR, "dictionaries.db")  # Optional SQLite storage backend
 
     # CSV Column Names
     WEIGHT_COLUMN = "Weight"
@@ -187,7 +206,11 @@ class TextRenderConfig:
     # Enhanced wrapping configuration
     MAX_PIXEL_WIDTH = 500  # Reasonable wrapping for readability
     HYPHENATION_ENABLED = True
+    HYPHENATION_MIN_WORD_LENGTH = 12  # Shorter words never overflow the frame - not worth priming
     FALLBACK_TO_WORD_COUNT = True  # For backward compatibility
+    WRAP_CACHE_SIZE = 512  # Wrapped layouts kept per TextRenderer (LRU), 0 disables the cache
+    USE_GLYPH_WIDTH_TABLE = True  # Sum cached per-character widths instead of measuring every test line
+    GLYPH_WIDTH_TOLERANCE = 0.05  # Re-measure for real when within this fraction of the wrap width
 
     # Language Detection
     # IMPORTANT: Used for proper hyphenation and word splitting
@@ -235,12 +258,62 @@ class ProgressiveLoadingConfig:
     BATCH_SIZE = 1000  # Number of entries to load per batch
     LOADING_INTERVAL = 180  # Seconds between progressive loads
     MAX_LOADED_ENTRIES = 10000  # Maximum entries per dictionary in memory
+    EVICTION_POLICY = "oldest"  # "oldest", "known" or None - what to drop at MAX_LOADED_ENTRIES
 
     # Performance Settings
     ENABLE_PROGRESSIVE_LOADING = True  # Master switch for progressive loading
     BACKGROUND_LOADING = True  # Load in background thread
+    SHUTDOWN_TIMEOUT = 2.0  # Seconds to wait for a running load when closing
     CACHE_LOADED_RANGES = True  # Track loaded ranges to avoid duplicates
 
+    # Row Index Settings
+    ROW_INDEX_STRIDE = 256  # Store the byte offset of every Nth row
+    ROW_INDEX_SUFFIX = ".idx"  # Sidecar file next to the dictionary file
+
+    # Compiled Cache Settings
+    USE_BINARY_CACHE = True  # Memory-map compiled dictionaries when they are fresh
+
+    # Storage Backend
+    STORAGE_BACKEND = "files"  # "files" (CSV / compiled cache) or "sqlite" (see flashcard_sqlite_store)
+    SQLITE_IMPORT_CHUNK_SIZE = 5000  # Rows per executemany when importing
+
+
+# Dynamic Weight Configuration
+class WeightingConfig:
+    """Dynamic weight configuration - use class attributes directly (singleton pattern)."""
+
+    # Column analysed for complexity
+    TEXT_COLUMN = "Word_2"
+    BASE_WEIGHT = 100
+
+    # (threshold, bonus) pairs - every exceeded threshold adds its bonus
+    CHAR_COUNT_BONUSES = [(200, 50), (400, 100), (600, 150)]
+    WORD_COUNT_BONUSES = [(20, 25), (40, 50)]
+
+    # Substring indicators - any match adds the bonus once
+    PARAGRAPH_INDICATORS = [';', '1)', '2)', '3)', '4)', '5)', '§', 'GG§', 'StGB']
+    PARAGRAPH_BONUS = 100
+    LEGAL_TERMS = ['StGB', 'GG§', 'Recht', 'Gesetz', 'Verfassung', 'Staat', 'Demokratie']
+    LEGAL_TERMS_BONUS = 50
+
+
+# Render Constant Preprocessing Configuration
+class PreprocessConfig:
+    """Offline font fitting for Text_constants columns - use class attributes directly (singleton pattern)."""
+
+    # Binary search range for the font size (points, like the runtime Tk fonts)
+    MIN_FONT_SIZE = 8
+    MAX_FONT_SIZE = 40
+    PIXELS_PER_POINT = 96 / 72  # Tk's default scaling on a 96 dpi screen
+
+    # Measurement backend: "auto" uses Pillow when a font file is found, otherwise AFM-style widths
+    BACKEND = "auto"
+    FONT_FILES = ["arialbd.ttf", "Arial Bold.ttf", "Arial_Bold.ttf", "LiberationSans-Bold.ttf", "DejaVuSans-Bold.ttf"]
+
+    # Process pool
+    WORKERS = None  # None = one per CPU
+    CHUNK_SIZE = 500  # Rows per task
+
 
 # Statistics Configuration
 class StatisticsConfig:
@@ -253,4 +326,34 @@ class StatisticsConfig:
     STATS_COLUMNS = [
         "Datum", "Zeit", "Übungsdauer", "Richtig", "Falsch",
         "Durchschnittliche Reaktionszeit"
-    ]
\ No newline at end of file
+    ]
+
+    # Per-card review event log (SQLite, WAL mode)
+    REVIEW_LOG_ENABLED = True
+    REVIEW_LOG_FILE = os.path.join(DictionaryConfig.DATA_DIR, "reviews.db")
+    REVIEW_LOG_FLUSH_EVENTS = 32  # Flush once this many events are buffered...
+    REVIEW_LOG_FLUSH_INTERVAL = 10.0  # ...or at the latest after this many seconds
+
+
+# Spaced Repetition Configuration
+class SchedulerConfig:
+    """SM-2 review scheduling - use class attributes directly (singleton pattern)."""
+
+    ENABLED = True
+    STATE_FILE = os.path.join(DictionaryConfig.DATA_DIR, "schedule.db")  # Sidecar store, keyed by card id
+
+    # SM-2 parameters (intervals in days)
+    INITIAL_EASE = 2.5
+    MIN_EASE = 1.3
+    FIRST_INTERVALS = (1, 6)  # After the first and second successful review
+    LAPSE_INTERVAL = 10 / (24 * 60)  # A card marked unknown is due again after 10 minutes
+    EASY_REACTION_TIME = 3.0  # Seconds - a faster "known" counts as an easy recall (quality 5 instead of 4)
+    QUALITY_UNKNOWN = 2
+
+    # Sampling weight = dictionary weight * factor
+    LAPSE_WEIGHT_FACTOR = 3.0  # Cards marked unknown come back more often
+    MIN_WEIGHT_FACTOR = 0.05  # Well-known cards still show up occasionally
+
+    # Batched write-back of changed card states
+    FLUSH_STATES = 32
+    FLUSH_INTERVAL = 10.0  # Seconds
\ No newline at end of file
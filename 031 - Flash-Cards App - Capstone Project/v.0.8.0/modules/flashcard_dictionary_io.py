@@ -0,0 +1,40 @@
+"""
+Dictionary file reading for the Flashcard Application.
+Parsing and preparing a dictionary CSV is shared by the progressive loader
+and the offline compilers (binary cache, SQLite import), so they all see the
+same rows, columns and weights.
+"""
+
+import pandas as pd
+from .flashcard_config import DictionaryConfig, WeightingConfig, external_path
+from .flashcard_weighting import compute_dynamic_weights
+
+# Fix: Remove the hardcoded 'sep' argument. It will be provided dynamically.
+CSV_KWARGS = dict(engine='python', on_bad_lines='skip', quotechar='"', escapechar='\\')
+
+
+def read_dictionary_csv(file_path, dict_info, **kwargs) -> pd.DataFrame:
+    """Parse a whole dictionary file with pandas (extra kwargs, e.g. chunksize, go to read_csv)."""
+    return pd.read_csv(external_path(file_path), sep=dict_info.get("delimiter", ","), **CSV_KWARGS, **kwargs)
+
+
+def prepare_dictionary_dataframe(df: pd.DataFrame, dict_info, dict_config=DictionaryConfig) -> pd.DataFrame:
+    """Add default weight and source columns and apply dynamic weights."""
+    if dict_config.WEIGHT_COLUMN not in df.columns:
+        df[dict_config.WEIGHT_COLUMN] = dict_config.DEFAULT_WEIGHT
+
+    df[dict_config.SOURCE_COLUMN] = dict_info["source"]
+    return apply_dynamic_weights(df, dict_config)
+
+
+def apply_dynamic_weights(df: pd.DataFrame, dict_config=DictionaryConfig) -> pd.DataFrame:
+    """Apply dynamic weights based on content complexity and length."""
+    text_column = WeightingConfig.TEXT_COLUMN
+    texts = df[text_column] if text_column in df.columns else pd.Series("", index=df.index)
+    df[dict_config.WEIGHT_COLUMN] = compute_dynamic_weights(texts)
+
+    weight_stats = df[dict_config.WEIGHT_COLUMN].describe()
+    if weight_stats['max'] > 200:
+        print(f"Dynamic weights applied - Min: {weight_stats['min']:.0f}, Max: {weight_stats['max']:.0f}, Mean: {weight_stats['mean']:.0f}")
+
+    return df
@@ -11,6 +11,12 @@ from .flashcard_config import DictionaryConfig, ProgressiveLoadingConfig, resour
 
 from .flashcard_progressive_loader import ProgressiveDictionaryManager
 
+from .flashcard_loader_worker import PRIORITY_ACTIVATE
+
+from .flashcard_card_store import CardRecord, records_from_dataframe, tag_languages
+
+from .flashcard_text_renderer import detect_language
+
 from .tracing import tracer
 
 
@@ -29,7 +35,7 @@ class DictionaryManager:
 
     
 
-    def __init__(self, config=None, loading_config=None):
+    def __init__(self, config=None, loading_config=None, hyphenation=None):
 
         self.config = config or DictionaryConfig()
 
@@ -43,10 +49,38 @@ class DictionaryManager:
 
             dict_config=self.config,
 
-            loading_config=self.loading_config
+            loading_config=self.loading_config,
+
+            hyphenation=hyphenation
 
         )
 
+        
+
+        # Per-source entry counts of the last legacy load
+
+        self.legacy_source_counts = {}
+
+        
+
+        # Spaced-repetition scheduler applied to loaded entries (see set_scheduler)
+
+        self.scheduler = None
+
+    
+
+    def set_scheduler(self, scheduler):
+
+        """
+
+        Apply a scheduler's per-card weights to every entry loaded from now on.
+
+        """
+
+        self.scheduler = scheduler
+
+        self.progressive_loader.scheduler = scheduler
+
     
 
     def load_selected_dictionaries(self, selected_types):
@@ -94,6 +128,7 @@ class DictionaryManager:
         Load dictionaries using the legacy full-loading system.
         """
         data = []
+        self.legacy_source_counts = {}
         for dict_type in selected_types:
             if dict_type not in self.config.DICTIONARIES:
                 continue
@@ -130,7 +165,14 @@ class DictionaryManager:
                 
                 df[self.config.SOURCE_COLUMN] = dict_info["source"]
                 
-                data.extend(df.to_dict(orient="records"))
+                records = records_from_dataframe(df)
+                tag_languages(records, dict_info.get("front_language"), dict_info.get("back_language"), detect_language)
+                for record in records:
+                    record.dict_type = dict_type
+                if self.scheduler is not None:
+                    self.scheduler.apply(records)
+                data.extend(records)
+                self.legacy_source_counts[dict_info["source"]] = self.legacy_source_counts.get(dict_info["source"], 0) + len(df)
                 
             except FileNotFoundError:
                 print(f"File not found: {file_path}")
@@ -174,13 +216,13 @@ class DictionaryManager:
         validated_data = []
         
         for entry in data:
-            validated_entry = {
-                self.config.WORD_1_COLUMN: entry.get(self.config.WORD_1_COLUMN, ""),
-                self.config.WORD_2_COLUMN: entry.get(self.config.WORD_2_COLUMN, ""),
-                self.config.PART_1_COLUMN: entry.get(self.config.PART_1_COLUMN, self.config.DEFAULT_PART_1),
-                self.config.PART_2_COLUMN: entry.get(self.config.PART_2_COLUMN, self.config.DEFAULT_PART_2),
-                self.config.SOURCE_COLUMN: entry.get(self.config.SOURCE_COLUMN, "deutsch")
-            }
+            validated_entry = CardRecord(
+                word_1=entry.get(self.config.WORD_1_COLUMN, ""),
+                word_2=entry.get(self.config.WORD_2_COLUMN, ""),
+                part_1=entry.get(self.config.PART_1_COLUMN, self.config.DEFAULT_PART_1),
+                part_2=entry.get(self.config.PART_2_COLUMN, self.config.DEFAULT_PART_2),
+                source=entry.get(self.config.SOURCE_COLUMN, "deutsch")
+            )
 
             # Validate weight is numeric
             try:
@@ -223,6 +265,65 @@ class DictionaryManager:
             return self.progressive_loader.get_loading_statistics()
         return {"progressive_loading": False}
     
+    def load_selected_dictionaries_async(self, selected_types, on_done):
+        """
+        Load the selected dictionaries on the loader worker thread.
+        `on_done(entries)` is called on that thread once they are available,
+        unless the loader is shutting down by then.
+        """
+        if self.loading_config.ENABLE_PROGRESSIVE_LOADING:
+            tracer.ic({"loader": "progressive", "selected": selected_types, "async": True})
+            return self.progressive_loader.activate_async(selected_types, on_done)
+        tracer.ic({"loader": "legacy", "selected": selected_types, "async": True})
+
+        def load_legacy():
+            entries = self._load_with_legacy_system(selected_types)
+            if not self.progressive_loader.is_stopping():
+                on_done(entries)
+            return entries
+
+        return self.progressive_loader.submit(PRIORITY_ACTIVATE, None, load_legacy)
+    
+    def get_loaded_entries(self, selected_types):
+        """
+        Get the entries that are already in memory, without loading anything.
+        """
+        if self.loading_config.ENABLE_PROGRESSIVE_LOADING:
+            return self.progressive_loader.get_available_entries(selected_types)
+        return []
+    
+    def get_source_counts(self, selected_types=None):
+        """
+        Get the number of loaded entries per source without scanning the entries.
+        """
+        if self.loading_config.ENABLE_PROGRESSIVE_LOADING:
+            return self.progressive_loader.get_source_counts(selected_types)
+        return dict(self.legacy_source_counts)
+    
+    def is_entry_loaded(self, entry, selected_types):
+        """
+        Whether an entry belongs to the loaded entries of the selected dictionaries.
+        The legacy loader keeps no batches, so only the entry's source is checked there.
+        """
+        if self.loading_config.ENABLE_PROGRESSIVE_LOADING:
+            return self.progressive_loader.is_entry_loaded(entry, selected_types)
+        sources = {self.config.DICTIONARIES[t]["source"] for t in selected_types if t in self.config.DICTIONARIES}
+        return entry.get(self.config.SOURCE_COLUMN) in sources
+    
+    def record_review(self, entry, known):
+        """
+        Pass a review outcome to the progressive loader (used by review-aware eviction).
+        """
+        if self.loading_config.ENABLE_PROGRESSIVE_LOADING:
+            self.progressive_loader.record_review(entry, known)
+    
+    def store_weight(self, entry, weight):
+        """
+        Keep an entry's new weight in the dictionary store (SQLite backend only).
+        """
+        if self.loading_config.ENABLE_PROGRESSIVE_LOADING:
+            self.progressive_loader.store_weight(entry, weight)
+    
     def stop_progressive_loading(self):
         """
         Stop progressive loading operations.
@@ -234,5 +335,4 @@ class DictionaryManager:
         """
         Clean up resources and stop all loading operations.
         """
-        if self.loading_config.ENABLE_PROGRESSIVE_LOADING:
-            self.progressive_loader.cleanup()
\ No newline at end of file
+        self.progressive_loader.cleanup()
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+Eviction policies for the progressive loader.
+When a dictionary reaches ProgressiveLoadingConfig.MAX_LOADED_ENTRIES, a policy
+chooses which loaded batch to drop so a fresh batch can rotate in while memory
+stays constant.
+"""
+
+from typing import Optional, Sequence
+
+
+class LoadedBatch:
+    """
+    Bookkeeping for one loaded batch: its row range, size, dictionary, review outcomes
+    and the ids of its entries (valid while the batch is resident - it keeps them alive).
+    """
+
+    __slots__ = ("start", "end", "size", "dict_type", "known_count", "entry_ids")
+
+    def __init__(self, start, end, size, dict_type=None, entry_ids=()):
+        self.start = start
+        self.end = end
+        self.size = size
+        self.dict_type = dict_type
+        self.known_count = 0
+        self.entry_ids = entry_ids
+
+    def __repr__(self):
+        return f"LoadedBatch({self.start}, {self.end}, size={self.size}, known={self.known_count})"
+
+
+class EvictionPolicy:
+    """Base class - returns the position of the batch to evict, or None to keep everything."""
+
+    name = "none"
+    enabled = False
+
+    def select_victim(self, batches: Sequence[LoadedBatch]) -> Optional[int]:
+        return None
+
+
+class OldestBatchEviction(EvictionPolicy):
+    """Evict the batch that has been in memory the longest (FIFO)."""
+
+    name = "oldest"
+    enabled = True
+
+    def select_victim(self, batches):
+        return 0 if batches else None
+
+
+class KnownCardsEviction(EvictionPolicy):
+    """
+    Evict the batch with the highest share of cards the user already marked as known.
+    Ties go to the oldest batch, so without any reviews this behaves like FIFO.
+    """
+
+    name = "known"
+    enabled = True
+
+    def select_victim(self, batches):
+        if not batches:
+            return None
+        return max(range(len(batches)), key=lambda i: (batches[i].known_count / (batches[i].size or 1), -i))
+
+
+EVICTION_POLICIES = {
+    policy.name: policy
+    for policy in (EvictionPolicy, OldestBatchEviction, KnownCardsEviction)
+}
+
+
+def create_eviction_policy(name):
+    """Create a policy from its configured name; None or unknown names disable eviction."""
+    policy_class = EVICTION_POLICIES.get(name)
+    if policy_class is None:
+        if name is not None:
+            print(f"Warning: Unknown eviction policy '{name}', eviction disabled")
+        return EvictionPolicy()
+    return policy_class()
@@ -0,0 +1,55 @@
+"""
+Glyph-width tables for text wrapping in the Flashcard Application.
+Each character is measured once per font and string widths are summed from
+the table, instead of a Tcl round-trip per growing test line. Near the wrap
+boundary, where kerning could flip a decision, the real measurement is used.
+"""
+
+from typing import Callable
+
+
+class GlyphWidthTable:
+    """Per-font character widths, measured lazily with `measure_char` and cached."""
+
+    def __init__(self, measure_char: Callable[[str], int]):
+        self._measure_char = measure_char
+        self._widths = {}
+        self.measure_calls = 0
+
+    def char_width(self, char: str) -> int:
+        width = self._widths.get(char)
+        if width is None:
+            width = self._measure_char(char)
+            self._widths[char] = width
+            self.measure_calls += 1
+        return width
+
+    def width(self, text: str) -> int:
+        """Approximate width of `text` as the sum of its glyph widths."""
+        widths = self._widths
+        try:
+            return sum([widths[char] for char in text])
+        except KeyError:
+            return sum([self.char_width(char) for char in text])
+
+
+class BoundaryMeasurer:
+    """
+    Drop-in for a Tk font in the wrapping code: measure() answers from the width
+    table and only asks the real font when the estimate lies within `tolerance`
+    (a fraction of the boundary) of the wrap width being compared against.
+    """
+
+    def __init__(self, table: GlyphWidthTable, font_obj, boundary: int, tolerance: float):
+        self.table = table
+        self.font = font_obj
+        self.boundary = boundary
+        self.margin = boundary * tolerance
+        self.exact_calls = 0
+
+    def measure(self, text: str) -> int:
+        estimate = self.table.width(text)
+        if abs(estimate - self.boundary) > self.margin:
+            return estimate
+        self.exact_calls += 1
+        return self.font.measure(text)
@@ -0,0 +1,145 @@
+"""
+Hyphenation points cache for the Flashcard Application.
+Stores pyphen's break candidates per distinct word so the text wrapper only
+picks among cached points instead of running pyphen while a card is shown.
+The cache is primed when batches are loaded and persisted to a JSON file
+when the application closes.
+"""
+
+import json
+import os
+import re
+import threading
+from .flashcard_config import TextRenderConfig
+from .tracing import tracer
+
+_EDGE_PATTERN = re.compile(r"^\W+|\W+$", re.UNICODE)
+_OPENING_PAREN_PATTERN = re.compile(r"\s*\(\s*")
+_CLOSING_PAREN_PATTERN = re.compile(r"\s*\)")
+
+
+def hyphenation_key(token):
+    """
+    Cache key of a token as the renderer splits text: the token without leading and
+    trailing punctuation ("(Verfassungsbeschwerde)," -> "Verfassungsbeschwerde").
+    """
+    return _EDGE_PATTERN.sub("", token)
+
+
+def hyphenation_keys(text):
+    """
+    Keys of the tokens TextRenderer.wrap_text may hyphenate in `text`: the text is
+    split into paragraphs and words the same way before keys are taken.
+    """
+    text = text.replace(TextRenderConfig.NON_BREAKABLE_SPACE_SYMBOL, "\u00A0")
+    text = _CLOSING_PAREN_PATTERN.sub(")", _OPENING_PAREN_PATTERN.sub(" (", text))
+    for paragraph in text.split(TextRenderConfig.NEW_LINE_SYMBOL):
+        for token in paragraph.strip().split(" "):
+            yield hyphenation_key(token)
+
+
+class HyphenationCache:
+    """
+    word -> tuple of (left, right) break pairs, in the order pyphen.iterate yields them.
+    Drop-in for the hyphenator passed to TextRenderer._split_word_with_pyphen.
+    Words are stored under hyphenation_key, so a token with punctuation shares the
+    entry of the bare word.
+    """
+
+    def __init__(self, hyphenator, language, cache_path=None, min_word_length=None):
+        self.hyphenator = hyphenator
+        self.language = language
+        self.cache_path = cache_path
+        self.min_word_length = min_word_length or TextRenderConfig.HYPHENATION_MIN_WORD_LENGTH
+        self._pairs = None  # Loaded lazily
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def iterate(self, word):
+        """
+        Cached hyphenator.iterate(word); computes and stores it on a miss.
+        Punctuation around the word is not hyphenated and is added back to the pairs.
+        """
+        key = hyphenation_key(word)
+        if not key:
+            return ()
+        pairs = self._load().get(key)
+        if pairs is None:
+            pairs = tuple(tuple(pair) for pair in self.hyphenator.iterate(key))
+            with self._lock:
+                self._pairs[key] = pairs
+                self._dirty = True
+        if key == word:
+            return pairs
+        prefix = word[:word.index(key)]
+        suffix = word[len(prefix) + len(key):]
+        return tuple((prefix + left, right + suffix) for left, right in pairs)
+
+    def prime(self, texts):
+        """
+        Compute break points for every distinct long word in `texts` ahead of display.
+        Callers pass only texts the renderer will hyphenate (tagged with this language).
+        Returns the number of newly cached words.
+        """
+        cached = self._load()
+        new_words = set()
+        for text in texts:
+            if not isinstance(text, str):
+                continue
+            for word in hyphenation_keys(text):
+                if len(word) >= self.min_word_length and word not in cached:
+                    new_words.add(word)
+
+        for word in new_words:
+            self.iterate(word)
+        if new_words:
+            tracer.ic({"hyphenation_primed": {"language": self.language, "words": len(new_words)}})
+        return len(new_words)
+
+    def __len__(self):
+        return len(self._load())
+
+    def _load(self):
+        """Load the persisted cache once per process."""
+        if self._pairs is None:
+            with self._lock:
+                if self._pairs is None:
+                    self._pairs = self._read()
+        return self._pairs
+
+    def _read(self):
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("language") != self.language:
+            return {}
+        return {word: tuple(tuple(pair) for pair in pairs) for word, pairs in data.get("words", {}).items()}
+
+    def save(self):
+        """
+        Persist new entries atomically (temporary file in the cache's directory + os.replace);
+        failures only cost recomputation next launch.
+        """
+        if not self.cache_path or not self._dirty:
+            return
+        with self._lock:
+            data = {"language": self.language, "words": {word: list(pairs) for word, pairs in self._pairs.items()}}
+            self._dirty = False
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write hyphenation cache {self.cache_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
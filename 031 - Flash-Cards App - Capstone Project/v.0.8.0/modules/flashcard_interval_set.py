@@ -0,0 +1,84 @@
+"""
+Interval set for tracking loaded row ranges of a dictionary.
+Keeps sorted, disjoint, half-open [start, end) intervals so batch selection
+can pick only rows that have not been loaded yet.
+"""
+
+import random
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
+
+
+class IntervalSet:
+    """Sorted set of disjoint half-open integer intervals with merge on insert."""
+
+    def __init__(self, intervals=()):
+        self._starts = []
+        self._ends = []
+        for start, end in intervals:
+            self.add(start, end)
+
+    def add(self, start: int, end: int) -> None:
+        """Insert [start, end), merging it with every overlapping or adjacent interval."""
+        if start >= end:
+            return
+
+        # First interval whose end reaches start, last interval whose start reaches end
+        lo = bisect_left(self._ends, start)
+        hi = bisect_right(self._starts, end)
+        if lo < hi:
+            start = min(start, self._starts[lo])
+            end = max(end, self._ends[hi - 1])
+
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+
+    def covered(self) -> int:
+        """Total number of integers covered by the set."""
+        return sum(end - start for start, end in zip(self._starts, self._ends))
+
+    def gaps(self, total: int) -> List[Tuple[int, int]]:
+        """Uncovered intervals within [0, total)."""
+        gaps = []
+        position = 0
+        for start, end in zip(self._starts, self._ends):
+            if start >= total:
+                break
+            if start > position:
+                gaps.append((position, start))
+            position = max(position, end)
+        if position < total:
+            gaps.append((position, total))
+        return gaps
+
+    def choose_gap_range(self, total: int, size: int, rng=random) -> Optional[Tuple[int, int]]:
+        """
+        Pick a random range of at most `size` uncovered rows within [0, total).
+
+        Gaps are chosen proportionally to their length, so every uncovered row is
+        equally likely to be included. Returns None once [0, total) is fully covered.
+        """
+        gaps = self.gaps(total)
+        if not gaps:
+            return None
+
+        lengths = [end - start for start, end in gaps]
+        gap_start, gap_end = rng.choices(gaps, weights=lengths, k=1)[0]
+        if gap_end - gap_start <= size:
+            return gap_start, gap_end
+
+        start = rng.randint(gap_start, gap_end - size)
+        return start, start + size
+
+    def clear(self) -> None:
+        self._starts.clear()
+        self._ends.clear()
+
+    def __iter__(self):
+        return iter(zip(self._starts, self._ends))
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __repr__(self):
+        return f"IntervalSet({list(self)!r})"
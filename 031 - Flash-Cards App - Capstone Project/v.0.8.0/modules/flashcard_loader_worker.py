@@ -0,0 +1,166 @@
+"""
+Background loader worker for the Flashcard Application.
+One long-lived thread drains a priority queue, so user-triggered activations
+run before periodic refills, pending work for a dictionary can be cancelled
+when it is deselected, and shutdown joins a single known thread.
+"""
+
+import itertools
+import queue
+import threading
+import time
+from typing import Callable, Optional
+from .tracing import tracer
+
+# Lower value runs first
+PRIORITY_SHUTDOWN = 0
+PRIORITY_ACTIVATE = 1
+PRIORITY_REFILL = 2
+PRIORITY_FLUSH = 3  # Write-behind of buffered state, after any loading work
+
+
+class LoaderTask:
+    """A queued unit of work; `key` (usually a dictionary type) groups tasks for cancellation."""
+
+    __slots__ = ("priority", "key", "func", "args", "cancelled", "done", "result", "error")
+
+    def __init__(self, priority, key, func, args):
+        self.priority = priority
+        self.key = key
+        self.func = func
+        self.args = args
+        self.cancelled = False
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self, timeout=None):
+        """Block until the task ran or was cancelled. Returns the task's result."""
+        self.done.wait(timeout)
+        return self.result
+
+
+class LoaderWorker:
+    """
+    A single daemon thread fed by a PriorityQueue.
+
+    If `interval` is set, `on_interval` is called on the worker thread whenever
+    that many seconds pass; it usually submits refill tasks.
+    """
+
+    def __init__(self, interval: Optional[float] = None, on_interval: Optional[Callable] = None,
+                 name="flashcard-loader"):
+        self.interval = interval
+        self.on_interval = on_interval
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()  # FIFO order within one priority
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._running = False
+        self._stopping = False
+
+    def start(self) -> "LoaderWorker":
+        if not self._running:
+            self._running = True
+            self._thread.start()
+        return self
+
+    @property
+    def alive(self) -> bool:
+        return self._thread.is_alive()
+
+    @property
+    def stopping(self) -> bool:
+        """Set by shutdown(); a running task checks it before handing results on."""
+        return self._stopping
+
+    def submit(self, priority: int, key, func: Callable, *args) -> LoaderTask:
+        """Queue func(*args); tasks with a lower priority value run first. Cancelled at once after shutdown()."""
+        task = LoaderTask(priority, key, func, args)
+        if self._stopping:
+            task.cancelled = True
+            task.done.set()
+            return task
+        with self._pending_lock:
+            self._pending.append(task)
+        self._queue.put((priority, next(self._sequence), task))
+        return task
+
+    def has_pending(self, key, priority: Optional[int] = None) -> bool:
+        """Whether a not yet started, not cancelled task exists for `key`."""
+        with self._pending_lock:
+            return any(task.key == key and not task.cancelled and (priority is None or task.priority == priority)
+                       for task in self._pending)
+
+    def cancel(self, key=None, priority: Optional[int] = None) -> int:
+        """
+        Cancel pending tasks for `key` (all keys if None), optionally only those of one priority.
+        A task that is already running finishes. Returns the number of cancelled tasks.
+        """
+        with self._pending_lock:
+            cancelled = [task for task in self._pending
+                         if (key is None or task.key == key) and (priority is None or task.priority == priority)]
+            for task in cancelled:
+                task.cancelled = True
+            self._pending = [task for task in self._pending if not task.cancelled]
+        for task in cancelled:
+            task.done.set()
+        if cancelled:
+            tracer.ic({"loader_cancel": {"key": key, "tasks": len(cancelled)}})
+        return len(cancelled)
+
+    def pending_count(self) -> int:
+        with self._pending_lock:
+            return len(self._pending)
+
+    def shutdown(self, timeout: Optional[float] = None) -> bool:
+        """
+        Set the stop flag, cancel pending work, let the running task finish and join
+        the thread for at most `timeout` seconds. Returns True once the thread has exited.
+        """
+        self._stopping = True
+        self.cancel()
+        if self._running:
+            self._queue.put((PRIORITY_SHUTDOWN, next(self._sequence), None))
+            if self._thread is not threading.current_thread():
+                self._thread.join(timeout)
+        self._running = False
+        return not self._thread.is_alive()
+
+    def _run(self):
+        next_interval = time.monotonic() + self.interval if self.interval else None
+        while True:
+            timeout = None if next_interval is None else max(0.0, next_interval - time.monotonic())
+            try:
+                _, _, task = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                next_interval = time.monotonic() + self.interval
+                self._call(self.on_interval)
+                continue
+
+            if task is None:
+                return
+            with self._pending_lock:
+                if task.cancelled:
+                    continue
+                self._pending.remove(task)
+
+            try:
+                task.result = task.func(*task.args)
+            except Exception as e:
+                task.error = e
+                tracer.ic({"loader_task_error": str(e), "key": task.key})
+                print(f"Error in background loader task for {task.key}: {e}")
+            finally:
+                task.done.set()
+
+    @staticmethod
+    def _call(callback):
+        if callback is None:
+            return
+        try:
+            callback()
+        except Exception as e:
+            tracer.ic({"loader_interval_error": str(e)})
+            print(f"Error scheduling background loading: {e}")
@@ -0,0 +1,111 @@
+"""
+Dictionary metadata cache for the Flashcard Application.
+Keeps row count, column schema, detected delimiter and a validity flag per
+dictionary file, keyed by (path, size, mtime). Activating a dictionary whose
+file has not changed therefore costs a single stat() instead of a full scan.
+"""
+
+import json
+import os
+import threading
+from .flashcard_config import DictionaryConfig, external_path
+from .tracing import tracer
+
+# Candidate delimiters in order of preference when counts are equal
+DELIMITER_CANDIDATES = ("\t", ",", ";")
+SCAN_CHUNK_SIZE = 1 << 20
+
+
+class DictionaryMetadataCache:
+    """Persistent (path, size, mtime) -> metadata cache backed by a JSON file."""
+
+    def __init__(self, dict_config=None, cache_path=None):
+        self.dict_config = dict_config or DictionaryConfig()
+        self.cache_path = cache_path or external_path(self.dict_config.METADATA_CACHE_FILE)
+        self._entries = None  # full path -> metadata dict, loaded lazily
+        self._lock = threading.Lock()
+
+    def get(self, file_path):
+        """
+        Get metadata for a dictionary file, scanning it only if it changed.
+
+        Returns a dict with 'row_count', 'columns', 'delimiter' and 'valid',
+        or None if the file does not exist.
+        """
+        full_path = external_path(file_path)
+        try:
+            stat = os.stat(full_path)
+        except FileNotFoundError:
+            tracer.ic({"metadata_missing": full_path})
+            return None
+
+        with self._lock:
+            entries = self._load()
+            cached = entries.get(full_path)
+            if cached and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns:
+                tracer.ic({"metadata_hit": full_path})
+                return cached
+
+            metadata = self._scan(full_path, stat)
+            entries[full_path] = metadata
+            self._save()
+            return metadata
+
+    def invalidate(self, file_path=None):
+        """Drop one file (or everything) from the cache."""
+        with self._lock:
+            entries = self._load()
+            if file_path is None:
+                entries.clear()
+            else:
+                entries.pop(external_path(file_path), None)
+            self._save()
+
+    def _scan(self, full_path, stat):
+        """Read the header and count the data rows of a dictionary file."""
+        line_count = 0
+        last_byte = b"\n"
+        with open(full_path, "rb") as f:
+            header = f.readline()
+            f.seek(0)
+            while chunk := f.read(SCAN_CHUNK_SIZE):
+                line_count += chunk.count(b"\n")
+                last_byte = chunk[-1:]
+        if last_byte != b"\n":
+            line_count += 1  # Final line without trailing newline
+
+        header_text = header.decode("utf-8-sig", errors="replace").rstrip("\r\n")
+        delimiter = max(DELIMITER_CANDIDATES, key=header_text.count)
+        columns = [column.strip() for column in header_text.split(delimiter)] if header_text else []
+        required = {self.dict_config.WORD_1_COLUMN, self.dict_config.WORD_2_COLUMN}
+
+        metadata = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "row_count": max(0, line_count - 1),  # Header row is not an entry
+            "columns": columns,
+            "delimiter": delimiter,
+            "valid": required.issubset(columns),
+        }
+        tracer.ic({"metadata_scan": {"file": full_path, "rows": metadata["row_count"], "valid": metadata["valid"]}})
+        return metadata
+
+    def _load(self):
+        """Load the persisted cache once per process."""
+        if self._entries is None:
+            try:
+                with open(self.cache_path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        """Persist the cache atomically; failures only cost a rescan next launch."""
+        try:
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write metadata cache {self.cache_path}: {e}")
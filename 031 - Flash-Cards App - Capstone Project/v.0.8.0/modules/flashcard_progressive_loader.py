@@ -3,43 +3,67 @@ Progressive Dictionary Loading System for the Flashcard Application.
 Implements O(1) startup time with progressive content discovery.
 """
 
+import io
+import os
 import pandas as pd
 import random
 import threading
+from collections import deque
 from typing import List, Dict
-from .flashcard_config import DictionaryConfig, ProgressiveLoadingConfig, external_path
+from .card_logic import CompositePool, WeightedSampler
+from .flashcard_card_store import CardRecord, records_from_columns, records_from_dataframe, tag_languages
+from .flashcard_config import DictionaryConfig, ProgressiveLoadingConfig, TextRenderConfig, external_path
+from .flashcard_binary_cache import BinaryDictionary, cache_path_for
+from .flashcard_dictionary_io import CSV_KWARGS, prepare_dictionary_dataframe, read_dictionary_csv
+from .flashcard_sqlite_store import SQLiteDictionaryStore
+from .flashcard_eviction import LoadedBatch, create_eviction_policy
+from .flashcard_interval_set import IntervalSet
+from .flashcard_loader_worker import LoaderWorker, PRIORITY_ACTIVATE, PRIORITY_FLUSH, PRIORITY_REFILL
+from .flashcard_metadata_cache import DictionaryMetadataCache
+from .flashcard_row_index import RowOffsetIndex
+from .flashcard_text_renderer import detect_language, hyphenation_cache
 from .tracing import tracer
 
-# Fix: Remove the hardcoded 'sep' argument. It will be provided dynamically.
-CSV_KWARGS = dict(engine='python', on_bad_lines='skip', quotechar='"', escapechar='\\')
-
 class ProgressiveDictionaryManager:
     """
     Manages progressive loading of dictionary entries for O(1) performance.
 
     Features:
     - O(1) startup time regardless of dictionary size
-    - Progressive content discovery every 60 seconds
+    - Progressive content discovery every LOADING_INTERVAL seconds
+    - One persistent loader thread; activations run before background refills
     - Active dictionary focus (only loads selected dictionaries)
     - Random batch loading to ensure content variety
     - Constant memory usage
     """
 
-    def __init__(self, dict_config=None, loading_config=None):
+    def __init__(self, dict_config=None, loading_config=None, hyphenation=None):
         self.dict_config = dict_config or DictionaryConfig()
         self.loading_config = loading_config or ProgressiveLoadingConfig()
 
         # Core state management
         self.loaded_entries = {}      # dict_type -> list of entries
-        self.loaded_ranges = {}       # dict_type -> set of loaded ranges (start, end)
+        self.loaded_ranges = {}       # dict_type -> IntervalSet of loaded row ranges
+        self.loaded_batches = {}      # dict_type -> deque of LoadedBatch, oldest first
+        self.samplers = {}            # dict_type -> WeightedSampler over loaded_entries
+        self.entry_batches = {}       # id(entry) -> resident LoadedBatch holding it (see LoadedBatch.entry_ids)
+        self.entry_counts = {}        # dict_type -> number of loaded entries, kept up to date on load/evict
         self.total_entries = {}       # dict_type -> total count
         self.active_dictionaries = set()  # Currently selected dict types
+        self.row_indexes = {}         # dict_type -> RowOffsetIndex
+        self.binary_caches = {}       # dict_type -> memory-mapped BinaryDictionary (or SQLiteDictionary)
+        self.sqlite_store = None      # SQLiteDictionaryStore, opened on first use with the sqlite backend
+        self.pending_weights = {}     # dict_type -> {row position: weight} not yet written to the SQLite store
+        self.metadata_cache = DictionaryMetadataCache(self.dict_config)  # Survives cleanup()
+        self.eviction_policy = create_eviction_policy(self.loading_config.EVICTION_POLICY)
+        self.scheduler = None         # SpacedRepetitionScheduler whose weights apply to loaded entries
+        # HyphenationCache primed with loaded batches; saved by the application, not here
+        self.hyphenation = hyphenation if hyphenation is not None else hyphenation_cache(self.dict_config.HYPHENATION_CACHE_FILE)
 
         # Progressive loading state
-        self.loading_timer = None
-        self.loading_thread = None
-        self.is_loading = False
-        self.loading_lock = threading.Lock()
+        self.worker = None            # LoaderWorker, started on first use
+        self.refills_enabled = False  # Periodic background refills, see _schedule_progressive_loading
+        self.loading_lock = threading.RLock()  # Guards the per-dictionary stores
 
         # Performance tracking
         self.loading_stats = {
@@ -51,36 +75,87 @@ class ProgressiveDictionaryManager:
     def update_active_dictionaries(self, selected_types: List[str]) -> None:
         """
         Update which dictionaries are currently active and load initial batches.
+        Blocks until the loader worker has activated them.
+        """
+        self.activate_async(selected_types).wait()
+
+    def activate_async(self, selected_types: List[str], on_done=None):
         """
+        Update which dictionaries are active and queue their initial batches on the
+        loader worker, ahead of any background refills. Pending work for deselected
+        dictionaries is cancelled. `on_done(entries)` is called on the worker thread
+        with the available entries once all activations ran, unless the worker is
+        shutting down by then.
+        Returns the LoaderTask that completes last.
+        """
+        worker = self._get_worker()
         with self.loading_lock:
             newly_activated = set(selected_types) - self.active_dictionaries
             deactivated = self.active_dictionaries - set(selected_types)
             self.active_dictionaries = set(selected_types)
             tracer.ic({"update_active": {"new": list(newly_activated), "off": list(deactivated)}})
 
-            for dict_type in newly_activated:
-                if dict_type not in self.loaded_entries:
-                    self._load_initial_batch(dict_type)
-                    print(f"Dynamically activated {dict_type} dictionary")
-                else:
-                    print(f"Dynamically reactivated {dict_type} dictionary")
+        for dict_type in deactivated:
+            worker.cancel(dict_type)
+            print(f"Dynamically deactivated {dict_type} dictionary")
+
+        for dict_type in newly_activated:
+            worker.submit(PRIORITY_ACTIVATE, dict_type, self._activate_dictionary, dict_type)
+
+        def finish():
+            entries = self.get_available_entries(selected_types)
+            if on_done is not None and not worker.stopping:
+                on_done(entries)
+            return entries
+
+        if self.loading_config.BACKGROUND_LOADING:
+            self._schedule_progressive_loading()
+        return worker.submit(PRIORITY_ACTIVATE, None, finish)
 
-            for dict_type in deactivated:
-                print(f"Dynamically deactivated {dict_type} dictionary")
+    def _activate_dictionary(self, dict_type: str) -> None:
+        """
+        Load the initial batch of a dictionary unless it is still in memory (worker thread).
+        """
+        if dict_type not in self.active_dictionaries:
+            return
+        if dict_type not in self.loaded_entries:
+            self._load_initial_batch(dict_type)
+            print(f"Dynamically activated {dict_type} dictionary")
+        else:
+            print(f"Dynamically reactivated {dict_type} dictionary")
+
+    def submit(self, priority: int, key, func, *args):
+        """
+        Run func(*args) on the loader worker (e.g. a legacy load). Returns the LoaderTask.
+        """
+        return self._get_worker().submit(priority, key, func, *args)
+
+    def _get_worker(self) -> LoaderWorker:
+        """
+        Get the loader worker, starting it on first use (or after a shutdown).
+        """
+        if self.worker is None or not self.worker.alive or self.worker.stopping:
+            interval = self.loading_config.LOADING_INTERVAL if self.loading_config.ENABLE_PROGRESSIVE_LOADING else None
+            self.worker = LoaderWorker(interval, self._queue_refills).start()
+        return self.worker
 
-            if self.loading_config.BACKGROUND_LOADING:
-                self._schedule_progressive_loading()
+    def is_stopping(self) -> bool:
+        """
+        Whether the loader worker is shutting down; results must not be handed on then.
+        """
+        worker = self.worker
+        return worker is not None and worker.stopping
 
-    def get_available_entries(self, selected_types: List[str]) -> List[Dict]:
+    def get_available_entries(self, selected_types: List[str]) -> CompositePool:
         """
-        Get all currently loaded entries for the selected dictionary types.
+        Get a view over the currently loaded entries for the selected dictionary types.
+        The view shares the per-dictionary samplers, so batches loaded later show up in it.
         """
         with self.loading_lock:
-            combined_entries = []
-            for dict_type in selected_types:
-                if dict_type in self.loaded_entries:
-                    combined_entries.extend(self.loaded_entries[dict_type])
-            return combined_entries
+            return CompositePool(
+                [self.samplers[dict_type] for dict_type in selected_types if dict_type in self.samplers],
+                self.dict_config.WEIGHT_COLUMN,
+            )
 
     def _load_initial_batch(self, dict_type: str) -> None:
         """
@@ -95,56 +170,66 @@ class ProgressiveDictionaryManager:
             file_path = dict_info["file"]
             tracer.ic({"init_batch": {"dict": dict_type, "file": file_path}})
 
-            total_count = self._get_total_entry_count(dict_type, file_path)
-            self.total_entries[dict_type] = total_count
+            binary = self._get_binary_cache(dict_type, file_path)
+            if binary is not None:
+                total_count = binary.row_count
+            else:
+                total_count = self._get_total_entry_count(dict_type, file_path)
+            with self.loading_lock:
+                self.total_entries[dict_type] = total_count
             tracer.ic({"total_count": {"dict": dict_type, "total": total_count}})
 
             if total_count == 0:
                 print(f"Warning: Empty dictionary file: {file_path}")
                 return
 
+            self._reset_store(dict_type)
             if total_count <= self.loading_config.BATCH_SIZE:
                 entries = self._load_full_dictionary(dict_type, file_path)
-                self.loaded_entries[dict_type] = entries
-                self.loaded_ranges[dict_type] = {(0, total_count)}
-                print(f"Loaded entire {dict_type} dictionary ({len(entries)} entries)")
+                if entries:
+                    self._prime_hyphenation(entries)
+                    with self.loading_lock:
+                        self._store_batch(dict_type, 0, total_count, entries)
+                    print(f"Loaded entire {dict_type} dictionary ({len(entries)} entries)")
             else:
                 entries = self._load_random_batch(dict_type, file_path, total_count)
-                self.loaded_entries[dict_type] = entries
-                print(f"Loaded initial batch for {dict_type} ({len(entries)} entries)")
+                if entries:
+                    print(f"Loaded initial batch for {dict_type} ({len(entries)} entries)")
 
-            self.loading_stats['total_batches_loaded'] += 1
-            self.loading_stats['total_entries_loaded'] += len(entries)
+            if not entries:
+                # Nothing was read: leave no store behind, so the next activation retries
+                self._drop_store(dict_type)
+                return
+
+            with self.loading_lock:
+                self.loading_stats['total_batches_loaded'] += 1
+                self.loading_stats['total_entries_loaded'] += len(entries)
 
         except Exception as e:
             tracer.ic({"init_batch_error": str(e)})
             print(f"Error loading initial batch for {dict_type}: {e}")
-            self.loaded_entries[dict_type] = []
-            self.loaded_ranges[dict_type] = set()
+            self._drop_store(dict_type)
 
-    def _load_random_batch(self, dict_type: str, file_path: str, total_count: int) -> List[Dict]:
+    def _load_random_batch(self, dict_type: str, file_path: str, total_count: int) -> List[CardRecord]:
         """
-        Load a random batch of entries from a dictionary file.
+        Load a random batch of not yet loaded entries from a dictionary file
+        and append it to the dictionary's store.
         """
-        max_start = max(0, total_count - self.loading_config.BATCH_SIZE)
-        start_position = random.randint(0, max_start)
-        end_position = min(start_position + self.loading_config.BATCH_SIZE, total_count)
+        with self.loading_lock:
+            loaded = self.loaded_ranges.setdefault(dict_type, IntervalSet())
+            batch_range = self._choose_batch_range(loaded, total_count)
+        if batch_range is None:
+            tracer.ic({"random_batch": {"dict": dict_type, "fully_loaded": total_count}})
+            return []
+
+        start_position, end_position = batch_range
         tracer.ic({"random_batch": {"dict": dict_type, "start": start_position, "end": end_position}})
 
         try:
-            # Fix: Get the delimiter for the current dictionary
-            dict_info = self.dict_config.DICTIONARIES[dict_type]
-            delimiter = dict_info.get("delimiter", ",")
-
-            df = pd.read_csv(external_path(file_path), skiprows=range(1, start_position + 1),
-                           nrows=end_position - start_position, sep=delimiter, **CSV_KWARGS)
-
-            entries = self._process_dataframe(df, dict_info)
-
-            if dict_type not in self.loaded_ranges:
-                self.loaded_ranges[dict_type] = set()
-            self.loaded_ranges[dict_type].add((start_position, end_position))
-
+            entries = self._load_batch_range(dict_type, file_path, start_position, end_position)
+            self._prime_hyphenation(entries)
+            with self.loading_lock:
+                self._store_batch(dict_type, start_position, end_position, entries)
             return entries
 
         except Exception as e:
@@ -152,130 +237,436 @@ class ProgressiveDictionaryManager:
             print(f"Error loading random batch from {file_path}: {e}")
             return []
 
-    def _process_dataframe(self, df: pd.DataFrame, dict_info: Dict) -> List[Dict]:
+    def _prime_hyphenation(self, entries: List[CardRecord]) -> None:
         """
-        Apply common processing steps to a loaded dictionary DataFrame.
+        Precompute hyphenation points for long words of a freshly loaded batch (loader thread).
+        Only sides tagged German are hyphenated, so only those are primed.
+        """
+        if self.hyphenation is None or not TextRenderConfig.HYPHENATION_ENABLED:
+            return
+        try:
+            self.hyphenation.prime(text for entry in entries
+                                   for text, language in zip((entry.word_1, entry.word_2), entry.language or ())
+                                   if language == "de")
+        except Exception as e:
+            tracer.ic({"hyphenation_prime_error": str(e)})
+
+    def _reset_store(self, dict_type: str) -> None:
+        """
+        Create empty per-dictionary storage: entries, sampler, batch log and loaded ranges.
+        """
+        with self.loading_lock:
+            for batch in self.loaded_batches.get(dict_type, ()):
+                self._forget_batch_entries(batch)
+            self._unschedule(self.loaded_entries.get(dict_type, ()))
+            self._count_entries(dict_type, -len(self.loaded_entries.get(dict_type, ())))
+            self.loaded_entries[dict_type] = []
+            self.samplers[dict_type] = WeightedSampler(self.loaded_entries[dict_type], self.dict_config.WEIGHT_COLUMN)
+            self.loaded_batches[dict_type] = deque()
+            self.loaded_ranges[dict_type] = IntervalSet()
+
+    def _drop_store(self, dict_type: str) -> None:
+        """
+        Remove a dictionary's storage entirely, so it counts as not loaded.
+        """
+        with self.loading_lock:
+            for batch in self.loaded_batches.pop(dict_type, ()):
+                self._forget_batch_entries(batch)
+            entries = self.loaded_entries.pop(dict_type, ())
+            self._unschedule(entries)
+            self._count_entries(dict_type, -len(entries))
+            self.samplers.pop(dict_type, None)
+            self.loaded_ranges.pop(dict_type, None)
+
+    def _store_batch(self, dict_type: str, start: int, end: int, entries: List[CardRecord]) -> None:
+        """
+        Append a loaded batch to the dictionary's entries and sampler and record its range.
+        """
+        if dict_type not in self.loaded_entries:
+            self._reset_store(dict_type)
+
+        batch = LoadedBatch(start, end, len(entries), dict_type, [id(entry) for entry in entries])
+        self.samplers[dict_type].extend(entries)
+        self.loaded_batches[dict_type].append(batch)
+        self.loaded_ranges[dict_type].add(start, end)
+        self._count_entries(dict_type, len(entries))
+        self.entry_batches.update(dict.fromkeys(batch.entry_ids, batch))
+
+    def _evict_batch(self, dict_type: str) -> int:
+        """
+        Drop the batch chosen by the eviction policy. Returns the number of evicted entries.
+        """
+        batches = self.loaded_batches.get(dict_type)
+        victim = self.eviction_policy.select_victim(batches) if batches else None
+        if victim is None:
+            return 0
+
+        # Batches are stored contiguously in load order
+        offset = sum(batches[i].size for i in range(victim))
+        batch = batches[victim]
+        del batches[victim]
+        self._forget_batch_entries(batch)
+        self._unschedule(self.loaded_entries[dict_type][offset:offset + batch.size])
+        self.samplers[dict_type].remove_range(offset, offset + batch.size)
+        self._count_entries(dict_type, -batch.size)
+        tracer.ic({"evict_batch": {"dict": dict_type, "start": batch.start, "end": batch.end}})
+        return batch.size
+
+    def _count_entries(self, dict_type: str, delta: int) -> None:
+        """
+        Adjust the loaded entry count of a dictionary.
+        """
+        if not delta:
+            return
+        count = self.entry_counts.get(dict_type, 0) + delta
+        if count > 0:
+            self.entry_counts[dict_type] = count
+        else:
+            self.entry_counts.pop(dict_type, None)
+
+    def get_source_counts(self, selected_types: List[str] = None) -> Dict[str, int]:
+        """
+        Get the number of loaded entries per source, optionally only for the selected types.
+        Dictionaries that share a source are added up; a deselected dictionary that is
+        still in memory does not count. O(number of dictionaries) - the per-dictionary
+        counts are maintained as batches load and evict.
+        """
+        with self.loading_lock:
+            dict_types = self.entry_counts if selected_types is None else selected_types
+            counts = {}
+            for dict_type in dict_types:
+                count = self.entry_counts.get(dict_type, 0)
+                if count:
+                    source = self.dict_config.DICTIONARIES[dict_type]["source"]
+                    counts[source] = counts.get(source, 0) + count
+            return counts
+
+    def _forget_batch_entries(self, batch: LoadedBatch) -> None:
+        """
+        Remove the entry -> batch mapping for a batch that leaves memory.
+        Called while its entries are still referenced, so no id can have been reused yet.
+        """
+        entry_batches = self.entry_batches
+        for key in batch.entry_ids:
+            if entry_batches.get(key) is batch:
+                del entry_batches[key]
+
+    def _rotate_batches(self, dict_type: str, total_count: int) -> None:
+        """
+        Make room for the next batch by evicting batches chosen by the eviction policy,
+        starting a new pass over the dictionary once every row has been loaded.
+        """
+        loaded = self.loaded_ranges.setdefault(dict_type, IntervalSet())
+        batches = self.loaded_batches.get(dict_type, ())
+        resident_rows = sum(batch.end - batch.start for batch in batches)
+        if loaded.covered() >= total_count and resident_rows < total_count:
+            self._start_new_pass(dict_type)
+
+        evicted = 0
+        limit = self.loading_config.MAX_LOADED_ENTRIES - self.loading_config.BATCH_SIZE
+        while len(self.loaded_entries.get(dict_type, [])) > limit:
+            count = self._evict_batch(dict_type)
+            if not count:
+                break
+            evicted += count
+
+        if evicted:
+            print(f"Evicted {evicted} entries from {dict_type} ({self.eviction_policy.name} policy)")
+
+    def _start_new_pass(self, dict_type: str) -> None:
         """
-        if self.dict_config.WEIGHT_COLUMN not in df.columns:
-            df[self.dict_config.WEIGHT_COLUMN] = self.dict_config.DEFAULT_WEIGHT
+        Once every row has been loaded, make evicted rows eligible again.
+        Only the rows still in memory stay marked as loaded.
+        """
+        self.loaded_ranges[dict_type] = IntervalSet(
+            (batch.start, batch.end) for batch in self.loaded_batches.get(dict_type, ())
+        )
+        print(f"{dict_type}: full coverage reached, starting a new pass")
 
-        df[self.dict_config.SOURCE_COLUMN] = dict_info["source"]
-        df = self._apply_dynamic_weights(df)
+    def is_entry_loaded(self, entry: CardRecord, selected_types: List[str] = None) -> bool:
+        """
+        Whether an entry is still in memory (not evicted), optionally in one of the selected dictionaries.
+        """
+        batch = self.entry_batches.get(id(entry))
+        return batch is not None and (selected_types is None or batch.dict_type in selected_types)
 
-        return df.to_dict(orient="records")
+    def record_review(self, entry: CardRecord, known: bool) -> None:
+        """
+        Record a review outcome so review-aware eviction policies can use it.
+        """
+        batch = self.entry_batches.get(id(entry))
+        if batch is not None and known:
+            batch.known_count += 1
 
-    def _apply_dynamic_weights(self, df) -> pd.DataFrame:
+    def _choose_batch_range(self, loaded: IntervalSet, total_count: int):
         """
-        Apply dynamic weights based on content complexity and length.
+        Choose the next batch range - only from unloaded gaps when ranges are tracked.
         """
-        def calculate_dynamic_weight(row):
-            base_weight = 100
-            definition = str(row.get('Word_2', ''))
-            char_count = len(definition)
-            word_count = len(definition.split())
+        batch_size = self.loading_config.BATCH_SIZE
+        if self.loading_config.CACHE_LOADED_RANGES:
+            return loaded.choose_gap_range(total_count, batch_size)
 
-            paragraph_indicators = [';', '1)', '2)', '3)', '4)', '5)', '§', 'GG§', 'StGB']
-            has_paragraphs = any(indicator in definition for indicator in paragraph_indicators)
+        max_start = max(0, total_count - batch_size)
+        start_position = random.randint(0, max_start)
+        return start_position, min(start_position + batch_size, total_count)
+
+    def _load_batch_range(self, dict_type: str, file_path: str, start: int, end: int) -> List[CardRecord]:
+        """
+        Load rows [start, end) from the compiled cache, or by seeking through the
+        row index and parsing only those rows when the cache is missing or stale.
+        """
+        dict_info = self.dict_config.DICTIONARIES[dict_type]
+        binary = self._get_binary_cache(dict_type, file_path)
+        if binary is not None:
+            return self._process_binary_rows(binary.read_columns(start, end, self.dict_config.WEIGHT_COLUMN), dict_type)
 
-            legal_terms = ['StGB', 'GG§', 'Recht', 'Gesetz', 'Verfassung', 'Staat', 'Demokratie']
-            has_legal_terms = any(term in definition for term in legal_terms)
+        delimiter = dict_info.get("delimiter", ",")
+
+        raw = self._get_row_index(dict_type, file_path).read_rows(start, end - start)
+        df = pd.read_csv(io.BytesIO(raw), sep=delimiter, **CSV_KWARGS)
+
+        return self._process_dataframe(df, dict_type)
+
+    def _get_row_index(self, dict_type: str, file_path: str) -> RowOffsetIndex:
+        """
+        Get the byte-offset row index for a dictionary, rebuilding it if the file changed.
+        """
+        full_path = external_path(file_path)
+        index = self.row_indexes.get(dict_type)
+        if index is None or index.file_path != full_path:
+            index = RowOffsetIndex(full_path, self.loading_config)
+            self.row_indexes[dict_type] = index
+        return index.ensure_current()
 
-            weight = base_weight
+    def _get_binary_cache(self, dict_type: str, file_path: str):
+        """
+        Get the memory-mapped compiled cache for a dictionary, or None if it is
+        disabled, missing or older than the dictionary file.
+        With the sqlite storage backend, the imported SQLite copy takes its place.
+        """
+        if self.loading_config.STORAGE_BACKEND == "sqlite":
+            return self._get_sqlite_dictionary(dict_type, file_path)
+        if not self.loading_config.USE_BINARY_CACHE:
+            return None
+
+        source_path = external_path(file_path)
+        cache = self.binary_caches.get(dict_type)
+        if cache is not None:
+            try:
+                if cache.is_fresh(os.stat(source_path)):
+                    return cache
+            except OSError:
+                pass
+            cache.close()
+            del self.binary_caches[dict_type]
+
+        cache = BinaryDictionary.open_if_fresh(cache_path_for(dict_type, self.dict_config), source_path)
+        if cache is not None:
+            tracer.ic({"binary_cache": {"dict": dict_type, "rows": cache.row_count}})
+            self.binary_caches[dict_type] = cache
+        return cache
+
+    def _get_sqlite_dictionary(self, dict_type: str, file_path: str):
+        """
+        Get the dictionary's copy in the SQLite store, or None if it was not
+        imported or the dictionary file changed since (then the CSV is used).
+        """
+        source_path = external_path(file_path)
+        dictionary = self.binary_caches.get(dict_type)
+        if dictionary is not None:
+            try:
+                if dictionary.is_fresh(os.stat(source_path)):
+                    return dictionary
+            except OSError:
+                pass
+            del self.binary_caches[dict_type]
+
+        if self.sqlite_store is None:
+            self.sqlite_store = SQLiteDictionaryStore(dict_config=self.dict_config)
+        dictionary = self.sqlite_store.open_if_fresh(dict_type, source_path)
+        if dictionary is not None:
+            tracer.ic({"sqlite_store": {"dict": dict_type, "rows": dictionary.row_count}})
+            self.binary_caches[dict_type] = dictionary
+        return dictionary
+
+    def update_stored_weights(self, dict_type: str, weights) -> int:
+        """
+        Write (row position, weight) pairs into the SQLite store in place; batches
+        loaded afterwards see them. Returns 0 when the backend is not sqlite.
+        """
+        if self.loading_config.STORAGE_BACKEND != "sqlite":
+            return 0
+        with self.loading_lock:
+            dictionary = self._get_sqlite_dictionary(dict_type, self.dict_config.DICTIONARIES[dict_type]["file"])
+        if dictionary is None:
+            return 0
+        return self.sqlite_store.update_weights(dict_type, weights)
 
-            if char_count > 200: weight += 50
-            if char_count > 400: weight += 100
-            if char_count > 600: weight += 150
-            if has_paragraphs: weight += 100
-            if has_legal_terms: weight += 50
-            if word_count > 20: weight += 25
-            if word_count > 40: weight += 50
+    def store_weight(self, entry: CardRecord, weight: float) -> bool:
+        """
+        Queue an entry's new weight for the SQLite store, so its batch keeps the weight
+        when it is loaded again. The writes are buffered and flushed on the loader worker
+        at PRIORITY_FLUSH. Returns False when the backend is not sqlite or the entry is
+        not in memory.
+        """
+        if self.loading_config.STORAGE_BACKEND != "sqlite":
+            return False
+        with self.loading_lock:
+            batch = self.entry_batches.get(id(entry))
+            if batch is None:
+                return False
+            # Batch rows are stored in file order, so the entry's row is its offset in the batch
+            position = batch.start + batch.entry_ids.index(id(entry))
+            self.pending_weights.setdefault(batch.dict_type, {})[position] = weight
+        worker = self._get_worker()
+        if not worker.has_pending("stored_weights"):
+            worker.submit(PRIORITY_FLUSH, "stored_weights", self.flush_stored_weights)
+        return True
+
+    def flush_stored_weights(self) -> int:
+        """
+        Write the queued weights, one transaction per dictionary. Returns the number written.
+        """
+        with self.loading_lock:
+            pending, self.pending_weights = self.pending_weights, {}
+        written = 0
+        for dict_type, weights in pending.items():
+            try:
+                written += self.update_stored_weights(dict_type, weights.items())
+            except Exception as e:
+                tracer.ic({"stored_weights_error": str(e), "dict": dict_type})
+                print(f"Error writing weights of {dict_type} to the SQLite store: {e}")
+        return written
+
+    def _process_binary_rows(self, read_result, dict_type: str) -> List[CardRecord]:
+        """
+        Turn decoded columns from the compiled cache into card records.
+        Weights were already applied at compile time.
+        """
+        columns, count = read_result
+        records = records_from_columns(columns, count)
+        source = self.dict_config.DICTIONARIES[dict_type]["source"]
+        for record in records:
+            record.source = source
+        self._tag_records(records, dict_type)
+        # The SQLite store already holds the scheduled weights (see store_weight)
+        self._apply_schedule(records, scale=self.loading_config.STORAGE_BACKEND != "sqlite")
+        return records
+
+    def _process_dataframe(self, df: pd.DataFrame, dict_type: str) -> List[CardRecord]:
+        """
+        Apply common processing steps to a loaded dictionary DataFrame.
+        """
+        records = records_from_dataframe(self._prepare_dataframe(df, self.dict_config.DICTIONARIES[dict_type]))
+        self._tag_records(records, dict_type)
+        self._apply_schedule(records)
+        return records
 
-            return int(weight)
+    def _apply_schedule(self, records: List[CardRecord], scale: bool = True) -> None:
+        """
+        Scale the weights of reviewed cards by their spaced-repetition state and queue them by due time.
+        """
+        if self.scheduler is not None:
+            self.scheduler.apply(records, scale)
 
-        df[self.dict_config.WEIGHT_COLUMN] = df.apply(calculate_dynamic_weight, axis=1)
+    def _unschedule(self, records) -> None:
+        """
+        Take entries that leave memory out of the scheduler's due queue.
+        """
+        if self.scheduler is not None and records:
+            self.scheduler.forget(records)
 
-        weight_stats = df[self.dict_config.WEIGHT_COLUMN].describe()
-        if weight_stats['max'] > 200:
-            print(f"Dynamic weights applied - Min: {weight_stats['min']:.0f}, Max: {weight_stats['max']:.0f}, Mean: {weight_stats['mean']:.0f}")
+    def _tag_records(self, records: List[CardRecord], dict_type: str) -> None:
+        """
+        Tag each entry with its dictionary type and, once, its front/back language:
+        the dictionary's configured languages or, for mixed custom decks, a one-time
+        detection per entry.
+        """
+        dict_info = self.dict_config.DICTIONARIES[dict_type]
+        for record in records:
+            record.dict_type = dict_type
+        tag_languages(records, dict_info.get("front_language"), dict_info.get("back_language"), detect_language)
 
-        return df
+    def _prepare_dataframe(self, df: pd.DataFrame, dict_info: Dict) -> pd.DataFrame:
+        """
+        Add default weight and source columns and apply dynamic weights.
+        """
+        return prepare_dictionary_dataframe(df, dict_info, self.dict_config)
 
-    def _load_full_dictionary(self, dict_type: str, file_path: str) -> List[Dict]:
+    def _load_full_dictionary(self, dict_type: str, file_path: str) -> List[CardRecord]:
         """
         Load the entire dictionary file.
         """
         try:
             dict_info = self.dict_config.DICTIONARIES[dict_type]
-            delimiter = dict_info.get("delimiter", ",")
+            binary = self._get_binary_cache(dict_type, file_path)
+            if binary is not None:
+                tracer.ic({"full_load": {"dict": dict_type, "rows": binary.row_count, "binary": True}})
+                columns = binary.read_columns(0, binary.row_count, self.dict_config.WEIGHT_COLUMN)
+                return self._process_binary_rows(columns, dict_type)
 
-            df = pd.read_csv(external_path(file_path), sep=delimiter, **CSV_KWARGS)
+            df = self._read_dataframe(dict_type, file_path)
             tracer.ic({"full_load": {"dict": dict_type, "rows": len(df)}})
 
-            return self._process_dataframe(df, dict_info)
+            return self._process_dataframe(df, dict_type)
 
         except Exception as e:
             tracer.ic({"full_load_error": str(e)})
             print(f"Error loading full dictionary from {file_path}: {e}")
             return []
 
+    def _read_dataframe(self, dict_type: str, file_path: str) -> pd.DataFrame:
+        """
+        Parse the whole dictionary file with pandas.
+        """
+        return read_dictionary_csv(file_path, self.dict_config.DICTIONARIES[dict_type])
+
     def _get_total_entry_count(self, dict_type: str, file_path: str) -> int:
         """
-        Get the total number of entries in a dictionary file by efficiently counting lines.
+        Get the total number of entries in a dictionary file from the metadata cache.
+        Only scans the file when its size or mtime changed since the last scan.
         """
-        full_path = external_path(file_path)
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                # We subtract 1 to account for the header row
-                count = sum(1 for _ in f) - 1
-            tracer.ic({"count_rows": {"file": full_path, "rows": count}})
-            return max(0, count)
-        except FileNotFoundError:
-            tracer.ic({"count_error": "File not found", "file": full_path})
-            print(f"Error: Dictionary file not found at {full_path}")
-            return 0
+            metadata = self.metadata_cache.get(file_path)
+            if metadata is None:
+                print(f"Error: Dictionary file not found at {external_path(file_path)}")
+                return 0
+
+            expected_delimiter = self.dict_config.DICTIONARIES[dict_type].get("delimiter", ",")
+            if not metadata["valid"] or metadata["delimiter"] != expected_delimiter:
+                print(f"Warning: {file_path} does not look like a '{expected_delimiter}'-separated "
+                      f"dictionary (detected {metadata['delimiter']!r}, columns: {metadata['columns']})")
+                if not metadata["valid"]:
+                    return 0
+
+            tracer.ic({"count_rows": {"file": file_path, "rows": metadata["row_count"]}})
+            return metadata["row_count"]
         except Exception as e:
-            tracer.ic({"count_error": str(e), "file": full_path})
-            print(f"Error counting entries in {full_path}: {e}")
+            tracer.ic({"count_error": str(e), "file": file_path})
+            print(f"Error counting entries in {file_path}: {e}")
             return 0
     
     def _schedule_progressive_loading(self) -> None:
         """
-        Schedule periodic progressive loading of new batches.
+        Enable periodic progressive loading of new batches on the loader worker.
         """
         if not self.loading_config.ENABLE_PROGRESSIVE_LOADING:
             return
-        
-        if self.loading_timer:
-            self.loading_timer.cancel()
-        
-        self.loading_timer = threading.Timer(
-            self.loading_config.LOADING_INTERVAL,
-            self._progressive_load_next_batches
-        )
-        self.loading_timer.daemon = True
-        self.loading_timer.start()
-    
-    def _progressive_load_next_batches(self) -> None:
+        self.refills_enabled = True
+
+    def _queue_refills(self) -> None:
         """
-        Load next batches for all active dictionaries.
+        Queue one refill per active dictionary (worker thread, every LOADING_INTERVAL seconds).
+        A dictionary that still has a refill pending is skipped.
         """
-        if self.is_loading:
+        if not self.refills_enabled:
             return
-        
         with self.loading_lock:
-            self.is_loading = True
-        
-        try:
-            for dict_type in self.active_dictionaries:
-                if dict_type in self.total_entries:
-                    self._load_next_batch(dict_type)
-            
-            self._schedule_progressive_loading()
-            
-        finally:
-            with self.loading_lock:
-                self.is_loading = False
-    
+            active = [t for t in self.active_dictionaries if t in self.total_entries]
+        for dict_type in active:
+            if not self.worker.has_pending(dict_type, PRIORITY_REFILL):
+                self.worker.submit(PRIORITY_REFILL, dict_type, self._load_next_batch, dict_type)
+
     def _load_next_batch(self, dict_type: str) -> None:
         """
         Load the next batch for a specific dictionary.
@@ -291,20 +682,19 @@ class ProgressiveDictionaryManager:
             if total_count <= self.loading_config.BATCH_SIZE:
                 return
             
-            current_loaded = len(self.loaded_entries.get(dict_type, []))
-            if current_loaded >= self.loading_config.MAX_LOADED_ENTRIES:
+            if self.eviction_policy.enabled and total_count > self.loading_config.MAX_LOADED_ENTRIES:
+                with self.loading_lock:
+                    self._rotate_batches(dict_type, total_count)
+            elif len(self.loaded_entries.get(dict_type, [])) >= self.loading_config.MAX_LOADED_ENTRIES:
                 return
-            
+
             new_entries = self._load_random_batch(dict_type, file_path, total_count)
             
             if new_entries:
-                if dict_type not in self.loaded_entries:
-                    self.loaded_entries[dict_type] = []
-                self.loaded_entries[dict_type].extend(new_entries)
-                
-                self.loading_stats['total_batches_loaded'] += 1
-                self.loading_stats['total_entries_loaded'] += len(new_entries)
-                
+                with self.loading_lock:
+                    self.loading_stats['total_batches_loaded'] += 1
+                    self.loading_stats['total_entries_loaded'] += len(new_entries)
+
                 print(f"Progressive load: Added {len(new_entries)} entries to {dict_type} "
                       f"(total: {len(self.loaded_entries[dict_type])})")
             
@@ -318,28 +708,58 @@ class ProgressiveDictionaryManager:
         with self.loading_lock:
             stats = self.loading_stats.copy()
             stats['active_dictionaries'] = list(self.active_dictionaries)
+            stats['pending_tasks'] = self.worker.pending_count() if self.worker is not None else 0
             stats['loaded_entries_per_dict'] = {
                 dict_type: len(entries) 
                 for dict_type, entries in self.loaded_entries.items()
             }
             stats['total_entries_per_dict'] = self.total_entries.copy()
+            stats['loaded_entries_per_source'] = self.get_source_counts()
+            stats['coverage_per_dict'] = {
+                dict_type: round(100.0 * self.loaded_ranges[dict_type].covered() / total, 1) if total else 0.0
+                for dict_type, total in self.total_entries.items()
+                if dict_type in self.loaded_ranges
+            }
             return stats
     
     def stop_progressive_loading(self) -> None:
         """
-        Stop the progressive loading timer.
+        Stop periodic refills and drop the ones still queued.
         """
-        if self.loading_timer:
-            self.loading_timer.cancel()
-            self.loading_timer = None
+        self.refills_enabled = False
+        if self.worker is not None:
+            self.worker.cancel(priority=PRIORITY_REFILL)
     
     def cleanup(self) -> None:
         """
         Clean up resources and stop all loading operations.
+        Joins the loader worker for at most SHUTDOWN_TIMEOUT seconds. If a load is
+        still running then, the worker is left to exit with the process and the
+        dictionary files stay open for it.
         """
         self.stop_progressive_loading()
+        stopped = True
+        if self.worker is not None:
+            stopped = self.worker.shutdown(self.loading_config.SHUTDOWN_TIMEOUT)
+            if stopped:
+                self.worker = None
+            else:
+                tracer.ic({"loader_shutdown_timeout": self.loading_config.SHUTDOWN_TIMEOUT})
+                print(f"Warning: Background loader still busy after {self.loading_config.SHUTDOWN_TIMEOUT} s")
         with self.loading_lock:
             self.loaded_entries.clear()
             self.loaded_ranges.clear()
+            self.loaded_batches.clear()
+            self.samplers.clear()
+            self.entry_batches.clear()
+            self.entry_counts.clear()
             self.total_entries.clear()
-            self.active_dictionaries.clear()
\ No newline at end of file
+            self.active_dictionaries.clear()
+            if stopped:
+                self.flush_stored_weights()
+                for cache in self.binary_caches.values():
+                    cache.close()
+                if self.sqlite_store is not None:
+                    self.sqlite_store.close()
+            self.binary_caches.clear()
+            self.sqlite_store = None
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Per-card review event log for the Flashcard Application.
+Every mark_known/mark_unknown becomes a compact row (card id, dictionary, outcome,
+reaction time, timestamp) in an append-only SQLite table in WAL mode. Events
+are buffered in memory and written in one transaction every N events or T
+seconds on a background worker, so a click never waits for the disk.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+from .flashcard_card_store import card_id
+from .flashcard_config import StatisticsConfig, external_path
+from .flashcard_loader_worker import LoaderWorker, PRIORITY_FLUSH
+from .tracing import tracer
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    card_id INTEGER NOT NULL,
+    dict_type TEXT,
+    known INTEGER NOT NULL,
+    reaction_ms INTEGER NOT NULL,
+    reviewed_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reviews_card ON reviews (card_id, reviewed_at);
+"""
+INSERT = "INSERT INTO reviews (card_id, dict_type, known, reaction_ms, reviewed_at) VALUES (?, ?, ?, ?, ?)"
+
+# (card_id, dict_type, known, reaction_ms, reviewed_at in ms since the epoch); dict_type is None for API cards
+ReviewEvent = Tuple[int, Optional[str], int, int, int]
+
+
+class ReviewLog:
+    """Buffered writer for review events; flushes run on their own worker thread."""
+
+    def __init__(self, db_path=None, config=StatisticsConfig):
+        self.config = config
+        self.db_path = db_path or external_path(config.REVIEW_LOG_FILE)
+        self._buffer: List[ReviewEvent] = []
+        self._buffer_lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._connection = None
+        self.flushed_events = 0
+        self.flushes = 0
+        self.worker = LoaderWorker(config.REVIEW_LOG_FLUSH_INTERVAL, self.flush, name="flashcard-review-log").start()
+
+    def record(self, card, known: bool, reaction_time: float) -> None:
+        """Buffer one review (UI thread); `reaction_time` is in seconds."""
+        event = (card_id(card), getattr(card, "dict_type", None), int(known),
+                 int(round(reaction_time * 1000)), int(time.time() * 1000))
+        with self._buffer_lock:
+            self._buffer.append(event)
+            full = len(self._buffer) >= self.config.REVIEW_LOG_FLUSH_EVENTS
+        if full and not self.worker.has_pending("flush"):
+            self.worker.submit(PRIORITY_FLUSH, "flush", self.flush)
+
+    def pending_events(self) -> int:
+        with self._buffer_lock:
+            return len(self._buffer)
+
+    def flush(self) -> int:
+        """Write all buffered events in one transaction. Returns the number written."""
+        with self._buffer_lock:
+            events, self._buffer = self._buffer, []
+        if not events:
+            return 0
+
+        try:
+            with self._db_lock:
+                connection = self._connect()
+                with connection:
+                    connection.executemany(INSERT, events)
+        except sqlite3.Error as e:
+            with self._buffer_lock:
+                self._buffer[:0] = events  # Keep them for the next attempt
+            tracer.ic({"review_log_error": str(e)})
+            print(f"Error writing review log {self.db_path}: {e}")
+            return 0
+
+        self.flushed_events += len(events)
+        self.flushes += 1
+        tracer.ic({"review_log_flush": len(events)})
+        return len(events)
+
+    def read_events(self, card=None) -> List[ReviewEvent]:
+        """Flushed events, oldest first - all of them or those of one card."""
+        with self._db_lock:
+            connection = self._connect()
+            query = "SELECT card_id, dict_type, known, reaction_ms, reviewed_at FROM reviews"
+            if card is None:
+                return connection.execute(query + " ORDER BY rowid").fetchall()
+            return connection.execute(query + " WHERE card_id = ? ORDER BY reviewed_at", (card_id(card),)).fetchall()
+
+    def close(self) -> None:
+        """Stop the flush worker, write what is left and close the database."""
+        self.worker.shutdown()
+        self.flush()
+        with self._db_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self):
+        """Open the database on first use (callers hold _db_lock)."""
+        if self._connection is None:
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; fsync at checkpoints
+            columns = [row[1] for row in connection.execute("PRAGMA table_info(reviews)")]
+            if "source" in columns:  # Logs written before dict_type was recorded
+                connection.execute("ALTER TABLE reviews RENAME COLUMN source TO dict_type")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
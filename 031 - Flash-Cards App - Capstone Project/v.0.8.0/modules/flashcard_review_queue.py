@@ -0,0 +1,117 @@
+"""
+Due-card queue for scheduled review in the Flashcard Application.
+A min-heap of (due time, sequence, card id) answers "which card is due next"
+in O(log n). Rescheduling pushes a new heap item and leaves the old one in
+place; stale items are recognised on pop by comparing against the current due
+time per card (lazy invalidation), so no O(n) heap search is ever needed.
+"""
+
+import heapq
+import itertools
+import threading
+from typing import Callable, Iterable, Optional, Tuple
+from .flashcard_card_store import card_id
+
+
+class DueQueue:
+    """Cards keyed by their stable id, ordered by due time (seconds since the epoch)."""
+
+    def __init__(self):
+        self._heap = []  # (due, sequence, card_id); may hold stale items
+        self._entries = {}  # card_id -> (due, card) - the live schedule
+        self._sequence = itertools.count()  # Tie-breaker, cards never get compared
+        self._lock = threading.Lock()
+
+    def push(self, card, due: float, key: Optional[int] = None) -> None:
+        """Schedule a card, replacing its previous due time. O(log n)."""
+        key = card_id(card) if key is None else key
+        with self._lock:
+            self._entries[key] = (due, card)
+            heapq.heappush(self._heap, (due, next(self._sequence), key))
+            if len(self._heap) > 2 * len(self._entries) + 64:
+                self._compact()
+
+    reschedule = push
+
+    def load(self, items: Iterable[Tuple[object, float, int]]) -> None:
+        """Bulk-schedule (card, due, card id) triples: one O(n) heapify instead of n pushes."""
+        with self._lock:
+            for card, due, key in items:
+                self._entries[key] = (due, card)
+                self._heap.append((due, next(self._sequence), key))
+            heapq.heapify(self._heap)
+
+    def remove(self, card) -> None:
+        """Unschedule a card; its heap item is skipped when it reaches the top."""
+        with self._lock:
+            self._entries.pop(card_id(card), None)
+
+    def discard(self, cards: Iterable) -> int:
+        """
+        Unschedule cards that leave memory (an evicted batch), so the queue does not
+        keep them alive. A card id scheduled with a different object - the same card
+        loaded again since - is kept. Returns the number of unscheduled cards.
+        """
+        removed = 0
+        with self._lock:
+            entries = self._entries
+            for card in cards:
+                key = card_id(card)
+                entry = entries.get(key)
+                if entry is not None and entry[1] is card:
+                    del entries[key]
+                    removed += 1
+            if removed and len(self._heap) > 2 * len(entries) + 64:
+                self._compact()
+        return removed
+
+    def pop_due(self, now: float, accept: Optional[Callable] = None):
+        """
+        Remove and return the card that has been due the longest, or None if no
+        card is due at `now`. Due cards rejected by `accept(card)` (e.g. in a
+        deselected dictionary) stay scheduled and are offered again on later calls;
+        each call costs O(log n) per rejected due card.
+        `accept` runs under the queue lock and must not block.
+        """
+        with self._lock:
+            heap = self._heap
+            rejected = []
+            try:
+                while heap:
+                    due, _, key = heap[0]
+                    entry = self._entries.get(key)
+                    if entry is None or entry[0] != due:
+                        heapq.heappop(heap)  # Stale: rescheduled or removed since this push
+                        continue
+                    if due > now:
+                        return None
+                    item = heapq.heappop(heap)
+                    card = entry[1]
+                    if accept is None or accept(card):
+                        del self._entries[key]
+                        return card
+                    rejected.append(item)
+                return None
+            finally:
+                for item in rejected:
+                    heapq.heappush(heap, item)
+
+    def next_due_time(self) -> Optional[float]:
+        """Due time of the next scheduled card, or None if nothing is scheduled."""
+        with self._lock:
+            heap = self._heap
+            while heap:
+                due, _, key = heap[0]
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == due:
+                    return due
+                heapq.heappop(heap)
+            return None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _compact(self):
+        """Drop stale heap items once they outnumber the live ones (callers hold the lock)."""
+        self._heap = [(due, next(self._sequence), key) for key, (due, _) in self._entries.items()]
+        heapq.heapify(self._heap)
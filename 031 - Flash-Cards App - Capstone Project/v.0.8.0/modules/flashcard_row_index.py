@@ -0,0 +1,138 @@
+"""
+Byte-offset row index for dictionary files.
+Stores the byte offset of every Nth data row in a sidecar file next to the
+dictionary, so a batch can seek straight to its first row instead of
+re-tokenizing the file from the top.
+"""
+
+import os
+import struct
+import threading
+from array import array
+from .flashcard_config import ProgressiveLoadingConfig
+from .tracing import tracer
+
+
+class RowOffsetIndex:
+    """
+    Sparse row -> byte offset index persisted as '<dictionary file><suffix>'.
+
+    The sidecar records the size and mtime of the dictionary it was built from
+    and is rebuilt automatically as soon as the dictionary file changes.
+    """
+
+    MAGIC = b"FCIDX1\0\0"
+    # magic, stride, file size, file mtime (ns), row count, header length
+    HEADER_FORMAT = "<8sIQQQQ"
+    HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+    def __init__(self, file_path, loading_config=None):
+        self.loading_config = loading_config or ProgressiveLoadingConfig()
+        self.file_path = file_path
+        self.index_path = file_path + self.loading_config.ROW_INDEX_SUFFIX
+        self.stride = self.loading_config.ROW_INDEX_STRIDE
+
+        self.file_size = -1
+        self.file_mtime_ns = -1
+        self.row_count = 0
+        self.header = b""
+        self.offsets = array("Q")
+        self._lock = threading.Lock()
+
+    def ensure_current(self):
+        """Load the sidecar, rebuilding it first if the dictionary file has changed."""
+        with self._lock:
+            stat = os.stat(self.file_path)
+            if (stat.st_size, stat.st_mtime_ns) == (self.file_size, self.file_mtime_ns):
+                return self
+            if not self._load(stat):
+                self._build(stat)
+            return self
+
+    def read_rows(self, start, count):
+        """
+        Return the header line plus `count` raw data rows starting at row `start`.
+        The result can be handed directly to a CSV parser.
+        """
+        self.ensure_current()
+        start = max(0, min(start, self.row_count))
+        count = max(0, min(count, self.row_count - start))
+
+        anchor = start // self.stride
+        with open(self.file_path, "rb") as f:
+            f.seek(self.offsets[anchor])
+            for _ in range(start - anchor * self.stride):
+                f.readline()
+            lines = [f.readline() for _ in range(count)]
+
+        return self.header + b"".join(lines)
+
+    def _load(self, stat):
+        """Load an existing sidecar. Returns False if it is missing, corrupt or stale."""
+        try:
+            with open(self.index_path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return False
+
+        if len(raw) < self.HEADER_SIZE:
+            return False
+
+        magic, stride, size, mtime_ns, row_count, header_len = struct.unpack_from(self.HEADER_FORMAT, raw)
+        if magic != self.MAGIC or stride != self.stride:
+            return False
+        if (size, mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            tracer.ic({"row_index_stale": self.index_path})
+            return False
+
+        header_end = self.HEADER_SIZE + header_len
+        offsets = array("Q")
+        try:
+            offsets.frombytes(raw[header_end:])
+        except ValueError:
+            return False
+        if len(offsets) != row_count // stride + 1:
+            return False
+
+        self.header = raw[self.HEADER_SIZE:header_end]
+        self.offsets = offsets
+        self.row_count = row_count
+        self.file_size, self.file_mtime_ns = size, mtime_ns
+        tracer.ic({"row_index_loaded": {"file": self.file_path, "rows": row_count}})
+        return True
+
+    def _build(self, stat):
+        """Scan the dictionary once and write a fresh sidecar."""
+        offsets = array("Q")
+        row_count = 0
+
+        with open(self.file_path, "rb") as f:
+            header = f.readline()
+            position = f.tell()
+            for line in f:
+                if row_count % self.stride == 0:
+                    offsets.append(position)
+                position += len(line)
+                row_count += 1
+
+        # Anchor for the position just past the last row
+        if row_count % self.stride == 0:
+            offsets.append(position)
+
+        self.header = header
+        self.offsets = offsets
+        self.row_count = row_count
+        self.file_size, self.file_mtime_ns = stat.st_size, stat.st_mtime_ns
+        tracer.ic({"row_index_built": {"file": self.file_path, "rows": row_count, "anchors": len(offsets)}})
+
+        try:
+            tmp_path = self.index_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(struct.pack(self.HEADER_FORMAT, self.MAGIC, self.stride, stat.st_size,
+                                    stat.st_mtime_ns, row_count, len(header)))
+                f.write(header)
+                offsets.tofile(f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            # The in-memory index is still valid, only persistence failed
+            print(f"Warning: Could not write row index {self.index_path}: {e}")
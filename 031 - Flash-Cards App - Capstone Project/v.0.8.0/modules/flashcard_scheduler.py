@@ -0,0 +1,228 @@
+"""
+Spaced-repetition scheduling for the Flashcard Application.
+An SM-2 scheduler turns every known/unknown click into a per-card state
+(ease, interval, due time) held in memory. The state scales the card's
+sampling weight - unknown cards come back more often, well-known ones
+rarely - and is written back in batches to a sidecar SQLite store keyed by
+the stable card id, so the dictionary files are never rewritten.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+from .flashcard_card_store import card_id
+from .flashcard_config import DictionaryConfig, SchedulerConfig, external_path
+from .flashcard_loader_worker import LoaderWorker, PRIORITY_FLUSH
+from .flashcard_review_queue import DueQueue
+from .tracing import tracer
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS card_state (
+    card_id INTEGER PRIMARY KEY,
+    ease REAL NOT NULL,
+    interval REAL NOT NULL,
+    repetitions INTEGER NOT NULL,
+    lapses INTEGER NOT NULL,
+    due INTEGER NOT NULL,
+    reviewed_at INTEGER NOT NULL
+);
+"""
+COLUMNS = ("ease", "interval", "repetitions", "lapses", "due", "reviewed_at")
+UPSERT = f"INSERT OR REPLACE INTO card_state (card_id, {', '.join(COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+SECONDS_PER_DAY = 86400
+
+
+class CardState:
+    """SM-2 state of one card; `interval` is in days, `due` and `reviewed_at` in seconds since the epoch."""
+
+    __slots__ = COLUMNS
+
+    def __init__(self, ease, interval=0.0, repetitions=0, lapses=0, due=0, reviewed_at=0):
+        self.ease = ease
+        self.interval = interval
+        self.repetitions = repetitions
+        self.lapses = lapses
+        self.due = due
+        self.reviewed_at = reviewed_at
+
+    def as_row(self, key):
+        return (key, self.ease, self.interval, self.repetitions, self.lapses, self.due, self.reviewed_at)
+
+    def __repr__(self):
+        return f"CardState({', '.join(f'{name}={getattr(self, name)!r}' for name in COLUMNS)})"
+
+
+class SchedulerStore:
+    """Sidecar SQLite table of card states (WAL mode)."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[int, CardState]:
+        with self._lock:
+            rows = self._connect().execute(f"SELECT card_id, {', '.join(COLUMNS)} FROM card_state").fetchall()
+        return {row[0]: CardState(*row[1:]) for row in rows}
+
+    def save(self, rows: List[tuple]) -> None:
+        """Upsert (card_id, *state) rows in one transaction."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(UPSERT, rows)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self):
+        if self._connection is None:
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+
+class SpacedRepetitionScheduler:
+    """
+    SM-2 over binary outcomes: "known" is quality 5 (fast) or 4, "unknown" is
+    SchedulerConfig.QUALITY_UNKNOWN. Reviews update the in-memory state on the
+    UI thread; changed states are flushed every FLUSH_STATES reviews or
+    FLUSH_INTERVAL seconds on a worker thread.
+    """
+
+    def __init__(self, db_path=None, config=SchedulerConfig, weight_key=DictionaryConfig.WEIGHT_COLUMN):
+        self.config = config
+        self.weight_key = weight_key
+        self.store = SchedulerStore(db_path or external_path(config.STATE_FILE))
+        self.states: Dict[int, CardState] = {}
+        self._dirty = set()
+        self._lock = threading.Lock()
+        self.queue = DueQueue()  # Loaded cards with a state, by due time
+        try:
+            self.states = self.store.load()
+        except sqlite3.Error as e:
+            tracer.ic({"scheduler_load_error": str(e)})
+            print(f"Error reading scheduler state {self.store.db_path}: {e}")
+        self.worker = LoaderWorker(config.FLUSH_INTERVAL, self.flush, name="flashcard-scheduler").start()
+
+    def get_state(self, card) -> Optional[CardState]:
+        return self.states.get(card_id(card))
+
+    def review(self, card, known: bool, reaction_time: float, now: Optional[float] = None) -> float:
+        """
+        Apply one review to the card's state and return its new sampling weight.
+        The caller passes the weight on to the sampler (see CompositePool.update_weight).
+        """
+        now = time.time() if now is None else now
+        key = card_id(card)
+        with self._lock:
+            state = self.states.get(key)
+            old_factor = self.weight_factor(state)
+            if state is None:
+                state = self.states[key] = CardState(self.config.INITIAL_EASE)
+            self._update(state, self._quality(known, reaction_time), now)
+            self._dirty.add(key)
+            dirty = len(self._dirty)
+        self.queue.reschedule(card, state.due, key)
+
+        if dirty >= self.config.FLUSH_STATES and not self.worker.has_pending("flush"):
+            self.worker.submit(PRIORITY_FLUSH, "flush", self.flush)
+
+        weight = card.get(self.weight_key, DictionaryConfig.DEFAULT_WEIGHT)
+        return weight / old_factor * self.weight_factor(state)
+
+    def _quality(self, known, reaction_time):
+        if not known:
+            return self.config.QUALITY_UNKNOWN
+        return 5 if reaction_time <= self.config.EASY_REACTION_TIME else 4
+
+    def _update(self, state, quality, now):
+        """The SM-2 step: ease from the recall quality, interval from the repetition count."""
+        state.ease = max(self.config.MIN_EASE, state.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        if quality < 3:
+            state.repetitions = 0
+            state.lapses += 1
+            state.interval = self.config.LAPSE_INTERVAL
+        else:
+            state.repetitions += 1
+            first_intervals = self.config.FIRST_INTERVALS
+            if state.repetitions <= len(first_intervals):
+                state.interval = first_intervals[state.repetitions - 1]
+            else:
+                state.interval = round(state.interval * state.ease, 2)
+        state.reviewed_at = int(now)
+        state.due = int(now + state.interval * SECONDS_PER_DAY)
+
+    def weight_factor(self, state: Optional[CardState]) -> float:
+        """Multiplier on the dictionary weight: 1 for unseen cards, high after a lapse, ~1/interval when known."""
+        if state is None:
+            return 1.0
+        if state.repetitions == 0:
+            return self.config.LAPSE_WEIGHT_FACTOR if state.lapses else 1.0
+        return max(self.config.MIN_WEIGHT_FACTOR, 1.0 / (1.0 + state.interval))
+
+    def apply(self, records: Iterable, scale: bool = True) -> int:
+        """
+        Scale freshly loaded records by their persisted state and add them to the
+        due queue (loader thread). Records whose stored weight already includes the
+        state (SQLite backend) are only queued, with scale=False.
+        Returns the number of records with a state.
+        """
+        if not self.states:
+            return 0
+        scheduled = []
+        for record in records:
+            key = card_id(record)
+            state = self.states.get(key)
+            if state is not None:
+                if scale:
+                    record[self.weight_key] = record.get(self.weight_key, DictionaryConfig.DEFAULT_WEIGHT) * self.weight_factor(state)
+                scheduled.append((record, state.due, key))
+        if scheduled:
+            self.queue.load(scheduled)
+        return len(scheduled)
+
+    def forget(self, records: Iterable) -> int:
+        """
+        Drop records that leave memory (evicted batches) from the due queue (loader thread).
+        Their state is kept; apply() schedules them again when they are reloaded.
+        """
+        return self.queue.discard(records)
+
+    def next_due(self, now: Optional[float] = None, accept=None):
+        """The loaded card that has been due the longest, or None when nothing is due."""
+        return self.queue.pop_due(time.time() if now is None else now, accept)
+
+    def flush(self) -> int:
+        """Write changed states in one transaction. Returns the number written."""
+        with self._lock:
+            keys, self._dirty = self._dirty, set()
+            rows = [self.states[key].as_row(key) for key in keys]
+        if not rows:
+            return 0
+
+        try:
+            self.store.save(rows)
+        except sqlite3.Error as e:
+            with self._lock:
+                self._dirty |= keys
+            tracer.ic({"scheduler_flush_error": str(e)})
+            print(f"Error writing scheduler state {self.store.db_path}: {e}")
+            return 0
+
+        tracer.ic({"scheduler_flush": len(rows)})
+        return len(rows)
+
+    def close(self) -> None:
+        """Stop the flush worker, write the remaining states and close the store."""
+        self.worker.shutdown()
+        self.flush()
+        self.store.close()
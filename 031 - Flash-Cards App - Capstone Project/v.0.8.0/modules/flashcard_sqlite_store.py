@@ -0,0 +1,290 @@
+"""
+SQLite dictionary store for the Flashcard Application.
+Optional storage backend (ProgressiveLoadingConfig.STORAGE_BACKEND = "sqlite"):
+every configured dictionary is imported into one database with indexes on
+source, part of speech and weight. Each dictionary occupies a contiguous rowid
+range, so a random batch is a primary-key range scan, and weights can be
+updated in place without rewriting the dictionary files.
+
+Usage:
+    python -m modules.flashcard_sqlite_store              # import stale dictionaries
+    python -m modules.flashcard_sqlite_store --force      # re-import everything
+    python -m modules.flashcard_sqlite_store --reweight   # recompute dynamic weights in place
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import pandas as pd
+from .flashcard_config import DictionaryConfig, ProgressiveLoadingConfig, WeightingConfig, external_path
+from .flashcard_dictionary_io import read_dictionary_csv
+from .flashcard_weighting import compute_dynamic_weights
+from .tracing import tracer
+
+# CSV column -> SQL column; anything else goes into the JSON `extra` column
+STORE_COLUMNS = {
+    DictionaryConfig.WORD_1_COLUMN: "word_1",
+    DictionaryConfig.PART_1_COLUMN: "part_1",
+    DictionaryConfig.WORD_2_COLUMN: "word_2",
+    DictionaryConfig.PART_2_COLUMN: "part_2",
+    DictionaryConfig.WEIGHT_COLUMN: "weight",
+    "Text_constants_front": "text_constants_front",
+    "Text_constants_back": "text_constants_back",
+}
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS dictionaries (
+    dict_type TEXT PRIMARY KEY,
+    first_rowid INTEGER NOT NULL,
+    row_count INTEGER NOT NULL,
+    columns TEXT NOT NULL,
+    source_size INTEGER NOT NULL,
+    source_mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cards (
+    id INTEGER PRIMARY KEY,
+    dict_type TEXT NOT NULL,
+    source TEXT,
+    {", ".join(f"{column} {'REAL' if column == 'weight' else 'TEXT'}" for column in STORE_COLUMNS.values())},
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS cards_source ON cards (source);
+CREATE INDEX IF NOT EXISTS cards_part ON cards (part_1);
+CREATE INDEX IF NOT EXISTS cards_weight ON cards (weight);
+"""
+INSERT = (f"INSERT INTO cards (id, dict_type, source, {', '.join(STORE_COLUMNS.values())}, extra) "
+          f"VALUES ({', '.join('?' * (len(STORE_COLUMNS) + 4))})")
+
+
+def _sql_value(value):
+    """NaN (pandas' missing value) -> NULL."""
+    return None if value is None or (isinstance(value, float) and value != value) else value
+
+
+class SQLiteDictionary:
+    """
+    One imported dictionary: rows [0, row_count) live at rowids first_rowid + position.
+    Same read interface as BinaryDictionary, so the loader treats both alike.
+    """
+
+    def __init__(self, store, dict_type, first_rowid, row_count, columns, source_size, source_mtime_ns):
+        self.store = store
+        self.dict_type = dict_type
+        self.first_rowid = first_rowid
+        self.row_count = row_count
+        self.columns = columns
+        self.source_size = source_size
+        self.source_mtime_ns = source_mtime_ns
+
+    def is_fresh(self, stat):
+        """Check the recorded source size and mtime against a stat() of the source file."""
+        return (stat.st_size, stat.st_mtime_ns) == (self.source_size, self.source_mtime_ns)
+
+    def read_columns(self, start, end, weight_column):
+        """
+        Fetch rows [start, end) by rowid range.
+        Returns (column name -> list of values, row count) with the same values the CSV path produces.
+        """
+        start = max(0, min(start, self.row_count))
+        end = max(start, min(end, self.row_count))
+        stored = [column for column in self.columns if column in STORE_COLUMNS]
+        extras = [column for column in self.columns if column not in STORE_COLUMNS]
+        select = [STORE_COLUMNS[column] for column in stored] + (["extra"] if extras else [])
+
+        rows = self.store.fetch_range(self.first_rowid + start, self.first_rowid + end, select)
+        nan = float("nan")
+        columns = {}
+        for i, column in enumerate(stored):
+            columns[column] = [nan if row[i] is None else row[i] for row in rows]
+        if extras:
+            decoded = [json.loads(row[-1]) if row[-1] else {} for row in rows]
+            for column in extras:
+                columns[column] = [nan if values.get(column) is None else values[column] for values in decoded]
+        if weight_column in columns:
+            columns[weight_column] = [float(w) for w in columns[weight_column]]
+        return columns, len(rows)
+
+    def close(self):
+        """The connection belongs to the store; nothing to release per dictionary."""
+
+
+class SQLiteDictionaryStore:
+    """All dictionaries in one SQLite database (WAL mode); thread-safe through one lock."""
+
+    def __init__(self, db_path=None, dict_config=None):
+        self.dict_config = dict_config or DictionaryConfig()
+        self.db_path = db_path or external_path(self.dict_config.SQLITE_DB_FILE)
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Open the database on first use (callers hold _lock)."""
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def dictionary(self, dict_type):
+        """The imported dictionary, or None if it was never imported."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT first_rowid, row_count, columns, source_size, source_mtime_ns FROM dictionaries WHERE dict_type = ?",
+                (dict_type,),
+            ).fetchone()
+        if row is None:
+            return None
+        first_rowid, row_count, columns, size, mtime_ns = row
+        return SQLiteDictionary(self, dict_type, first_rowid, row_count, json.loads(columns), size, mtime_ns)
+
+    def open_if_fresh(self, dict_type, source_path):
+        """The imported dictionary if it matches the source file's size and mtime, else None."""
+        try:
+            stat = os.stat(source_path)
+            dictionary = self.dictionary(dict_type)
+        except (OSError, sqlite3.Error):
+            return None
+        if dictionary is None or not dictionary.is_fresh(stat):
+            tracer.ic({"sqlite_store_stale": dict_type})
+            return None
+        return dictionary
+
+    def fetch_range(self, first, stop, select):
+        """Rows with first <= rowid < stop, in rowid order - a primary-key range scan."""
+        with self._lock:
+            return self._connect().execute(
+                f"SELECT {', '.join(select)} FROM cards WHERE id >= ? AND id < ? ORDER BY id", (first, stop)
+            ).fetchall()
+
+    def import_dictionary(self, dict_type, chunk_size=None, loading_config=None):
+        """
+        Stream a dictionary file into the store in chunks of `chunk_size` rows
+        (pandas chunked reader + executemany), replacing a previous import in one
+        transaction. Weights get the same dynamic weighting as the CSV path.
+        Returns the number of imported rows.
+        """
+        chunk_size = chunk_size or (loading_config or ProgressiveLoadingConfig).SQLITE_IMPORT_CHUNK_SIZE
+        dict_info = self.dict_config.DICTIONARIES[dict_type]
+        source_path = external_path(dict_info["file"])
+        stat = os.stat(source_path)
+        source = dict_info["source"]
+        weight_column = self.dict_config.WEIGHT_COLUMN
+
+        reader = read_dictionary_csv(dict_info["file"], dict_info, chunksize=chunk_size)
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM cards WHERE dict_type = ?", (dict_type,))
+                first_rowid = connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM cards").fetchone()[0]
+                position = 0
+                columns = None
+                for df in reader:
+                    texts = df[WeightingConfig.TEXT_COLUMN] if WeightingConfig.TEXT_COLUMN in df.columns \
+                        else pd.Series("", index=df.index)
+                    df[weight_column] = compute_dynamic_weights(texts)
+                    if columns is None:
+                        columns = [column for column in df.columns if column != self.dict_config.SOURCE_COLUMN]
+                    connection.executemany(INSERT, self._rows(df, columns, dict_type, source, first_rowid + position))
+                    position += len(df)
+
+                connection.execute(
+                    "INSERT OR REPLACE INTO dictionaries VALUES (?, ?, ?, ?, ?, ?)",
+                    (dict_type, first_rowid, position, json.dumps(columns or []), stat.st_size, stat.st_mtime_ns),
+                )
+        tracer.ic({"sqlite_import": {"dict": dict_type, "rows": position}})
+        return position
+
+    @staticmethod
+    def _rows(df, columns, dict_type, source, first_id):
+        """INSERT parameters for one chunk, column by column."""
+        count = len(df)
+        values = {column: df[column].tolist() for column in columns}
+        stored = [values[column] if column in values else [None] * count for column in STORE_COLUMNS]
+        extras = [column for column in columns if column not in STORE_COLUMNS]
+        for i in range(count):
+            extra = {column: _sql_value(values[column][i]) for column in extras}
+            yield (first_id + i, dict_type, source, *(_sql_value(column[i]) for column in stored),
+                   json.dumps(extra, ensure_ascii=False) if extras else None)
+
+    def update_weights(self, dict_type, weights):
+        """Set weights in place from (position, weight) pairs. Returns the number of updated rows."""
+        dictionary = self.dictionary(dict_type)
+        if dictionary is None:
+            return 0
+        params = [(float(weight), dictionary.first_rowid + position) for position, weight in weights
+                  if 0 <= position < dictionary.row_count]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany("UPDATE cards SET weight = ? WHERE id = ?", params)
+        return len(params)
+
+    def reweight(self, dict_type, chunk_size=None):
+        """Recompute dynamic weights (e.g. after changing WeightingConfig) without re-importing."""
+        chunk_size = chunk_size or ProgressiveLoadingConfig.SQLITE_IMPORT_CHUNK_SIZE
+        dictionary = self.dictionary(dict_type)
+        if dictionary is None:
+            return 0
+        text_column = STORE_COLUMNS.get(WeightingConfig.TEXT_COLUMN)
+        updated = 0
+        for start in range(0, dictionary.row_count, chunk_size):
+            first = dictionary.first_rowid + start
+            rows = self.fetch_range(first, first + chunk_size, [text_column or "NULL"])
+            weights = compute_dynamic_weights(pd.Series([row[0] if row[0] is not None else "" for row in rows]))
+            updated += self.update_weights(dict_type, zip(range(start, start + len(rows)), weights.tolist()))
+        return updated
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def import_dictionaries(dict_config=None, force=False, db_path=None):
+    """Import every configured dictionary whose stored copy is missing or stale."""
+    dict_config = dict_config or DictionaryConfig()
+    store = SQLiteDictionaryStore(db_path, dict_config)
+    try:
+        for dict_type, dict_info in dict_config.DICTIONARIES.items():
+            source_path = external_path(dict_info["file"])
+            if not os.path.isfile(source_path):
+                print(f"Skipping {dict_type}: {source_path} not found")
+                continue
+            if not force and store.open_if_fresh(dict_type, source_path) is not None:
+                print(f"{dict_type}: store is up to date")
+                continue
+            rows = store.import_dictionary(dict_type)
+            print(f"{dict_type}: imported {rows} rows -> {store.db_path}")
+    finally:
+        store.close()
+
+
+def reweight_dictionaries(dict_config=None, db_path=None):
+    """Recompute the dynamic weights of every imported dictionary in place."""
+    store = SQLiteDictionaryStore(db_path, dict_config)
+    try:
+        for dict_type in store.dict_config.DICTIONARIES:
+            print(f"{dict_type}: updated {store.reweight(dict_type)} weights")
+    finally:
+        store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import dictionaries into the SQLite store")
+    parser.add_argument("--force", action="store_true", help="Re-import even if the stored copy is fresh")
+    parser.add_argument("--reweight", action="store_true", help="Recompute dynamic weights in place")
+    args = parser.parse_args()
+    if args.reweight:
+        reweight_dictionaries()
+    else:
+        import_dictionaries(force=args.force)
+
+
+if __name__ == "__main__":
+    main()
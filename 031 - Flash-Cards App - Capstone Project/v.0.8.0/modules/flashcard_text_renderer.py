@@ -6,8 +6,11 @@ Uses single config instance pattern.
 """
 
 import re
+from collections import OrderedDict
 from tkinter import font
-from .flashcard_config import UIConfig, TextRenderConfig
+from .flashcard_config import UIConfig, TextRenderConfig, DictionaryConfig, external_path
+from .flashcard_glyph_widths import BoundaryMeasurer, GlyphWidthTable
+from .flashcard_hyphenation import HyphenationCache
 
 # Try to import pyphen for proper German hyphenation
 try:
@@ -20,16 +23,97 @@ except ImportError:
     HYPHEN_DE = None
     HYPHEN_EN = None
 
+_HYPHENATION_CACHES = {}  # cache file -> HyphenationCache
+
+
+def hyphenation_cache(cache_file=DictionaryConfig.HYPHENATION_CACHE_FILE):
+    """
+    The German break-point cache backed by `cache_file`, or an in-memory one for None.
+    One instance per file, so batches primed by the loader are what the renderer reads.
+    None without pyphen.
+    """
+    if not PYPHEN_AVAILABLE:
+        return None
+    cache = _HYPHENATION_CACHES.get(cache_file)
+    if cache is None:
+        cache_path = external_path(cache_file) if cache_file else None
+        cache = _HYPHENATION_CACHES.setdefault(cache_file, HyphenationCache(HYPHEN_DE, "de_DE", cache_path))
+    return cache
+
+
+# Break points are looked up here instead of running pyphen while a card is displayed
+HYPHENATION_DE = hyphenation_cache()
+
+
+def detect_language(text):
+    """One-time language guess for untagged text: "de" or "und" (undetermined)."""
+    return "de" if TextRenderer._is_german_text(text) else "und"
+
+
+class TextLayout:
+    """Wrapped lines of one text block with their canvas positions, ready to draw."""
+
+    __slots__ = ("font", "lines", "x", "ys", "error")
+
+    def __init__(self, font_obj=None, lines=(), x=0, ys=(), error=None):
+        self.font = font_obj  # Pooled Tk font, see FontPool
+        self.lines = lines
+        self.x = x
+        self.ys = ys
+        self.error = error
+
+
+class FontPool:
+    """
+    Shared tkinter fonts keyed by (family, size, weight).
+    Every font.Font creates a named Tcl font, so fonts are reused instead of created per render.
+    """
+
+    def __init__(self):
+        self._fonts = {}
+
+    def get(self, family, size, weight="normal"):
+        key = (family, int(size), weight)
+        font_obj = self._fonts.get(key)
+        if font_obj is None:
+            font_obj = font.Font(family=family, size=int(size), weight=weight)
+            self._fonts[key] = font_obj
+        return font_obj
+
+    @property
+    def size(self):
+        """Number of distinct fonts in the pool."""
+        return len(self._fonts)
+
+    def __len__(self):
+        return len(self._fonts)
+
+    def clear(self):
+        self._fonts.clear()
+
 
 class TextRenderer:
     """Renders text using pre-calculated font size and the canonical wrapping algorithm."""
 
-    def __init__(self, ui_config=None):
+    def __init__(self, ui_config=None, font_pool=None, hyphenation=None):
         # Use single config instance
         self.ui_config = ui_config or UIConfig
         self.text_config = TextRenderConfig
+        self.font_pool = font_pool or FontPool()
+
+        # German break points (HyphenationCache); None without pyphen
+        self.hyphenation = hyphenation if hyphenation is not None else HYPHENATION_DE
+
+        # LRU cache: (text, family, size, weight, wrap width) -> wrapped lines
+        self._wrap_cache = OrderedDict()
+        self.wrap_cache_hits = 0
+        self.wrap_cache_misses = 0
 
-    def _is_german_text(self, text):
+        # (family, size, weight) -> GlyphWidthTable
+        self._glyph_tables = {}
+
+    @staticmethod
+    def _is_german_text(text):
         """Detect if text is likely German based on character patterns."""
         if not isinstance(text, str):
             return False
@@ -64,31 +148,30 @@ class TextRenderer:
         return current_part
 
     def _split_word_with_pyphen(self, word, max_width, font_obj, hyphenator):
-        """Split a word using pyphen library for proper hyphenation."""
-        if not hyphenator:
+        """
+        Split a word using pyphen break points (a pyphen.Pyphen or a HyphenationCache).
+        The break points of the whole word are looked up once; each following piece
+        uses those behind the part already split off.
+        """
+        if hyphenator is None:
             return [word]
 
-        pairs = hyphenator.iterate(word)
+        # Break positions, last break first, so each piece is the longest that fits
+        positions = sorted((len(left) for left, _ in hyphenator.iterate(word)), reverse=True)
         result = []
-        current_part = ""
+        start = 0
 
-        for left, right in pairs:
-            test_part = left + "-"
-            if font_obj.measure(test_part) <= max_width:
-                current_part = left
-            else:
-                if current_part:
-                    result.append(current_part + "-")
-                    current_part = ""
+        while True:
+            if start and font_obj.measure(word[start:]) <= max_width:
+                result.append(word[start:])
                 break
-
-        if current_part:
-            result.append(current_part + "-")
-            remaining = word[len(current_part):]
-            if remaining:
-                result.extend(self._split_word_with_pyphen(remaining, max_width, font_obj, hyphenator))
-        else:
-            result.append(word)
+            end = next((position for position in positions
+                        if position > start and font_obj.measure(word[start:position] + "-") <= max_width), None)
+            if end is None:
+                result.append(word[start:])
+                break
+            result.append(word[start:end] + "-")
+            start = end
 
         return result if len(result) > 1 else [word]
 
@@ -97,8 +180,8 @@ class TextRenderer:
         if font_obj.measure(word) <= max_width:
             return [word]
 
-        if PYPHEN_AVAILABLE and HYPHEN_DE:
-            return self._split_word_with_pyphen(word, max_width, font_obj, HYPHEN_DE)
+        if PYPHEN_AVAILABLE and self.hyphenation is not None:
+            return self._split_word_with_pyphen(word, max_width, font_obj, self.hyphenation)
 
         vowels = 'aeiouäöüAEIOUÄÖÜ'
         result = []
@@ -209,7 +292,59 @@ class TextRenderer:
         if current_line:
             final_lines.append(current_line)
 
-    def wrap_text(self, text, wrap_width, font_obj):
+    def wrap_text_cached(self, text, wrap_width, font_obj, font_key=None, language=None):
+        """
+        wrap_text with a bounded LRU cache, so flipping a card or showing it again
+        does not re-wrap the same text. `font_key` is (family, size, weight); it is
+        read from the font when not given.
+        """
+        if font_key is None:
+            actual = font_obj.actual()
+            font_key = (actual["family"], actual["size"], actual["weight"])
+
+        max_size = self.text_config.WRAP_CACHE_SIZE
+        if max_size <= 0:
+            return self.wrap_text(text, wrap_width, self._measurer(font_obj, font_key, wrap_width), language)
+
+        key = (text, *font_key, wrap_width, language)
+
+        lines = self._wrap_cache.get(key)
+        if lines is not None:
+            self._wrap_cache.move_to_end(key)
+            self.wrap_cache_hits += 1
+            return list(lines)
+
+        self.wrap_cache_misses += 1
+        lines = self.wrap_text(text, wrap_width, self._measurer(font_obj, font_key, wrap_width), language)
+        self._wrap_cache[key] = tuple(lines)
+        if len(self._wrap_cache) > max_size:
+            self._wrap_cache.popitem(last=False)
+        return lines
+
+    def _measurer(self, font_obj, font_key, wrap_width):
+        """
+        What wrap_text measures with: the font itself, or a glyph-width table for the
+        font that only falls back to font.measure near the wrap boundary.
+        """
+        if not self.text_config.USE_GLYPH_WIDTH_TABLE:
+            return font_obj
+        table = self._glyph_tables.get(font_key)
+        if table is None:
+            table = GlyphWidthTable(font_obj.measure)
+            self._glyph_tables[font_key] = table
+        return BoundaryMeasurer(table, font_obj, wrap_width, self.text_config.GLYPH_WIDTH_TOLERANCE)
+
+    def wrap_cache_stats(self):
+        """Hit/miss counters and current size of the wrap cache."""
+        lookups = self.wrap_cache_hits + self.wrap_cache_misses
+        return {
+            "hits": self.wrap_cache_hits,
+            "misses": self.wrap_cache_misses,
+            "hit_rate": round(self.wrap_cache_hits / lookups, 3) if lookups else 0.0,
+            "size": len(self._wrap_cache),
+        }
+
+    def wrap_text(self, text, wrap_width, font_obj, language=None):
         """
         CANONICAL text wrapping function - IDENTICAL to preprocessing.
         Respects:
@@ -218,11 +353,13 @@ class TextRenderer:
         3. Words with ')' cannot be split
         4. German hyphenation rules for word splitting
         5. Non-breakable spaces
+
+        `language` is the entry's load-time tag; only untagged text (e.g. API data) is detected here.
         """
         final_lines = []
 
         text = text.replace(TextRenderConfig.NON_BREAKABLE_SPACE_SYMBOL, "\u00A0")
-        is_german = self._is_german_text(text)
+        is_german = language == "de" if language is not None else self._is_german_text(text)
 
         text = re.sub(r'\s*\(\s*', ' (', text)
         text = re.sub(r'\s*\)', ')', text)
@@ -236,18 +373,13 @@ class TextRenderer:
 
         return [line.replace("\u00A0", " ") for line in final_lines]
 
-    def render_precalculated_text(self, canvas, text, frame_coords, render_constants):
+    def layout_text(self, text, frame_coords, render_constants, language=None):
         """
-        Renders text using pre-calculated font size and the SAME wrapping algorithm.
-
-        Args:
-            canvas: The tkinter canvas to draw on.
-            text: The text string to render.
-            frame_coords: A tuple (x_center, y_center, width, height) defining the frame.
-            render_constants: A tuple (font_size, chars_per_line, num_lines).
+        Compute font, wrapped lines and line positions without touching a canvas,
+        so layouts can be prepared ahead of time. Returns None for empty text.
         """
         if not text or not isinstance(text, str):
-            return
+            return None
 
         font_size, _, _ = render_constants
 
@@ -258,28 +390,34 @@ class TextRenderer:
             font_size = int(self.ui_config.BASE_FONT_SIZE * multiplier)
 
         if not isinstance(font_size, (int, float)) or font_size <= 0:
-            canvas.create_text(frame_coords[0], frame_coords[1],
-                               text="Invalid Render Constants",
-                               font=("Arial", 12), fill="red")
-            return
+            return TextLayout(error="Invalid Render Constants")
 
-        # Create the font object with the pre-calculated size
-        font_obj = font.Font(
-            family=self.ui_config.FONT_FAMILY,
-            size=int(font_size),
-            weight=self.ui_config.FONT_WEIGHT_BOLD
-        )
+        # Get the shared font object for the pre-calculated size
+        font_key = (self.ui_config.FONT_FAMILY, int(font_size), self.ui_config.FONT_WEIGHT_BOLD)
+        font_obj = self.font_pool.get(*font_key)
 
         # Use the SAME wrapping algorithm as preprocessing
         frame_x, frame_y, frame_width, _ = frame_coords
-        lines = self.wrap_text(text, frame_width, font_obj)
+        lines = self.wrap_text_cached(text, frame_width, font_obj, font_key, language)
 
         # Calculate positioning
         line_height = font_size + self.ui_config.LINE_HEIGHT_OFFSET
         total_text_height = len(lines) * line_height
         start_y = frame_y - (total_text_height / 2) + (line_height / 2)
 
+        return TextLayout(font_obj, lines, frame_x, [start_y + (i * line_height) for i in range(len(lines))])
+
+    def draw_layout(self, canvas, layout, frame_coords):
+        """Draw a layout computed by layout_text."""
+        if layout is None:
+            return
+
+        if layout.error:
+            canvas.create_text(frame_coords[0], frame_coords[1],
+                               text=layout.error,
+                               font=("Arial", 12), fill="red")
+            return
+
         # Render the final lines
-        for i, line in enumerate(lines):
-            line_y = start_y + (i * line_height)
-            canvas.create_text(frame_x, line_y, text=line, font=font_obj, anchor="center")
\ No newline at end of file
+        for line, line_y in zip(layout.lines, layout.ys):
+            canvas.create_text(layout.x, line_y, text=line, font=layout.font, anchor="center")
@@ -0,0 +1,57 @@
+"""
+Column-wise dynamic weight engine for the Flashcard Application.
+Computes content-complexity weights for a whole batch with vectorized string
+operations instead of a per-row Python closure.
+"""
+
+import re
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from .flashcard_config import WeightingConfig
+
+
+@lru_cache(maxsize=None)
+def _alternation(indicators):
+    """Compile (once per indicator tuple) a literal alternation pattern."""
+    return re.compile("|".join(re.escape(indicator) for indicator in indicators))
+
+
+@lru_cache(maxsize=None)
+def _more_words_than(threshold):
+    """Anchored pattern that matches once a text has more than `threshold` str.split() tokens."""
+    return re.compile(r"\s*(?:\S+\s+){%d}\S" % threshold)
+
+
+def compute_dynamic_weights(texts: pd.Series, config=WeightingConfig) -> pd.Series:
+    """
+    Compute dynamic weights for a Series of definition texts.
+
+    Non-string values are weighted by their str() form, matching how the
+    per-row implementation treated them. Returns an int64 Series aligned with
+    the input index.
+    """
+    # Object dtype keeps Python regex semantics regardless of pandas' string backend
+    text = texts.astype(object).where(texts.notna(), "nan").astype(str).astype(object)
+
+    char_count = text.str.len()
+
+    weight = pd.Series(config.BASE_WEIGHT, index=text.index, dtype="int64")
+    for threshold, bonus in config.CHAR_COUNT_BONUSES:
+        weight += (char_count > threshold).astype("int64") * bonus
+
+    # Word thresholds stop scanning after threshold + 1 words instead of counting
+    # every word. Such a text needs at least 2 * threshold + 1 characters.
+    for threshold, bonus in config.WORD_COUNT_BONUSES:
+        candidates = (char_count > 2 * threshold).to_numpy()
+        if candidates.any():
+            has_more = np.zeros(len(text), dtype="int64")
+            has_more[candidates] = text[candidates].str.match(_more_words_than(threshold)).to_numpy(dtype=bool)
+            weight += has_more * bonus
+
+    paragraph_pattern = _alternation(tuple(config.PARAGRAPH_INDICATORS))
+    legal_terms_pattern = _alternation(tuple(config.LEGAL_TERMS))
+    weight += text.str.contains(paragraph_pattern, regex=True).astype("int64") * config.PARAGRAPH_BONUS
+    weight += text.str.contains(legal_terms_pattern, regex=True).astype("int64") * config.LEGAL_TERMS_BONUS
+
+    return weight
@@ -6,15 +6,21 @@ Uses modular components following DRY and SOLID principles.
 """
 
 import os
+import queue
+import time
 import webbrowser
 import threading
 import tkinter as tk
+from collections import deque
 from . import card_logic, statistics
-from .flashcard_config import UIConfig, DictionaryConfig, DisplayConfig, APIConfig, ProgressiveLoadingConfig, resource_path
+from .flashcard_config import UIConfig, DictionaryConfig, DisplayConfig, APIConfig, ProgressiveLoadingConfig, StatisticsConfig, SchedulerConfig, resource_path
 from .flashcard_text_renderer import TextRenderer
 from .flashcard_dictionary_manager import DictionaryManager
 from .flashcard_checkbox_factory import CheckboxFactory
+from .flashcard_card_store import CardRecord, records_from_mappings
 from .flashcard_card_display import CardDisplay
+from .flashcard_review_log import ReviewLog
+from .flashcard_scheduler import SpacedRepetitionScheduler
 from .flashcard_timer_manager import TimerManager
 from .tracing import tracer
 
@@ -37,13 +43,17 @@ class FlashcardApp:
         self.text_renderer = TextRenderer()
         self.dictionary_manager = DictionaryManager(
             config=self.dict_config,
-            loading_config=self.loading_config
+            loading_config=self.loading_config,
+            hyphenation=self.text_renderer.hyphenation
         )
         self.checkbox_factory = CheckboxFactory()
         self.timer_manager = TimerManager()
+        self.review_log = ReviewLog() if StatisticsConfig.REVIEW_LOG_ENABLED else None
+        self.scheduler = SpacedRepetitionScheduler() if SchedulerConfig.ENABLED else None
+        self.dictionary_manager.set_scheduler(self.scheduler)
 
         # Application state
-        self.data = data or []
+        self.data = card_logic.CompositePool.from_entries(data or [])
         self.fetch_api_word_pairs_func = fetch_api_word_pairs_func
         self.source_language = source_language or self.api_config.DEFAULT_SOURCE_LANGUAGE
         self.target_language = target_language or self.api_config.DEFAULT_TARGET_LANGUAGE
@@ -52,6 +62,15 @@ class FlashcardApp:
         self.known_count = 0
         self.click_times = []
         self.current_card = None
+        self.current_layout = None
+        self.prefetched = deque()  # (card, CardLayout) sampled and laid out during idle time
+        self.prefetch_scheduled = False
+        self.paint_latencies = []  # Click-to-paint times in ms
+        self.activation_generation = 0  # Incremented per toggle; stale activation results are dropped
+        self.loaded_results = queue.Queue()  # (generation, selected_types, entries) posted by the loader worker
+        self.activation_task = None  # LoaderTask of the latest toggle, polled from the main thread
+        self.load_poll_scheduled = False
+        self.selected_types = []
 
         # Initialize GUI
         self._setup_window()
@@ -255,33 +274,90 @@ class FlashcardApp:
         if self.custom_var.get():
             selected_types.append("custom")
 
-        # Load dictionaries using the dictionary manager
+        self.selected_types = selected_types
+
+        # Update help label based on selection
+        self._update_help_label()
+
+        # Keep showing what is already in memory while new dictionaries load in the background
+        self.activation_generation += 1
+        self.prefetched.clear()
+        self.data = card_logic.CompositePool.from_entries(
+            self.dictionary_manager.get_loaded_entries(selected_types), self.dict_config.WEIGHT_COLUMN
+        )
+        if self.data:
+            self.next_card()
+        elif selected_types:
+            self._show_message(self.ui_config.LOADING_MESSAGE, "gray")
+        else:
+            self._show_no_data_message()
+
+        generation = self.activation_generation
         try:
-            self.data = self.dictionary_manager.load_selected_dictionaries(selected_types)
-            tracer.ic({"gui_loaded_entries": len(self.data), "selected_types": selected_types})
-            print(f"GUI: Loaded {len(self.data)} entries for: {selected_types}")
-
-            # Show entry distribution
-            if self.data:
-                # Count entries per dictionary type
-                type_counts = {}
-                for entry in self.data:
-                    source = entry.get('source', 'unknown')
-                    type_counts[source] = type_counts.get(source, 0) + 1
-                tracer.ic({"type_counts": type_counts})
-                print(f"Loaded {len(self.data)} entries: {type_counts}")
+            self.activation_task = self.dictionary_manager.load_selected_dictionaries_async(
+                selected_types,
+                lambda entries: self._dictionaries_loaded_threaded(generation, selected_types, entries),
+            )
         except Exception as e:
             tracer.ic({"gui_load_error": str(e)})
             print(f"Error loading dictionaries: {e}")
             return
+        self._schedule_load_poll()
+
+    def _dictionaries_loaded_threaded(self, generation, selected_types, entries):
+        """
+        Hand entries loaded on the loader worker to the main thread (worker thread).
+        Only a queue is touched here - Tk calls from this thread could block on a main
+        thread that is itself waiting for the worker, e.g. while closing.
+        """
+        self.loaded_results.put((generation, selected_types, entries))
+
+    def _schedule_load_poll(self):
+        """Check for loaded dictionaries every LOAD_POLL_INTERVAL ms until the latest toggle finished."""
+        if not self.load_poll_scheduled:
+            self.load_poll_scheduled = True
+            self.window.after(self.ui_config.LOAD_POLL_INTERVAL, self._poll_loaded_results)
+
+    def _poll_loaded_results(self):
+        """Apply activation results posted by the loader worker (runs on the main thread)."""
+        self.load_poll_scheduled = False
+        task = self.activation_task
+        finished = task is None or task.done.is_set()  # Checked first: a finished task has posted its result
+        while True:
+            try:
+                result = self.loaded_results.get_nowait()
+            except queue.Empty:
+                break
+            self._on_dictionaries_loaded(*result)
+
+        if not finished:
+            self._schedule_load_poll()
+        elif task is not None and task.error is not None:
+            tracer.ic({"gui_load_error": str(task.error)})
+            if not self.data:
+                self._show_no_data_message()
 
-        # Update help label based on selection
-        self._update_help_label()
+    def _on_dictionaries_loaded(self, generation, selected_types, entries):
+        """Merge freshly activated dictionaries into the pool (runs on the main thread)."""
+        if generation != self.activation_generation:
+            return  # Superseded by a newer toggle
 
-        # Move to next card only if we have data
+        had_data = bool(self.data)
+        self.prefetched.clear()
+        self.data = card_logic.CompositePool.from_entries(entries, self.dict_config.WEIGHT_COLUMN)
+        tracer.ic({"gui_loaded_entries": len(self.data), "selected_types": selected_types})
+        print(f"GUI: Loaded {len(self.data)} entries for: {selected_types}")
+
+        # Show entry distribution
         if self.data:
+            type_counts = self.dictionary_manager.get_source_counts(selected_types)
+            tracer.ic({"type_counts": type_counts})
+            print(f"Loaded {len(self.data)} entries: {type_counts}")
+
+        # Only move on if the placeholder is showing - don't replace a card the user is reading
+        if self.data and not had_data:
             self.next_card()
-        else:
+        elif not self.data:
             self._show_no_data_message()
 
     def _update_help_label(self):
@@ -297,18 +373,16 @@ class FlashcardApp:
 
     def _show_no_data_message(self):
         """Show message when no dictionaries are selected."""
-        self.canvas.delete("all")
-        self.canvas.create_text(
-            self.ui_config.CARD_CENTER_X,
-            self.ui_config.CARD_CENTER_Y,
-            text=self.ui_config.NO_DATA_MESSAGE,
-            font=(self.ui_config.FONT_FAMILY, 24),
-            fill="red"
-        )
+        self._show_message(self.ui_config.NO_DATA_MESSAGE, "red")
+
+    def _show_message(self, text, color):
+        """Show a centered message instead of a card."""
+        self.card_display.show_message(text, (self.ui_config.FONT_FAMILY, 24), color)
 
     def _standardize_card_keys(self, card):
         """Standardize dictionary-specific column names to generic display keys."""
-        if not card:
+        if not card or isinstance(card, CardRecord):
+            # Card records resolve the generic display keys on access
             return card
 
         # FIX: Map custom CSV keys (Word_1, Part_1, etc.) to generic keys
@@ -330,20 +404,31 @@ class FlashcardApp:
             self._show_no_data_message()
             return
         if self.card_side == "front":
-            self.card_display.show_front(self.current_card)
+            self.card_display.show_front(self.current_card, self.current_layout)
             self.help_label.config(bg=self.ui_config.FRONTSIDE_COLOR)
         else:
-            self.card_display.show_back(self.current_card)
+            self.card_display.show_back(self.current_card, self.current_layout)
             self.help_label.config(bg=self.ui_config.BACKSIDE_COLOR)
 
-    def next_card(self):
-        """Move to the next card."""
+    def next_card(self, click_time=None):
+        """
+        Move to the next card: a card that is due for review first, otherwise one
+        from the prefetch queue or a fresh weighted sample.
+        """
         try:
-            self.current_card = card_logic.weighted_choice(self.data)
+            due_card = self._next_due_card()
+            if due_card is not None:
+                self.current_card, self.current_layout = due_card, None
+            elif self.prefetched:
+                self.current_card, self.current_layout = self.prefetched.popleft()
+            else:
+                self.current_card, self.current_layout = self.data.sample(), None
 
             if self.current_card:
                 # FIX: Standardize the keys before display
                 self.current_card = self._standardize_card_keys(self.current_card)
+                if self.current_layout is None:
+                    self.current_layout = self.card_display.prepare(self.current_card)
 
                 # The tracer line confirms Word_1 is being accessed successfully
                 tracer.ic({
@@ -357,6 +442,7 @@ class FlashcardApp:
                 self.card_side = "front"
                 self.display_card()
                 self.timer_manager.start_timer()  # Start the timer for the new card
+                self.window.after_idle(self._after_paint, click_time)
             else:
                 self._show_no_data_message()
         except Exception as e:
@@ -369,9 +455,15 @@ class FlashcardApp:
             self._show_no_data_message()
             return
 
+        click_time = time.perf_counter()
+
         # Stop timer and record reaction time
         reaction_time = self.timer_manager.stop_timer()
         self.click_times.append(reaction_time)
+        self.dictionary_manager.record_review(self.current_card, known=False)
+        if self.review_log:
+            self.review_log.record(self.current_card, False, reaction_time)
+        self._reschedule(self.current_card, False, reaction_time)
 
         # Update statistics
         self.unknown_count += 1
@@ -379,6 +471,7 @@ class FlashcardApp:
 
         self.card_side = "back"
         self.display_card()
+        self.window.after_idle(self._after_paint, click_time)
 
     def mark_known(self):
         """Mark current card as known and go to next."""
@@ -386,15 +479,86 @@ class FlashcardApp:
             self._show_no_data_message()
             return
 
+        click_time = time.perf_counter()
+
         # Stop timer and record reaction time
         reaction_time = self.timer_manager.stop_timer()
         self.click_times.append(reaction_time)
+        self.dictionary_manager.record_review(self.current_card, known=True)
+        if self.review_log:
+            self.review_log.record(self.current_card, True, reaction_time)
+        self._reschedule(self.current_card, True, reaction_time)
 
         # Update statistics
         self.known_count += 1
         self.known_label.config(text=f"{self.known_count}")
 
-        self.next_card()
+        self.next_card(click_time)
+
+    def _next_due_card(self):
+        """Pop the loaded card that has been due the longest from the scheduler's queue, if any."""
+        if not self.scheduler or not self.data:
+            return None
+        return self.scheduler.next_due(accept=self._is_selected_card)
+
+    def _is_selected_card(self, card):
+        return self.dictionary_manager.is_entry_loaded(card, self.selected_types)
+
+    def _reschedule(self, card, known, reaction_time):
+        """
+        Feed the first answer to a card into the scheduler and hand the new weight to the
+        pool and, with the SQLite backend, to the dictionary store.
+        "Known" on the back side only moves on after an "unknown", so it is not graded again.
+        """
+        if not self.scheduler or self.card_side != "front":
+            return
+        try:
+            weight = self.scheduler.review(card, known, reaction_time)
+            self.data.update_weight(card, weight)
+            self.dictionary_manager.store_weight(card, weight)
+        except Exception as e:
+            tracer.ic({"reschedule_error": str(e)})
+
+    def _after_paint(self, click_time=None):
+        """
+        Idle callback queued after a card was drawn: Tk has repainted the canvas by now.
+        Records the click-to-paint latency and then refills the prefetch queue.
+        """
+        if click_time is not None:
+            self.paint_latencies.append((time.perf_counter() - click_time) * 1000)
+        self._schedule_prefetch()
+
+    def _schedule_prefetch(self):
+        """Prepare one more card in the next idle slot until PREFETCH_CARDS are ready."""
+        if self.prefetch_scheduled or len(self.prefetched) >= self.ui_config.PREFETCH_CARDS:
+            return
+        self.prefetch_scheduled = True
+        self.window.after_idle(self._prefetch_card)
+
+    def _prefetch_card(self):
+        """Sample a card and compute its front and back layout (runs when Tk is idle)."""
+        self.prefetch_scheduled = False
+        if not self.data or len(self.prefetched) >= self.ui_config.PREFETCH_CARDS:
+            return
+        try:
+            card = self._standardize_card_keys(self.data.sample())
+            if card:
+                self.prefetched.append((card, self.card_display.prepare(card)))
+        except Exception as e:
+            tracer.ic({"prefetch_error": str(e)})
+            return
+        self._schedule_prefetch()
+
+    def get_paint_latency_stats(self):
+        """p50/p99 click-to-paint latency in ms over this session."""
+        samples = sorted(self.paint_latencies)
+        if not samples:
+            return {"clicks": 0}
+
+        def percentile(q):
+            return round(samples[min(len(samples) - 1, int(q * len(samples)))], 1)
+
+        return {"clicks": len(samples), "p50_ms": percentile(0.50), "p99_ms": percentile(0.99)}
 
     def open_help(self, event=None):
         """Open help file in default browser."""
@@ -444,10 +608,11 @@ class FlashcardApp:
 
     def _update_data(self, api_data):
         """Add new API data to application data."""
-        for entry in api_data:
+        api_records = records_from_mappings(api_data)
+        for entry in api_records:
             if self.dict_config.WEIGHT_COLUMN not in entry:
                 entry[self.dict_config.WEIGHT_COLUMN] = self.dict_config.DEFAULT_WEIGHT
-        self.data.extend(api_data)
+        self.data.extend(api_records)
         print("API data added.")
         # Don't call next_card() automatically - let user control the flow
 
@@ -458,6 +623,24 @@ class FlashcardApp:
             statistics.save_statistics(self.click_times, self.known_count, self.unknown_count)
         except Exception as e:
             print(f"Error saving statistics: {e}")
+
+        # Write buffered review events and scheduler state
+        if self.review_log:
+            try:
+                self.review_log.close()
+            except Exception as e:
+                print(f"Error closing review log: {e}")
+        if self.scheduler:
+            try:
+                self.scheduler.close()
+            except Exception as e:
+                print(f"Error closing scheduler: {e}")
+
+        latency = self.get_paint_latency_stats()
+        tracer.ic({"paint_latency": latency, "wrap_cache": self.text_renderer.wrap_cache_stats()})
+        if latency["clicks"]:
+            print(f"Click-to-paint latency: p50 {latency['p50_ms']} ms, p99 {latency['p99_ms']} ms "
+                  f"over {latency['clicks']} clicks")
         
         # Stop progressive loading
         try:
@@ -465,6 +648,10 @@ class FlashcardApp:
             self.dictionary_manager.cleanup()
         except Exception as e:
             print(f"Error cleaning up progressive loading: {e}")
+
+        # Persist the break points cached this session
+        if self.text_renderer.hyphenation is not None:
+            self.text_renderer.hyphenation.save()
         
         # Close the window
         self.window.destroy()
@@ -0,0 +1,278 @@
+"""
+Offline render-constant fitting for the Flashcard Application.
+For every row of every dictionary, binary-searches the largest font size whose
+wrapped text fits UIConfig.TEXT_FRAME_FRONT / TEXT_FRAME_BACK and writes the
+result as "font_size,chars_per_line,num_lines" into the Text_constants_front
+and Text_constants_back columns, so the app never has to guess at runtime.
+
+Text is measured without Tk (Pillow if a font file is available, otherwise
+AFM-style Helvetica-Bold widths, which match Arial closely), so rows can be
+fitted in a process pool. Wrapping uses the app's own TextRenderer.wrap_text.
+
+Usage:
+    python -m modules.preprocess_dictionaries                   # all dictionaries
+    python -m modules.preprocess_dictionaries --dict custom     # one dictionary
+    python -m modules.preprocess_dictionaries --missing-only --workers 4
+"""
+
+import argparse
+import csv
+import os
+import shutil
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from .flashcard_config import DictionaryConfig, PreprocessConfig, UIConfig, external_path
+from .flashcard_glyph_widths import GlyphWidthTable
+from .flashcard_text_renderer import TextRenderer
+
+# render constant column -> (text column, frame, dictionary language key)
+CONSTANT_COLUMNS = {
+    "Text_constants_front": (DictionaryConfig.WORD_1_COLUMN, UIConfig.TEXT_FRAME_FRONT, "front_language"),
+    "Text_constants_back": (DictionaryConfig.WORD_2_COLUMN, UIConfig.TEXT_FRAME_BACK, "back_language"),
+}
+
+# The dictionaries are rewritten, so unlike the app's loader (CSV_KWARGS) no row
+# may be skipped and backslashes are kept as they are
+REWRITE_CSV_KWARGS = dict(engine='python', quotechar='"', dtype=str, keep_default_na=False)
+
+# Helvetica-Bold advance widths (1/1000 em) for printable ASCII, from the Adobe AFM
+_AFM_WIDTHS = dict(zip(
+    " !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~",
+    [278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+     556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+     975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+     667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+     333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+     611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584],
+))
+_AFM_SPECIAL = {"ß": 611, "„": 500, "“": 500, "”": 500, "‚": 278, "‘": 278, "’": 278,
+                "–": 556, "—": 1000, "§": 556, "…": 1000, "«": 556, "»": 556, " ": 278}
+
+
+def _afm_char_width(char):
+    """Width of one character in 1/1000 em; accented letters use their base letter."""
+    width = _AFM_WIDTHS.get(char) or _AFM_SPECIAL.get(char)
+    if width:
+        return width
+    base = unicodedata.normalize("NFD", char)[:1]
+    if base in _AFM_WIDTHS:
+        return _AFM_WIDTHS[base]
+    if char.isalpha():  # Cyrillic and other scripts: average bold letter widths
+        return 722 if char.isupper() else 611
+    return 556
+
+
+class AfmMeasure:
+    """Tk-free text measurement from built-in AFM widths; measure() returns pixels like tkinter.font.Font."""
+
+    def __init__(self, size, pixels_per_point=PreprocessConfig.PIXELS_PER_POINT):
+        self._scale = size * pixels_per_point / 1000
+        self._table = GlyphWidthTable(lambda char: _afm_char_width(char) * self._scale)
+
+    def measure(self, text):
+        return round(self._table.width(text))
+
+
+class PillowMeasure:
+    """Tk-free text measurement with a TrueType font through Pillow."""
+
+    def __init__(self, size, font_file, pixels_per_point=PreprocessConfig.PIXELS_PER_POINT):
+        from PIL import ImageFont
+        self._font = ImageFont.truetype(font_file, max(1, round(size * pixels_per_point)))
+
+    def measure(self, text):
+        return round(self._font.getlength(text))
+
+
+def find_font_file(config=PreprocessConfig):
+    """First configured font file Pillow can open, or None (also None without Pillow)."""
+    try:
+        from PIL import ImageFont
+    except ImportError:
+        return None
+    for font_file in config.FONT_FILES:
+        try:
+            ImageFont.truetype(font_file, 12)
+            return font_file
+        except OSError:
+            continue
+    return None
+
+
+class RenderConstantFitter:
+    """Binary-searches the largest font size at which a text fits a frame."""
+
+    def __init__(self, backend="afm", font_file=None, config=PreprocessConfig, ui_config=UIConfig):
+        self.backend = backend
+        self.font_file = font_file
+        self.config = config
+        self.ui_config = ui_config
+        self.renderer = TextRenderer(ui_config)
+        self._measures = {}
+
+    def _measure(self, size):
+        measure = self._measures.get(size)
+        if measure is None:
+            if self.backend == "pillow":
+                measure = PillowMeasure(size, self.font_file, self.config.PIXELS_PER_POINT)
+            else:
+                measure = AfmMeasure(size, self.config.PIXELS_PER_POINT)
+            self._measures[size] = measure
+        return measure
+
+    def _layout(self, text, size, frame, language=None):
+        """Wrapped lines at `size` and whether they fit the frame."""
+        _, _, frame_width, frame_height = frame
+        measure = self._measure(size)
+        lines = self.renderer.wrap_text(text, frame_width, measure, language)
+        line_height = size + self.ui_config.LINE_HEIGHT_OFFSET  # Same spacing as layout_text
+        fits = len(lines) * line_height <= frame_height and all(measure.measure(line) <= frame_width for line in lines)
+        return lines, fits
+
+    def fit(self, text, frame, language=None):
+        """
+        Return "font_size,chars_per_line,num_lines" for `text` in `frame`, or "" for empty text.
+        `language` is the side's configured language, as the app tags it at load time.
+        """
+        if not isinstance(text, str) or not text.strip():
+            return ""
+
+        low, high = self.config.MIN_FONT_SIZE, self.config.MAX_FONT_SIZE
+        best_size, best_lines = low, None
+        while low <= high:
+            size = (low + high) // 2
+            lines, fits = self._layout(text, size, frame, language)
+            if fits:
+                best_size, best_lines = size, lines
+                low = size + 1
+            else:
+                high = size - 1
+
+        if best_lines is None:  # Does not fit even at the minimum size - use it anyway
+            best_lines, _ = self._layout(text, best_size, frame, language)
+        chars_per_line = max((len(line) for line in best_lines), default=0)
+        return f"{best_size},{chars_per_line},{len(best_lines)}"
+
+
+_worker_fitter = None
+
+
+def _init_worker(backend, font_file):
+    global _worker_fitter
+    _worker_fitter = RenderConstantFitter(backend, font_file)
+
+
+def _fit_chunk(rows):
+    """Fit (text, frame, language) rows in a pool worker."""
+    return [_worker_fitter.fit(text, frame, language) for text, frame, language in rows]
+
+
+def resolve_backend(backend, font_file=None, config=PreprocessConfig):
+    """Pick the measurement backend; returns (backend, font_file)."""
+    if backend in ("auto", "pillow"):
+        font_file = font_file or find_font_file(config)
+        if font_file:
+            return "pillow", font_file
+        if backend == "pillow":
+            raise SystemExit("Pillow backend needs Pillow and a font file (see PreprocessConfig.FONT_FILES)")
+    return "afm", None
+
+
+def fit_dataframe(df, backend, font_file, workers=None, missing_only=False, config=PreprocessConfig, dict_info=None):
+    """Fill the Text_constants columns of `df` in place. Returns the number of fitted cells."""
+    dict_info = dict_info or {}
+    jobs = []
+    for column, (text_column, frame, language_key) in CONSTANT_COLUMNS.items():
+        language = dict_info.get(language_key)
+        if text_column not in df.columns:
+            continue
+        if column not in df.columns:
+            df[column] = ""
+        for position, (text, current) in enumerate(zip(df[text_column].tolist(), df[column].tolist())):
+            if missing_only and isinstance(current, str) and current:
+                continue
+            jobs.append((column, position, text, frame, language))
+
+    if not jobs:
+        return 0
+
+    rows = [(text, frame, language) for _, _, text, frame, language in jobs]
+    chunks = [rows[i:i + config.CHUNK_SIZE] for i in range(0, len(rows), config.CHUNK_SIZE)]
+    if workers == 1 or len(chunks) == 1:
+        _init_worker(backend, font_file)
+        results = [_fit_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(backend, font_file)) as pool:
+            results = list(pool.map(_fit_chunk, chunks))
+
+    fitted = [constants for chunk in results for constants in chunk]
+    for column in CONSTANT_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype(object)
+    for (column, position, _, _, _), constants in zip(jobs, fitted):
+        df.iat[position, df.columns.get_loc(column)] = constants
+    return len(fitted)
+
+
+def count_data_rows(path, delimiter):
+    """Number of non-blank CSV records after the header, as the csv module reads them."""
+    with open(path, newline="", encoding="utf-8") as file:
+        return max(0, sum(1 for row in csv.reader(file, delimiter=delimiter, quotechar='"') if row) - 1)
+
+
+def preprocess_dictionaries(dict_types=None, backend=None, font_file=None, workers=None,
+                            missing_only=False, dict_config=None, config=PreprocessConfig):
+    """Fit and write back render constants for the given (default: all) dictionaries."""
+    dict_config = dict_config or DictionaryConfig()
+    backend, font_file = resolve_backend(backend or config.BACKEND, font_file, config)
+    workers = workers or config.WORKERS
+    print(f"Measuring with the {backend} backend" + (f" ({font_file})" if font_file else ""))
+
+    for dict_type in dict_types or dict_config.DICTIONARIES:
+        dict_info = dict_config.DICTIONARIES.get(dict_type)
+        if dict_info is None:
+            print(f"Skipping {dict_type}: unknown dictionary")
+            continue
+        path = external_path(dict_info["file"])
+        if not os.path.isfile(path):
+            print(f"Skipping {dict_type}: {path} not found")
+            continue
+
+        delimiter = dict_info.get("delimiter", ",")
+        try:
+            df = pd.read_csv(path, sep=delimiter, **REWRITE_CSV_KWARGS)
+        except pd.errors.ParserError as e:
+            print(f"Skipping {dict_type}: {path} has malformed rows and is left unchanged ({e})")
+            continue
+        expected_rows = count_data_rows(path, delimiter)
+        if len(df) != expected_rows:
+            print(f"Skipping {dict_type}: parsed {len(df)} of {expected_rows} rows, {path} is left unchanged")
+            continue
+
+        count = fit_dataframe(df, backend, font_file, workers, missing_only, config, dict_info)
+        if not count:
+            print(f"{dict_type}: nothing to fit")
+            continue
+
+        tmp_path = path + ".tmp"
+        df.to_csv(tmp_path, sep=delimiter, index=False)
+        shutil.copy2(path, path + ".bak")
+        os.replace(tmp_path, path)
+        print(f"{dict_type}: fitted {count} render constants in {len(df)} rows -> {path} (original kept as {path}.bak)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-calculate Text_constants render columns for dictionaries")
+    parser.add_argument("--dict", action="append", dest="dict_types", help="Dictionary type (repeatable)")
+    parser.add_argument("--backend", choices=["auto", "pillow", "afm"], help="Text measurement backend")
+    parser.add_argument("--font-file", help="TrueType font for the Pillow backend")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--missing-only", action="store_true", help="Keep render constants that are already set")
+    args = parser.parse_args()
+    preprocess_dictionaries(args.dict_types, args.backend, args.font_file, args.workers, args.missing_only)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,22 @@
 # modules/tests_statistics.py
-import pandas as pd
+"""
+Übungsstatistik: hängt pro Sitzung eine Zeile an data/achievements.csv an.
+
+Usage:
+    python -m modules.statistics --compact    # Datei atomar neu schreiben (kaputte Zeilen entfernen)
+"""
+import argparse
+import csv
+import io
 import os
 from datetime import datetime
+from .flashcard_config import StatisticsConfig
+
+ACHIEVEMENTS_FILE = "data/achievements.csv"
+FIELDNAMES = StatisticsConfig.STATS_COLUMNS
 
 
-def save_statistics(click_times, known_count, unknown_count):
+def save_statistics(click_times, known_count, unknown_count, file_path=ACHIEVEMENTS_FILE):
     current_time = datetime.now()
     date = current_time.strftime("%d.%m.%Y")
     time_str = current_time.strftime("%H:%M:%S")
@@ -23,19 +35,73 @@ def save_statistics(click_times, known_count, unknown_count):
         "Durchschnittliche Reaktionszeit": [f"{avg_reaction_time:.4f}"],
     }
 
-    df = pd.DataFrame(data)
+    try:
+        append_row([data[name][0] for name in FIELDNAMES], file_path)
+    except OSError as e:
+        print(f"Unerwarteter Fehler beim Schreiben der Datei: {e}")
+
+    return data
+
+
+def append_row(row, file_path=ACHIEVEMENTS_FILE):
+    """
+    Hängt eine Zeile an, statt die ganze Datei zu lesen und neu zu schreiben.
+    Der Header wird nur für eine neue oder leere Datei geschrieben; flush + fsync,
+    damit die Zeile nach dem Schließen auch bei einem Absturz auf der Platte ist.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")  # Gleiches Format wie pandas.to_csv
+
+    with open(file_path, "a+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            writer.writerow(FIELDNAMES)
+        else:
+            f.seek(size - 1)
+            if f.read(1) != b"\n":  # Letzte Zeile wurde abgebrochen
+                buffer.write("\n")
+        writer.writerow(row)
+
+        f.write(buffer.getvalue().encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
 
-    file_path = "data/achievements.csv"
-    if not os.path.isfile(file_path) or os.path.getsize(file_path) == 0:
-        df.to_csv(file_path, index=False)
+
+def compact_statistics(file_path=ACHIEVEMENTS_FILE):
+    """
+    Schreibt die Datei atomar neu (temporäre Datei + os.replace): leere und
+    abgebrochene Zeilen werden entfernt, der Header steht genau einmal oben.
+    Gibt die Anzahl der behaltenen Zeilen zurück.
+    """
+    if not os.path.isfile(file_path):
+        return 0
+
+    with open(file_path, newline="", encoding="utf-8") as f:
+        rows = [row for row in csv.reader(f) if len(row) == len(FIELDNAMES) and row != FIELDNAMES]
+
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(FIELDNAMES)
+        writer.writerows(rows)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, file_path)
+    return len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Übungsstatistik verwalten")
+    parser.add_argument("--compact", action="store_true", help="achievements.csv atomar neu schreiben")
+    parser.add_argument("--file", default=ACHIEVEMENTS_FILE, help="Statistikdatei")
+    args = parser.parse_args()
+
+    if args.compact:
+        kept = compact_statistics(args.file)
+        print(f"{args.file}: {kept} Zeilen behalten")
     else:
-        try:
-            existing_df = pd.read_csv(file_path)
-            combined_df = pd.concat([existing_df, df], ignore_index=True)
-            combined_df.to_csv(file_path, index=False)
-        except pd.errors.EmptyDataError:
-            df.to_csv(file_path, index=False)
-        except Exception as e:
-            print(f"Unerwarteter Fehler beim Lesen/Schreiben der Datei: {e}")
+        parser.print_help()
 
-    return data
+
+if __name__ == "__main__":
+    main()